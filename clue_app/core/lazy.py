@@ -0,0 +1,72 @@
+"""
+Lazy Imports for CLUE Financial Forecasting Application
+Keeps the scientific stack (pandas, matplotlib, statsmodels, pmdarima,
+xgboost, reportlab, yfinance) off the startup path.
+- lazy_module(name): proxy that imports the module on first attribute access
+- preload(names): imports modules on a background thread once the window is up
+- Every import made through here is timed in the log
+"""
+
+import importlib
+import sys
+import threading
+import time
+from typing import Iterable
+
+from core.logger import get_logger
+
+
+logger = get_logger("startup")
+
+
+def timed_import(name: str):
+    """import_module also waits for a module another thread is still importing."""
+    fresh = name not in sys.modules
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    if fresh:
+        logger.info("Imported %s in %.0f ms", name, (time.perf_counter() - start) * 1000)
+    return module
+
+
+class LazyModule:
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """True once imported, by this proxy or by anyone else."""
+        return self._module is not None or self._name in sys.modules
+
+    def __getattr__(self, attr: str):
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = timed_import(self._name)
+        return getattr(self._module, attr)
+
+
+# -------------------- GUI FRIENDLY FUNCTIONS --------------------
+
+def lazy_module(name: str) -> LazyModule:
+    return LazyModule(name)
+
+
+def preload(names: Iterable[str]) -> threading.Thread:
+    """Warms the import cache in the background; failures are logged, not raised."""
+    names = list(names)
+
+    def run():
+        start = time.perf_counter()
+        for name in names:
+            try:
+                timed_import(name)
+            except Exception as exc:
+                logger.warning("Background import of %s failed: %s", name, exc)
+        logger.info("Background preload finished in %.0f ms", (time.perf_counter() - start) * 1000)
+
+    thread = threading.Thread(target=run, name="clue-preload", daemon=True)
+    thread.start()
+    return thread
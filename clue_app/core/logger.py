@@ -0,0 +1,24 @@
+"""
+Logger for CLUE Financial Forecasting Application
+Single file logger (logs/app.log) shared by all modules.
+"""
+
+import logging
+from pathlib import Path
+
+LOG_FILE = Path(__file__).resolve().parent.parent / "logs" / "app.log"
+LOG_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Returns a child of the 'clue' logger, configuring the file handler once."""
+    root = logging.getLogger("clue")
+
+    if not root.handlers:
+        LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+        handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        root.addHandler(handler)
+        root.setLevel(logging.INFO)
+
+    return root.getChild(name)
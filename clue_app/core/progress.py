@@ -0,0 +1,32 @@
+"""
+Progress Protocol for CLUE Financial Forecasting Application
+Long-running steps take an optional `progress(fraction, message)` callback.
+- fraction is in [0, 1], or None when the step cannot tell
+- The callback may raise OperationCancelled; the step stops at its next report
+- scaled() maps a nested step onto a sub-range of its caller's progress
+"""
+
+from typing import Callable, Optional
+
+
+ProgressCallback = Callable[[Optional[float], str], None]
+
+
+class OperationCancelled(Exception):
+    """Raised through a progress callback when the caller no longer wants the result."""
+
+
+def report(progress: Optional[ProgressCallback], fraction: Optional[float], message: str = ""):
+    if progress is not None:
+        progress(fraction, message)
+
+
+def scaled(progress: Optional[ProgressCallback], start: float, end: float) -> Optional[ProgressCallback]:
+    """Callback for a sub-step whose own 0..1 range covers [start, end] of the parent."""
+    if progress is None:
+        return None
+
+    def inner(fraction: Optional[float], message: str = ""):
+        progress(None if fraction is None else start + (end - start) * fraction, message)
+
+    return inner
@@ -0,0 +1,390 @@
+"""
+Session Bundles for CLUE Financial Forecasting Application
+Saves a whole session (data, fitted models, results, UI state) to one file
+and opens it again without retraining.
+- A bundle is a zip archive with a JSON content manifest (manifest.json)
+- Data columns and the date index are stored uncompressed and aligned, so
+  loading memory-maps them in place instead of reading the file
+- Results and UI state are JSON; the arrays inside results (forecasts,
+  intervals) are stored next to them as raw arrays, like the data columns
+- Fitted models are pickled (models.pkl) and only read when the caller
+  asks for them: only load models from a bundle you trust
+- Saving writes a temporary file and replaces the target when complete.
+  On POSIX a session opened from that same file keeps its mapped data;
+  Windows cannot replace a mapped file, so that save fails cleanly
+"""
+
+import json
+import os
+import struct
+import time
+import zipfile
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from core.logger import get_logger
+from core.progress import ProgressCallback, report, scaled
+
+
+logger = get_logger("session")
+
+FORMAT = "clue-session"
+# 2: results as JSON + arrays instead of a pickle
+VERSION = 2
+
+# array data starts on this boundary inside the archive
+ALIGNMENT = 64
+# extra field id used for the alignment padding (the one zipalign uses)
+_PADDING_ID = 0xD935
+# arrays are written in slices of this many bytes, with a progress report after each
+_CHUNK_BYTES = 64 * 1024 * 1024
+
+
+# -------------------- SESSION --------------------
+
+@dataclass
+class Session:
+    """
+    data: the loaded price frame (numeric columns, DatetimeIndex)
+    results: training and forecast results, metrics (see _encode for the types)
+    ui_state: JSON-compatible state of the wizard
+    models: fitted models as the worker serialized them (opaque bytes)
+    """
+    data: pd.DataFrame
+    results: Dict = field(default_factory=dict)
+    ui_state: Dict = field(default_factory=dict)
+    models: Optional[bytes] = None
+    manifest: Dict = field(default_factory=dict)
+
+
+# -------------------- SAVE --------------------
+
+def save_session(path: str, session: Session, progress: Optional[ProgressCallback] = None) -> str:
+    """Writes the bundle; progress may raise to cancel, which leaves the target untouched."""
+    start = time.perf_counter()
+    temporary = path + ".tmp"
+    entries: Dict[str, Dict] = {}
+
+    try:
+        with zipfile.ZipFile(temporary, "w", allowZip64=True) as archive:
+            data = _write_frame(archive, session.data, entries, scaled(progress, 0.0, 0.9))
+
+            report(progress, 0.9, "Writing results")
+            arrays: Dict[str, np.ndarray] = {}
+            results = json.dumps(_encode(session.results, arrays)).encode("utf-8")
+            for name, values in arrays.items():
+                _write_array(archive, name, values, entries)
+            _write_bytes(archive, "results.json", results, "json", entries)
+            if session.models is not None:
+                _write_bytes(archive, "models.pkl", session.models, "pickle", entries)
+            _write_bytes(archive, "ui.json", json.dumps(session.ui_state).encode("utf-8"), "json", entries)
+
+            manifest = {
+                "format": FORMAT,
+                "version": VERSION,
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "data": data,
+                "entries": entries,
+            }
+            archive.writestr("manifest.json", json.dumps(manifest, indent=2), compress_type=zipfile.ZIP_DEFLATED)
+
+        try:
+            os.replace(temporary, path)
+        except PermissionError:
+            # Windows: the target is open, most likely mapped by the session being saved
+            raise ValueError(f"{path} is in use (is this session open from it?); save it under another name")
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+    report(progress, 1.0, "Done")
+    logger.info(
+        "Saved session to %s (%d rows, %.1f MB) in %.0f ms",
+        path, data["rows"], os.path.getsize(path) / 1e6, (time.perf_counter() - start) * 1000,
+    )
+    return path
+
+
+def _write_frame(archive: zipfile.ZipFile, df: pd.DataFrame, entries: Dict, progress=None) -> Dict:
+    index = pd.DatetimeIndex(df.index)
+    columns = []
+    arrays = {"data/index.bin": index.asi8}
+
+    for i, name in enumerate(df.columns):
+        values = df.iloc[:, i].to_numpy()
+        if values.dtype.kind not in "biuf":
+            raise ValueError(f"Column '{name}' is not numeric and cannot be saved in a session")
+        columns.append({"name": str(name), "entry": f"data/{i}.bin"})
+        arrays[f"data/{i}.bin"] = values
+
+    total = sum(values.nbytes for values in arrays.values()) or 1
+    written = 0
+    for name, values in arrays.items():
+        _write_array(archive, name, values, entries, scaled(progress, written / total, (written + values.nbytes) / total))
+        written += values.nbytes
+
+    return {
+        "rows": len(df),
+        "index": "data/index.bin",
+        "index_name": index.name,
+        "unit": np.datetime_data(index.values.dtype)[0],
+        "tz": str(index.tz) if index.tz is not None else None,
+        "columns": columns,
+    }
+
+
+def _write_array(archive: zipfile.ZipFile, name: str, values: np.ndarray, entries: Dict, progress=None):
+    values = np.ascontiguousarray(values)
+
+    info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+    info.compress_type = zipfile.ZIP_STORED
+    info.file_size = values.nbytes
+    info.compress_size = info.CRC = 0  # written after the data
+    # pad the local header so the data that follows it is aligned
+    offset = archive.fp.tell() + len(info.FileHeader(zip64=True)) + 4
+    padding = -offset % ALIGNMENT
+    info.extra = struct.pack("<HH", _PADDING_ID, padding) + bytes(padding)
+
+    flat = values.reshape(-1).view(np.uint8)
+    with archive.open(info, "w", force_zip64=True) as member:
+        for first in range(0, len(flat), _CHUNK_BYTES):
+            report(progress, first / len(flat), "Writing data")
+            member.write(flat[first:first + _CHUNK_BYTES])
+
+    entries[name] = {
+        "kind": "array",
+        "dtype": values.dtype.str,
+        "shape": list(values.shape),
+        "bytes": values.nbytes,
+        "compressed": False,
+    }
+
+
+def _write_bytes(archive: zipfile.ZipFile, name: str, payload: bytes, kind: str, entries: Dict):
+    archive.writestr(name, payload, compress_type=zipfile.ZIP_DEFLATED)
+    entries[name] = {
+        "kind": kind,
+        "bytes": len(payload),
+        "compressed": True,
+    }
+
+
+# -------------------- RESULTS --------------------
+# Results are nested dicts of plain values and pandas objects. They are written as
+# JSON in which pandas objects, tuples and dicts with non-string keys are tagged
+# with "$type"; every array inside them becomes its own raw array entry.
+
+def _encode(value, arrays: Dict[str, np.ndarray]):
+    """JSON form of a results value; arrays move into `arrays` (entry name -> array)."""
+    if value is None or isinstance(value, (bool, str, int, float)):
+        return value
+    if isinstance(value, np.generic) and value.dtype.kind in "biuf":
+        return value.item()
+    if isinstance(value, pd.Timestamp):
+        return {"$type": "timestamp", "value": value.isoformat()}
+    if isinstance(value, np.ndarray):
+        return {"$type": "array", "entry": _add_array(value, arrays)}
+    if isinstance(value, pd.Series):
+        return {
+            "$type": "series",
+            "name": _encode(value.name, arrays),
+            "index": _encode(value.index, arrays),
+            "values": _add_array(value.to_numpy(), arrays),
+        }
+    if isinstance(value, pd.DataFrame):
+        return {
+            "$type": "frame",
+            "columns": [_encode(name, arrays) for name in value.columns],
+            "index": _encode(value.index, arrays),
+            "values": [_add_array(value.iloc[:, i].to_numpy(), arrays) for i in range(value.shape[1])],
+        }
+    if isinstance(value, pd.RangeIndex):
+        return {
+            "$type": "range_index",
+            "start": value.start, "stop": value.stop, "step": value.step,
+            "name": _encode(value.name, arrays),
+        }
+    if isinstance(value, pd.DatetimeIndex):
+        return {
+            "$type": "datetime_index",
+            "values": _add_array(value.values, arrays),  # UTC wall time when tz-aware
+            "tz": str(value.tz) if value.tz is not None else None,
+            "freq": value.freqstr,
+            "name": _encode(value.name, arrays),
+        }
+    if isinstance(value, pd.Index):
+        return {"$type": "index", "values": _add_array(value.to_numpy(), arrays), "name": _encode(value.name, arrays)}
+    if isinstance(value, tuple):
+        return {"$type": "tuple", "items": [_encode(item, arrays) for item in value]}
+    if isinstance(value, list):
+        return [_encode(item, arrays) for item in value]
+    if isinstance(value, dict):
+        if all(isinstance(key, str) for key in value) and "$type" not in value:
+            return {key: _encode(item, arrays) for key, item in value.items()}
+        return {"$type": "dict", "items": [[_encode(key, arrays), _encode(item, arrays)] for key, item in value.items()]}
+    raise ValueError(f"A {type(value).__name__} in the results cannot be saved in a session")
+
+
+def _add_array(values: np.ndarray, arrays: Dict[str, np.ndarray]) -> str:
+    if values.dtype.kind not in "biufmM":
+        raise ValueError(f"Results with {values.dtype} values cannot be saved in a session")
+    name = f"results/{len(arrays)}.bin"
+    arrays[name] = values
+    return name
+
+
+def _decode(value, archive: zipfile.ZipFile, entries: Dict):
+    if isinstance(value, list):
+        return [_decode(item, archive, entries) for item in value]
+    if not isinstance(value, dict):
+        return value
+
+    kind = value.get("$type")
+    if kind is None:
+        return {key: _decode(item, archive, entries) for key, item in value.items()}
+
+    def decode(item):
+        return _decode(item, archive, entries)
+
+    def array(name):
+        entry = entries[name]
+        # results arrays are small, so they are read rather than mapped
+        return np.frombuffer(archive.read(name), dtype=np.dtype(entry["dtype"])).reshape(entry["shape"]).copy()
+
+    if kind == "tuple":
+        return tuple(decode(item) for item in value["items"])
+    if kind == "dict":
+        return {decode(key): decode(item) for key, item in value["items"]}
+    if kind == "timestamp":
+        return pd.Timestamp(value["value"])
+    if kind == "array":
+        return array(value["entry"])
+    if kind == "series":
+        return pd.Series(array(value["values"]), index=decode(value["index"]), name=decode(value["name"]))
+    if kind == "frame":
+        columns = [decode(name) for name in value["columns"]]
+        frame = pd.DataFrame({i: array(name) for i, name in enumerate(value["values"])}, index=decode(value["index"]))
+        frame.columns = columns
+        return frame
+    if kind == "range_index":
+        return pd.RangeIndex(value["start"], value["stop"], value["step"], name=decode(value["name"]))
+    if kind == "datetime_index":
+        dates = pd.DatetimeIndex(array(value["values"]), name=decode(value["name"]))
+        if value["tz"] is not None:
+            dates = dates.tz_localize("UTC").tz_convert(value["tz"])
+        if value["freq"] is not None:
+            dates.freq = value["freq"]
+        return dates
+    if kind == "index":
+        return pd.Index(array(value["values"]), name=decode(value["name"]))
+    raise ValueError(f"Session results contain an unknown value type: {kind}")
+
+
+# -------------------- OPEN --------------------
+
+def read_manifest(path: str) -> Dict:
+    with _open_archive(path) as archive:
+        return _read_manifest(archive)
+
+
+def load_session(
+    path: str,
+    verify: bool = False,
+    load_models: bool = False,
+    progress: Optional[ProgressCallback] = None,
+) -> Session:
+    """
+    Opens a bundle; the data columns are memory maps of the file
+    (copy-on-write: changes to the frame never reach the file).
+    verify reads every entry to check its checksum, which defeats the mapping's speed.
+    The pickled models are only read with load_models (the caller trusts the file).
+    """
+    start = time.perf_counter()
+    with _open_archive(path) as archive:
+        manifest = _read_manifest(archive)
+
+        if verify:
+            report(progress, 0.0, "Verifying")
+            bad = archive.testzip()
+            if bad is not None:
+                raise ValueError(f"Session file is damaged: {bad} does not match its checksum")
+
+        report(progress, 0.5, "Mapping data")
+        data = _map_frame(path, archive, manifest)
+
+        report(progress, 0.8, "Reading results")
+        results = _decode(json.loads(archive.read("results.json")), archive, manifest["entries"])
+        models = archive.read("models.pkl") if load_models and "models.pkl" in manifest["entries"] else None
+        ui_state = json.loads(archive.read("ui.json"))
+
+    report(progress, 1.0, "Done")
+    logger.info(
+        "Opened session %s (%d rows) in %.0f ms",
+        path, manifest["data"]["rows"], (time.perf_counter() - start) * 1000,
+    )
+    return Session(data=data, results=results, ui_state=ui_state, models=models, manifest=manifest)
+
+
+def _open_archive(path: str) -> zipfile.ZipFile:
+    try:
+        return zipfile.ZipFile(path)
+    except zipfile.BadZipFile:
+        raise ValueError(f"Not a CLUE session file: {path}")
+
+
+def _read_manifest(archive: zipfile.ZipFile) -> Dict:
+    try:
+        manifest = json.loads(archive.read("manifest.json"))
+    except KeyError:
+        raise ValueError("Not a CLUE session file (no manifest)")
+
+    if manifest.get("format") != FORMAT:
+        raise ValueError("Not a CLUE session file")
+    if manifest.get("version", 0) > VERSION:
+        raise ValueError(f"Session format version {manifest['version']} is newer than this version of CLUE supports")
+    if manifest.get("version", 0) < VERSION:
+        raise ValueError(f"Session format version {manifest.get('version')} is no longer supported; save the session again")
+    return manifest
+
+
+def _map_frame(path: str, archive: zipfile.ZipFile, manifest: Dict) -> pd.DataFrame:
+    data = manifest["data"]
+    entries = manifest["entries"]
+
+    ticks = _map_array(path, archive, data["index"], entries[data["index"]])
+    dates = pd.DatetimeIndex(ticks.view(f"datetime64[{data['unit']}]"), name=data["index_name"])
+    if data["tz"] is not None:
+        dates = dates.tz_localize("UTC").tz_convert(data["tz"])
+
+    columns = {
+        column["name"]: _map_array(path, archive, column["entry"], entries[column["entry"]])
+        for column in data["columns"]
+    }
+    # copy=False keeps each column on its mapping instead of consolidating into one block
+    return pd.DataFrame(columns, index=dates, copy=False)
+
+
+def _map_array(path: str, archive: zipfile.ZipFile, name: str, entry: Dict) -> np.ndarray:
+    info = archive.getinfo(name)
+    if info.compress_type != zipfile.ZIP_STORED:
+        raise ValueError(f"Session entry {name} is compressed and cannot be mapped")
+
+    dtype = np.dtype(entry["dtype"])
+    shape = tuple(entry["shape"])
+    if entry["bytes"] == 0:
+        return np.empty(shape, dtype=dtype)
+
+    # the data follows the local header, whose extra field may differ from the central directory's
+    with open(path, "rb") as handle:
+        handle.seek(info.header_offset)
+        header = handle.read(30)
+    if header[:4] != b"PK\x03\x04":
+        raise ValueError(f"Session file is damaged: bad header for {name}")
+    name_length, extra_length = struct.unpack("<HH", header[26:30])
+    offset = info.header_offset + 30 + name_length + extra_length
+
+    return np.asarray(np.memmap(path, dtype=dtype, mode="c", offset=offset, shape=shape))
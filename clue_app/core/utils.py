@@ -0,0 +1,27 @@
+"""
+Shared Utilities for CLUE Financial Forecasting Application
+- series_fingerprint: content hash used as a cache key (stationarity,
+  EDA, LOD pyramids) and to detect revised history (retraining)
+"""
+
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+
+# -------------------- FINGERPRINTS --------------------
+
+def series_fingerprint(series: pd.Series, include_index: bool = True) -> str:
+    """Content hash of a series' values and (by default) its index."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(series.to_numpy(dtype=float)).tobytes())
+
+    if include_index:
+        index = series.index
+        if isinstance(index, pd.DatetimeIndex):
+            digest.update(np.ascontiguousarray(index.asi8).tobytes())
+        else:
+            digest.update(pd.util.hash_pandas_object(index, index=False).to_numpy().tobytes())
+
+    return digest.hexdigest()
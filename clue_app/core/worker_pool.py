@@ -0,0 +1,351 @@
+"""
+Worker Process Pool for CLUE Financial Forecasting Application
+Runs training, forecast and report jobs in a few persistent processes.
+- Workers start in the background at launch and import the scientific stack
+  up front (forkserver preload on Linux, the initializer elsewhere), then do
+  one tiny ARIMA and XGBoost fit so first-call costs are paid before any job
+- Each worker is its own single-process executor; jobs with the same affinity
+  (dataset) land on the same worker, so its fitted-model cache stays warm
+- Price data is copied once into shared memory; jobs receive a small handle
+- run() blocks the calling task thread, relays the worker's progress reports
+  and turns a cancelled progress callback into a stop at the job's next report
+"""
+
+import importlib
+import itertools
+import multiprocessing as mp
+import os
+import queue
+import sys
+import threading
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from core.logger import get_logger
+from core.progress import OperationCancelled, ProgressCallback, report
+
+
+logger = get_logger("workers")
+
+# everything a job needs; imported once per worker, never on the job's clock
+PRELOAD_MODULES = (
+    "pipeline.training_pipeline",
+    "pipeline.forecasting_pipeline",
+    "preprocessing.eda",
+    "visualization.forecast_plot",
+    "core.report_generator",
+    "pipeline.jobs",
+)
+
+# how often a waiting run() re-reports progress, which is also how it notices a cancel
+POLL_INTERVAL = 0.2
+
+
+# -------------------- SHARED DATA --------------------
+
+@dataclass(frozen=True)
+class FrameHandle:
+    """What a job receives instead of a pickled DataFrame."""
+    name: str
+    rows: int
+    columns: Tuple[str, ...]
+    index_name: Optional[str]
+    unit: str
+    tz: Optional[str]
+
+
+class SharedFrame:
+    """
+    A float DataFrame with a DatetimeIndex copied into one shared memory block:
+    the index as int64 ticks of its own unit, then one float64 row per column.
+    The block is unlinked once retired and no running job has it pinned.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        index = pd.DatetimeIndex(df.index)
+        columns = tuple(df.columns)
+        rows = len(df)
+
+        self._shm = shared_memory.SharedMemory(create=True, size=max(8 * rows * (1 + len(columns)), 1))
+        np.ndarray((rows,), dtype=np.int64, buffer=self._shm.buf)[:] = index.asi8
+        np.ndarray((len(columns), rows), dtype=np.float64, buffer=self._shm.buf, offset=8 * rows)[:] = (
+            df.to_numpy(dtype=np.float64).T
+        )
+
+        self.handle = FrameHandle(
+            name=self._shm.name,
+            rows=rows,
+            columns=columns,
+            index_name=index.name,
+            unit=np.datetime_data(index.values.dtype)[0],
+            tz=str(index.tz) if index.tz is not None else None,
+        )
+        self._lock = threading.Lock()
+        self._pins = 0
+        self._retired = False
+
+    @contextmanager
+    def pinned(self):
+        """Keeps the block alive for the duration of a job; yields its handle."""
+        with self._lock:
+            if self._shm is None:
+                raise ValueError("The data for this job has been replaced; run it again")
+            self._pins += 1
+        try:
+            yield self.handle
+        finally:
+            with self._lock:
+                self._pins -= 1
+                self._release_if_unused()
+
+    def retire(self):
+        with self._lock:
+            self._retired = True
+            self._release_if_unused()
+
+    def _release_if_unused(self):
+        if self._retired and self._pins == 0 and self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+
+def read_frame(handle: FrameHandle) -> pd.DataFrame:
+    """Worker side: copies the shared block into an ordinary DataFrame."""
+    shm = shared_memory.SharedMemory(name=handle.name)
+    try:
+        index = np.ndarray((handle.rows,), dtype=np.int64, buffer=shm.buf).copy()
+        values = np.ndarray(
+            (len(handle.columns), handle.rows), dtype=np.float64, buffer=shm.buf, offset=8 * handle.rows
+        ).T.copy()
+    finally:
+        shm.close()
+
+    dates = pd.DatetimeIndex(index.view(f"datetime64[{handle.unit}]"), name=handle.index_name)
+    if handle.tz is not None:
+        dates = dates.tz_localize("UTC").tz_convert(handle.tz)
+    return pd.DataFrame(values, index=dates, columns=list(handle.columns))
+
+
+# -------------------- WORKER SIDE --------------------
+
+_progress_queue = None
+_cancelled = None
+
+
+def _init_worker(progress_queue, cancelled):
+    global _progress_queue, _cancelled
+    _progress_queue = progress_queue
+    _cancelled = cancelled
+
+    start = time.perf_counter()
+    for name in PRELOAD_MODULES:
+        importlib.import_module(name)
+    _warm_first_calls()
+    logger.info("Worker %d ready in %.0f ms", os.getpid(), (time.perf_counter() - start) * 1000)
+
+
+def _warm_first_calls():
+    """One tiny fit per library, so lazily built dispatch tables and thread pools exist."""
+    import pmdarima as pm
+    import xgboost as xgb
+
+    rng = np.random.default_rng(0)
+    y = 100.0 + np.cumsum(rng.normal(size=64))
+    pm.ARIMA(order=(1, 1, 0)).fit(y)
+    xgb.XGBRegressor(n_estimators=2, max_depth=2).fit(y[:-1].reshape(-1, 1), y[1:])
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _run_job(job_id: int, fn: Callable, args: tuple, kwargs: dict):
+    def progress(fraction: Optional[float] = None, message: str = ""):
+        if _cancelled.value == job_id:
+            raise OperationCancelled(message)
+        _progress_queue.put((job_id, fraction, message))
+
+    if _cancelled.value == job_id:
+        raise OperationCancelled("cancelled before start")
+    return fn(*args, progress=progress, **kwargs)
+
+
+# -------------------- POOL --------------------
+
+class _Worker:
+    def __init__(self, ctx, progress_queue):
+        # id of the job this worker should stop; it runs one job at a time
+        self.cancelled = ctx.RawValue("q", 0)
+        self.executor = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(progress_queue, self.cancelled),
+        )
+        self.active: List[int] = []
+
+
+class WorkerPool:
+    def __init__(self, n_workers: Optional[int] = None, start_method: Optional[str] = None):
+        self.n_workers = n_workers or max(1, min(2, os.cpu_count() or 1))
+        self.start_method = start_method or ("forkserver" if sys.platform.startswith("linux") else "spawn")
+
+        self._ctx = None
+        self._workers: List[_Worker] = []
+        self._progress_queue = None
+        self._jobs: Dict[int, queue.Queue] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._start_lock = threading.Lock()
+
+    # -------------------- PUBLIC METHODS --------------------
+
+    @property
+    def started(self) -> bool:
+        return bool(self._workers)
+
+    def start(self):
+        """Starts every worker and waits until each has preloaded; safe to call repeatedly."""
+        with self._start_lock:
+            if self._workers:
+                return
+
+            start = time.perf_counter()
+            if self._ctx is None:
+                self._ctx = mp.get_context(self.start_method)
+                if self.start_method == "forkserver":
+                    # imported once in the fork server; every worker forks with it already loaded
+                    self._ctx.set_forkserver_preload(["__main__", *PRELOAD_MODULES])
+
+                self._progress_queue = self._ctx.Queue()
+                threading.Thread(target=self._relay_progress, name="clue-workers-progress", daemon=True).start()
+
+            workers = [_Worker(self._ctx, self._progress_queue) for _ in range(self.n_workers)]
+            try:
+                for future in [w.executor.submit(_ping) for w in workers]:
+                    future.result()
+            except Exception:
+                for worker in workers:
+                    worker.executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+            with self._lock:
+                self._workers = workers
+            logger.info(
+                "Worker pool ready (%d x %s) in %.0f ms",
+                self.n_workers, self.start_method, (time.perf_counter() - start) * 1000,
+            )
+
+    def warm_up(self):
+        """start() for a background thread: a failure is logged and the next run() tries again."""
+        try:
+            self.start()
+        except Exception as exc:
+            logger.warning("Worker pool did not start: %s", exc)
+
+    def run(
+        self,
+        fn: Callable,
+        *args,
+        affinity: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+        **kwargs,
+    ):
+        """
+        Runs fn(*args, progress=..., **kwargs) in a worker and returns its result.
+        fn and its arguments must be picklable; pass SharedFrame handles for data.
+        """
+        self.start()
+
+        job_id = next(self._ids)
+        messages: queue.Queue = queue.Queue()
+        with self._lock:
+            worker = self._pick(affinity)
+            worker.active.append(job_id)
+            self._jobs[job_id] = messages
+
+        try:
+            future = worker.executor.submit(_run_job, job_id, fn, args, kwargs)
+            cancelled = False
+            last = (None, "")
+
+            while True:
+                try:
+                    last = messages.get(timeout=POLL_INTERVAL)
+                except queue.Empty:
+                    if future.done():
+                        break
+                if cancelled:
+                    continue
+                try:
+                    report(progress, *last)
+                except OperationCancelled:
+                    cancelled = True
+                    worker.cancelled.value = job_id
+                    future.cancel()
+
+            if cancelled:
+                raise OperationCancelled(getattr(fn, "__name__", "job"))
+            return future.result()
+
+        except BrokenProcessPool:
+            self._replace(worker)
+            raise RuntimeError("The worker process stopped unexpectedly; it has been restarted")
+
+        finally:
+            with self._lock:
+                worker.active.remove(job_id)
+                del self._jobs[job_id]
+
+    def shutdown(self):
+        """Stops running jobs at their next report and lets the processes exit."""
+        with self._lock:
+            workers, self._workers = self._workers, []
+            for worker in workers:
+                if worker.active:
+                    worker.cancelled.value = worker.active[0]
+
+        for worker in workers:
+            worker.executor.shutdown(wait=False, cancel_futures=True)
+
+    # -------------------- HELPERS --------------------
+
+    def _pick(self, affinity: Optional[str]) -> _Worker:
+        if affinity is not None:
+            return self._workers[zlib.crc32(affinity.encode("utf-8")) % len(self._workers)]
+        return min(self._workers, key=lambda w: len(w.active))
+
+    def _replace(self, worker: _Worker):
+        logger.warning("Worker process died; starting a replacement")
+        worker.executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            if worker in self._workers:
+                self._workers[self._workers.index(worker)] = _Worker(self._ctx, self._progress_queue)
+
+    def _relay_progress(self):
+        # a daemon for the life of the app; the GUI process never writes to this queue
+        while True:
+            job_id, fraction, message = self._progress_queue.get()
+            with self._lock:
+                target = self._jobs.get(job_id)
+            if target is not None:
+                target.put((fraction, message))
+
+
+# -------------------- GUI FRIENDLY FUNCTIONS --------------------
+
+worker_pool = WorkerPool()
+
+
+def share_frame(df: pd.DataFrame) -> SharedFrame:
+    return SharedFrame(df)
@@ -0,0 +1,200 @@
+"""
+Model Comparison Module for CLUE Financial Forecasting
+Statistical tests for choosing between forecasting models.
+- Diebold-Mariano tests (HAC variance, HLN small-sample correction)
+  for every model pair on every series in one call
+- Model Confidence Set (Hansen, Lunde & Nason) with a moving block bootstrap
+Inputs are stacked as forecasts (N models x M series x T steps)
+against actuals (M series x T steps).
+"""
+
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+from scipy import stats
+
+
+EPS = 1e-12
+
+_LOSSES = {
+    "squared": lambda errors: errors ** 2,
+    "absolute": np.abs,
+}
+
+
+# -------------------- LOSSES --------------------
+
+def loss_matrix(y_true, forecasts, loss: str = "squared") -> np.ndarray:
+    """Per-step losses of shape (N, M, T); 1-D/2-D inputs are promoted to a single series."""
+    if loss not in _LOSSES:
+        raise ValueError(f"Unsupported loss: {loss}")
+
+    y_true = np.asarray(y_true, dtype=float)
+    forecasts = np.asarray(forecasts, dtype=float)
+    if y_true.ndim == 1:
+        y_true = y_true[None, :]
+    if forecasts.ndim == 2:
+        forecasts = forecasts[:, None, :]
+    if forecasts.shape[1:] != y_true.shape:
+        raise ValueError(f"Shape mismatch: forecasts {forecasts.shape} vs actuals {y_true.shape}")
+
+    return _LOSSES[loss](y_true[None, :, :] - forecasts)
+
+
+def _cross_autocovariances(losses: np.ndarray, max_lag: int) -> np.ndarray:
+    """Gamma[k, i, j, m] = cov(L_i,t , L_j,t-k) per series, for k = 0..max_lag."""
+    n_steps = losses.shape[-1]
+    centred = losses - losses.mean(axis=-1, keepdims=True)
+    return np.stack([
+        np.einsum("imt,jmt->ijm", centred[..., k:], centred[..., : n_steps - k]) / n_steps
+        for k in range(max_lag + 1)
+    ])
+
+
+# -------------------- DIEBOLD-MARIANO --------------------
+
+def diebold_mariano(losses: np.ndarray, horizon: int = 1, max_lag: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """
+    Pairwise DM tests on d_ij,t = L_i,t - L_j,t for all (i, j) and every series.
+    The HAC variance of each differential is assembled from the cross-autocovariances
+    of the losses, so the (N x N x M x T) differential tensor is never materialised.
+    Negative statistics mean model i has lower loss than model j.
+    """
+    losses = np.asarray(losses, dtype=float)
+    if losses.ndim == 2:
+        losses = losses[:, None, :]
+    n_steps = losses.shape[-1]
+    if n_steps < 3:
+        raise ValueError("Diebold-Mariano needs at least 3 observations")
+
+    if max_lag is None:
+        max_lag = max(horizon - 1, int(np.floor(n_steps ** (1 / 3))))
+    max_lag = min(max_lag, n_steps - 1)
+
+    gamma = _cross_autocovariances(losses, max_lag)
+    gamma = gamma + gamma.transpose(0, 2, 1, 3)  # gamma_ij(k) + gamma_ji(k)
+    diag = np.einsum("kiim->kim", gamma) / 2
+
+    # var(d_ij) autocovariances: g_ii + g_jj - (g_ij + g_ji)
+    gamma_d = diag[:, :, None, :] + diag[:, None, :, :] - gamma
+
+    # Bartlett weights keep the long-run variance positive
+    weights = 1 - np.arange(1, max_lag + 1) / (max_lag + 1)
+    long_run = gamma_d[0] + 2 * np.tensordot(weights, gamma_d[1:], axes=1)
+    long_run = np.maximum(long_run, EPS)
+
+    mean_loss = losses.mean(axis=-1)
+    mean_diff = mean_loss[:, None, :] - mean_loss[None, :, :]
+
+    statistic = mean_diff / np.sqrt(long_run / n_steps)
+
+    # Harvey, Leybourne & Newbold correction
+    statistic *= np.sqrt((n_steps + 1 - 2 * horizon + horizon * (horizon - 1) / n_steps) / n_steps)
+    p_value = 2 * stats.t.sf(np.abs(statistic), df=n_steps - 1)
+
+    diagonal = np.arange(losses.shape[0])
+    statistic[diagonal, diagonal] = 0.0
+    p_value[diagonal, diagonal] = 1.0
+
+    return {"statistic": statistic, "p_value": p_value, "mean_loss_difference": mean_diff}
+
+
+# -------------------- MODEL CONFIDENCE SET --------------------
+
+def block_bootstrap_indices(n: int, n_boot: int, block_length: int, rng: np.random.Generator) -> np.ndarray:
+    """(n_boot x n) index matrix for a circular moving block bootstrap."""
+    block_length = max(1, min(block_length, n))
+    n_blocks = -(-n // block_length)
+    starts = rng.integers(0, n, size=(n_boot, n_blocks, 1))
+    return ((starts + np.arange(block_length)) % n).reshape(n_boot, -1)[:, :n]
+
+
+def _bootstrap_means(losses: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """Resampled mean losses (N, M, B) as one matrix product with the resampling counts."""
+    n_boot, n_steps = indices.shape
+    offsets = (indices + n_steps * np.arange(n_boot)[:, None]).ravel()
+    counts = np.bincount(offsets, minlength=n_boot * n_steps).reshape(n_boot, n_steps)
+    return (losses @ counts.T) / n_steps
+
+
+def model_confidence_set(
+    losses: np.ndarray,
+    alpha: float = 0.1,
+    n_boot: int = 1000,
+    block_length: Optional[int] = None,
+    random_state: Optional[int] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    T_max elimination rule run on all series at once.
+    Returns MCS p-values (N x M) and the membership mask at level alpha.
+    """
+    losses = np.asarray(losses, dtype=float)
+    if losses.ndim == 2:
+        losses = losses[:, None, :]
+    n_models, n_series, n_steps = losses.shape
+
+    block_length = block_length or max(1, int(round(n_steps ** (1 / 3))))
+    indices = block_bootstrap_indices(n_steps, n_boot, block_length, np.random.default_rng(random_state))
+
+    means = losses.mean(axis=-1)
+    boot_means = _bootstrap_means(losses, indices)
+
+    active = np.ones((n_models, n_series), dtype=bool)
+    mcs_p = np.ones((n_models, n_series))
+    running_max = np.zeros(n_series)
+    elimination_order = np.full((n_models, n_series), -1)
+    columns = np.arange(n_series)
+
+    for step in range(n_models - 1):
+        size = active.sum(axis=0)
+        set_mean = (means * active).sum(axis=0) / size
+        boot_set_mean = (boot_means * active[..., None]).sum(axis=0) / size[:, None]
+
+        deviation = means - set_mean
+        boot_deviation = boot_means - boot_set_mean - deviation[..., None]
+        scale = np.sqrt((boot_deviation ** 2).mean(axis=-1)) + EPS
+
+        t_stat = np.where(active, deviation / scale, -np.inf)
+        boot_t = np.where(active[..., None], boot_deviation / scale[..., None], -np.inf)
+
+        t_max = t_stat.max(axis=0)
+        p_value = (boot_t.max(axis=0) >= t_max[:, None]).mean(axis=-1)
+
+        worst = t_stat.argmax(axis=0)
+        running_max = np.maximum(running_max, p_value)
+        mcs_p[worst, columns] = running_max
+        elimination_order[worst, columns] = step
+        active[worst, columns] = False
+
+    return {
+        "p_value": mcs_p,
+        "included": mcs_p > alpha,
+        "elimination_order": elimination_order,
+        "mean_loss": means,
+    }
+
+
+# -------------------- GUI FRIENDLY FUNCTION --------------------
+
+def compare_forecasts(
+    y_true,
+    forecasts: Dict[str, Sequence[float]],
+    loss: str = "squared",
+    horizon: int = 1,
+    alpha: float = 0.1,
+    random_state: Optional[int] = 0,
+) -> Dict:
+    """DM p-values and MCS membership for a few named forecasts of one series."""
+    names = list(forecasts)
+    losses = loss_matrix(y_true, np.stack([np.asarray(forecasts[name], dtype=float) for name in names]), loss)
+
+    dm = diebold_mariano(losses, horizon=horizon)
+    mcs = model_confidence_set(losses, alpha=alpha, random_state=random_state)
+
+    return {
+        "models": names,
+        "dm_statistic": {a: {b: float(dm["statistic"][i, j, 0]) for j, b in enumerate(names)} for i, a in enumerate(names)},
+        "dm_p_value": {a: {b: float(dm["p_value"][i, j, 0]) for j, b in enumerate(names)} for i, a in enumerate(names)},
+        "mcs_p_value": {name: float(mcs["p_value"][i, 0]) for i, name in enumerate(names)},
+        "confidence_set": [name for i, name in enumerate(names) if mcs["included"][i, 0]],
+    }
@@ -0,0 +1,139 @@
+"""
+Batched Metrics Engine for CLUE Financial Forecasting
+Computes all 14 forecast indicators from shared intermediates in one pass.
+- 1-D input  -> dict of floats
+- 2-D input  (series x horizon, or folds x horizon) -> dict of arrays,
+  either one value per row (per="row") or per horizon step (per="horizon")
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+
+METRIC_NAMES = (
+    "MAE",
+    "MSE",
+    "RMSE",
+    "MAPE",
+    "SMAPE",
+    "WAPE",
+    "R2",
+    "MASE",
+    "Bias",
+    "Skewness",
+    "Kurtosis",
+    "Directional Accuracy",
+    "Confidence Score",
+    "Volatility Error Ratio",
+)
+
+EPS = 1e-8
+
+
+def _pad_first(values: np.ndarray) -> np.ndarray:
+    """Re-aligns a time-differenced (n, h-1) array with the (n, h) horizon grid."""
+    return np.concatenate([np.full((values.shape[0], 1), np.nan), values], axis=1)
+
+
+def batch_metrics(y_true, y_pred, per: str = "row") -> Dict[str, np.ndarray]:
+    """
+    All metrics for 2-D arrays of shape (rows x horizon).
+    Time runs along axis 1; per="row" reduces over time, per="horizon" over rows.
+    """
+    y_true = np.asarray(y_true, dtype=float)
+    y_pred = np.asarray(y_pred, dtype=float)
+    if y_true.shape != y_pred.shape:
+        raise ValueError(f"Shape mismatch: {y_true.shape} vs {y_pred.shape}")
+    if y_true.ndim != 2:
+        raise ValueError("batch_metrics expects 2-D arrays (rows x horizon)")
+    if per not in ("row", "horizon"):
+        raise ValueError("per must be 'row' or 'horizon'")
+
+    axis = 1 if per == "row" else 0
+    n_time = y_true.shape[1]
+
+    # ---------- Shared intermediates ----------
+    residuals = y_true - y_pred
+    abs_res = np.abs(residuals)
+    sq_res = residuals ** 2
+    abs_true = np.abs(y_true)
+    # MAPE skips zero actuals, as ModelEvaluator.mape always has (NaN when none remain)
+    nonzero = y_true != 0
+    n_nonzero = nonzero.sum(axis=axis)
+
+    mae = abs_res.mean(axis=axis)
+    mse = sq_res.mean(axis=axis)
+    bias = residuals.mean(axis=axis)
+
+    ape = np.where(nonzero, abs_res / np.where(nonzero, abs_true, 1.0), 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mape = np.where(n_nonzero > 0, ape.sum(axis=axis) / n_nonzero * 100, np.nan)
+    smape = np.mean(2.0 * abs_res / (abs_true + np.abs(y_pred) + EPS), axis=axis) * 100
+    wape = abs_res.sum(axis=axis) / (abs_true.sum(axis=axis) + EPS) * 100
+
+    # ---------- Goodness of Fit (sklearn's force_finite convention) ----------
+    ss_res = sq_res.sum(axis=axis)
+    ss_tot = ((y_true - y_true.mean(axis=axis, keepdims=True)) ** 2).sum(axis=axis)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r2 = np.where(ss_tot > 0, 1.0 - ss_res / ss_tot, np.where(ss_res == 0, 1.0, 0.0))
+
+    # ---------- Residual Distribution ----------
+    centred = residuals - residuals.mean(axis=axis, keepdims=True)
+    residual_std = np.sqrt((centred ** 2).mean(axis=axis)) + EPS
+    skewness = (centred ** 3).mean(axis=axis) / residual_std ** 3
+    kurtosis = (centred ** 4).mean(axis=axis) / residual_std ** 4
+
+    # ---------- Time-differenced quantities (always along the horizon) ----------
+    if n_time > 1:
+        true_diff = np.diff(y_true, axis=1)
+        pred_diff = np.diff(y_pred, axis=1)
+
+        # MASE scale: in-window naive (random walk) error of each row
+        naive_scale = np.abs(true_diff).mean(axis=1, keepdims=True) + EPS
+        mase = np.mean(abs_res / naive_scale, axis=axis)
+
+        hits = (np.sign(true_diff) == np.sign(pred_diff)).astype(float)
+        if per == "row":
+            directional_accuracy = hits.mean(axis=1) * 100
+            volatility_ratio = pred_diff.std(axis=1) / (true_diff.std(axis=1) + EPS)
+        else:
+            directional_accuracy = _pad_first(hits).mean(axis=0) * 100
+            volatility_ratio = _pad_first(pred_diff).std(axis=0) / (_pad_first(true_diff).std(axis=0) + EPS)
+    else:
+        size = y_true.shape[0] if per == "row" else n_time
+        mase = np.full(size, np.nan)
+        directional_accuracy = np.full(size, np.nan)
+        volatility_ratio = np.full(size, np.nan)
+
+    return {
+        "MAE": mae,
+        "MSE": mse,
+        "RMSE": np.sqrt(mse),
+        "MAPE": mape,
+        "SMAPE": smape,
+        "WAPE": wape,
+        "R2": r2,
+        "MASE": mase,
+        "Bias": bias,
+        "Skewness": skewness,
+        "Kurtosis": kurtosis,
+        "Directional Accuracy": directional_accuracy,
+        "Confidence Score": np.maximum(0.0, 100 - mape),
+        "Volatility Error Ratio": volatility_ratio,
+    }
+
+
+# -------------------- GUI FRIENDLY FUNCTIONS --------------------
+
+def compute_metrics(y_true, y_pred) -> Dict[str, float]:
+    """Single series convenience wrapper returning plain floats."""
+    y_true = np.asarray(y_true, dtype=float).reshape(1, -1)
+    y_pred = np.asarray(y_pred, dtype=float).reshape(1, -1)
+    return {name: float(values[0]) for name, values in batch_metrics(y_true, y_pred).items()}
+
+
+def metrics_frame(y_true, y_pred, per: str = "row", index: Optional[pd.Index] = None) -> pd.DataFrame:
+    """Batched metrics as a DataFrame (one row per series/fold, or per horizon step)."""
+    return pd.DataFrame(batch_metrics(y_true, y_pred, per), index=index)
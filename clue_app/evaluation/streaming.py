@@ -0,0 +1,250 @@
+"""
+Streaming Metrics Module for CLUE Financial Forecasting
+Online accumulators for live forecast monitoring.
+- O(1) update per observation, no residual history kept
+- Mergeable state for parallel shards
+- Windowed (last-N) variant backed by a fixed-size ring buffer
+"""
+
+import math
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+
+EPS = 1e-8
+
+
+class StreamingMetrics:
+    """MAE / RMSE / MAPE / bias / directional accuracy and residual moments."""
+
+    def __init__(self):
+        self.n = 0
+        self.sum_abs = 0.0
+        self.sum_sq = 0.0
+        self.sum_ape = 0.0
+        self.ape_count = 0  # MAPE skips zero actuals, like the batch engine
+
+        # Welford / Pebay central moments of the residuals
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+
+        self.direction_hits = 0
+        self.direction_count = 0
+        self._last_actual: Optional[float] = None
+        self._last_predicted: Optional[float] = None
+
+    # -------------------- UPDATES --------------------
+
+    def update(self, actual: float, predicted: float) -> "StreamingMetrics":
+        residual = actual - predicted
+
+        self.sum_abs += abs(residual)
+        self.sum_sq += residual * residual
+        if actual != 0:
+            self.sum_ape += abs(residual) / abs(actual)
+            self.ape_count += 1
+
+        n1 = self.n
+        self.n += 1
+        delta = residual - self.mean
+        delta_n = delta / self.n
+        term = delta * delta_n * n1
+        self.mean += delta_n
+        self.m4 += term * delta_n ** 2 * (self.n ** 2 - 3 * self.n + 3) + 6 * delta_n ** 2 * self.m2 - 4 * delta_n * self.m3
+        self.m3 += term * delta_n * (self.n - 2) - 3 * delta_n * self.m2
+        self.m2 += term
+
+        if self._last_actual is not None:
+            actual_move = np.sign(actual - self._last_actual)
+            predicted_move = np.sign(predicted - self._last_predicted)
+            self.direction_hits += int(actual_move == predicted_move)
+            self.direction_count += 1
+        self._last_actual = actual
+        self._last_predicted = predicted
+
+        return self
+
+    def merge(self, other: "StreamingMetrics") -> "StreamingMetrics":
+        """
+        Combines two shards in place (Pebay's pairwise formulas).
+        Shards are treated as separate segments: no direction pair spans the boundary.
+        """
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            self.__dict__.update(other.__dict__)
+            return self
+
+        n_a, n_b = self.n, other.n
+        n = n_a + n_b
+        delta = other.mean - self.mean
+        delta2 = delta * delta
+
+        m2 = self.m2 + other.m2 + delta2 * n_a * n_b / n
+        m3 = (
+            self.m3 + other.m3
+            + delta ** 3 * n_a * n_b * (n_a - n_b) / n ** 2
+            + 3 * delta * (n_a * other.m2 - n_b * self.m2) / n
+        )
+        m4 = (
+            self.m4 + other.m4
+            + delta2 ** 2 * n_a * n_b * (n_a ** 2 - n_a * n_b + n_b ** 2) / n ** 3
+            + 6 * delta2 * (n_a ** 2 * other.m2 + n_b ** 2 * self.m2) / n ** 2
+            + 4 * delta * (n_a * other.m3 - n_b * self.m3) / n
+        )
+
+        self.mean += delta * n_b / n
+        self.m2, self.m3, self.m4 = m2, m3, m4
+        self.n = n
+        self.sum_abs += other.sum_abs
+        self.sum_sq += other.sum_sq
+        self.sum_ape += other.sum_ape
+        self.ape_count += other.ape_count
+        self.direction_hits += other.direction_hits
+        self.direction_count += other.direction_count
+        self._last_actual = other._last_actual
+        self._last_predicted = other._last_predicted
+        return self
+
+    # -------------------- RESULTS --------------------
+
+    def result(self) -> Dict[str, float]:
+        if self.n == 0:
+            return {"Observations": 0}
+
+        variance = self.m2 / self.n
+        std = math.sqrt(variance) + EPS
+
+        return {
+            "Observations": self.n,
+            "MAE": self.sum_abs / self.n,
+            "RMSE": math.sqrt(self.sum_sq / self.n),
+            "MAPE": self.sum_ape / self.ape_count * 100 if self.ape_count else float("nan"),
+            "Bias": self.mean,
+            "Directional Accuracy": (
+                self.direction_hits / self.direction_count * 100 if self.direction_count else float("nan")
+            ),
+            "Residual Std": math.sqrt(variance),
+            "Skewness": (self.m3 / self.n) / std ** 3,
+            "Kurtosis": (self.m4 / self.n) / std ** 4,
+        }
+
+
+class WindowedStreamingMetrics:
+    """Same metrics over the last `window` observations, O(1) per update via running power sums."""
+
+    def __init__(self, window: int = 20):
+        self.window = window
+        # columns: residual, |residual|, ape (nan for a zero actual), direction hit (nan when undefined)
+        self._buffer = np.full((window, 4), np.nan)
+        self._sums = np.zeros(4)
+        self._power_sums = np.zeros(4)  # sum r, r^2, r^3, r^4
+        self._position = 0
+        self.n = 0
+        self._ape_count = 0
+        self._direction_count = 0
+        self._last_actual: Optional[float] = None
+        self._last_predicted: Optional[float] = None
+
+    def update(self, actual: float, predicted: float) -> "WindowedStreamingMetrics":
+        residual = actual - predicted
+        hit = np.nan
+        if self._last_actual is not None:
+            hit = float(np.sign(actual - self._last_actual) == np.sign(predicted - self._last_predicted))
+        self._last_actual = actual
+        self._last_predicted = predicted
+
+        ape = abs(residual) / abs(actual) if actual != 0 else np.nan
+        new_row = np.array([residual, abs(residual), ape, hit])
+
+        old_row = self._buffer[self._position]
+        if self.n == self.window:
+            self._remove(old_row)
+        else:
+            self.n += 1
+
+        self._buffer[self._position] = new_row
+        self._add(new_row)
+        self._position = (self._position + 1) % self.window
+        return self
+
+    def _add(self, row: np.ndarray):
+        self._sums[:2] += row[:2]
+        self._power_sums += row[0] ** np.arange(1, 5)
+        if not np.isnan(row[2]):
+            self._sums[2] += row[2]
+            self._ape_count += 1
+        if not np.isnan(row[3]):
+            self._sums[3] += row[3]
+            self._direction_count += 1
+
+    def _remove(self, row: np.ndarray):
+        self._sums[:2] -= row[:2]
+        self._power_sums -= row[0] ** np.arange(1, 5)
+        if not np.isnan(row[2]):
+            self._sums[2] -= row[2]
+            self._ape_count -= 1
+        if not np.isnan(row[3]):
+            self._sums[3] -= row[3]
+            self._direction_count -= 1
+
+    def result(self) -> Dict[str, float]:
+        if self.n == 0:
+            return {"Observations": 0}
+
+        n = self.n
+        s1, s2, s3, s4 = self._power_sums / n
+        variance = max(s2 - s1 ** 2, 0.0)
+        std = math.sqrt(variance) + EPS
+        m3 = s3 - 3 * s1 * s2 + 2 * s1 ** 3
+        m4 = s4 - 4 * s1 * s3 + 6 * s1 ** 2 * s2 - 3 * s1 ** 4
+
+        return {
+            "Observations": n,
+            "MAE": self._sums[1] / n,
+            "RMSE": math.sqrt(max(s2, 0.0)),
+            "MAPE": self._sums[2] / self._ape_count * 100 if self._ape_count else float("nan"),
+            "Bias": s1,
+            "Directional Accuracy": (
+                self._sums[3] / self._direction_count * 100 if self._direction_count else float("nan")
+            ),
+            "Residual Std": math.sqrt(variance),
+            "Skewness": m3 / std ** 3,
+            "Kurtosis": m4 / std ** 4,
+        }
+
+
+class ForecastMonitor:
+    """Scores a published forecast against realized prices as they arrive."""
+
+    def __init__(self, forecast, origin: pd.Timestamp, window: int = 20):
+        self.forecast = np.asarray(forecast, dtype=float)
+        self.origin = origin
+        self.metrics = StreamingMetrics()
+        self.recent = WindowedStreamingMetrics(window)
+        self.consumed = 0
+
+    def observe(self, series: pd.Series) -> Dict[str, Dict[str, float]]:
+        """Feeds realized values after the forecast origin that haven't been seen yet (step-aligned)."""
+        realized = series[series.index > self.origin].to_numpy(dtype=float)
+        available = min(len(realized), len(self.forecast))
+
+        for step in range(self.consumed, available):
+            self.metrics.update(realized[step], self.forecast[step])
+            self.recent.update(realized[step], self.forecast[step])
+        self.consumed = max(self.consumed, available)
+
+        return self.result()
+
+    def result(self) -> Dict[str, Dict[str, float]]:
+        return {"cumulative": self.metrics.result(), "recent": self.recent.result()}
+
+
+# -------------------- GUI FRIENDLY FUNCTION --------------------
+
+def monitor_forecast(forecast, origin: pd.Timestamp, window: int = 20) -> ForecastMonitor:
+    return ForecastMonitor(forecast, origin, window)
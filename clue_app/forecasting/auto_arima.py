@@ -1,78 +1,304 @@
-"""
-Auto ARIMA Model Module for CLUE Financial Forecasting
-Improved version with stronger model search and trend awareness.
-"""
-
-import pandas as pd
-from typing import Tuple
-from pmdarima import auto_arima
-
-
-class AutoARIMAModel:
-    def __init__(self):
-        self.model = None
-        self.order = None
-
-    # -------------------- TRAINING --------------------
-
-    def fit(self, series: pd.Series):
-        """Trains optimized Auto ARIMA model on univariate series."""
-
-        self.model = auto_arima(
-            series,
-            start_p=0,
-            start_q=0,
-            max_p=6,
-            max_q=6,
-            max_d=2,
-            seasonal=False,
-            trend="t",
-            information_criterion="aic",
-            stepwise=False,     # deeper search
-            suppress_warnings=True,
-            error_action="ignore",
-            n_jobs=-1
-        )
-
-        self.order = self.model.order
-        return self
-
-    # -------------------- FORECASTING --------------------
-
-    def forecast(self, periods: int = 30) -> Tuple[pd.Series, pd.DataFrame]:
-        """Generates future forecasts with confidence intervals."""
-        if self.model is None:
-            raise ValueError("Model is not trained yet")
-
-        forecast, conf_int = self.model.predict(
-            n_periods=periods,
-            return_conf_int=True
-        )
-
-        forecast_series = pd.Series(forecast, name="Forecast")
-        conf_df = pd.DataFrame(conf_int, columns=["Lower CI", "Upper CI"])
-
-        return forecast_series, conf_df
-
-    # -------------------- EVALUATION --------------------
-
-    def predict_in_sample(self) -> pd.Series:
-        """Returns predictions on training data."""
-        if self.model is None:
-            raise ValueError("Model is not trained yet")
-
-        predictions = self.model.predict_in_sample()
-        return pd.Series(predictions, name="Predicted")
-
-
-# -------------------- GUI FRIENDLY FUNCTIONS --------------------
-
-def train_auto_arima(series: pd.Series) -> AutoARIMAModel:
-    model = AutoARIMAModel()
-    model.fit(series)
-    return model
-
-
-def generate_forecast(series: pd.Series, periods: int = 30) -> Tuple[pd.Series, pd.DataFrame]:
-    model = train_auto_arima(series)
-    return model.forecast(periods)
+"""
+Auto ARIMA Model Module for CLUE Financial Forecasting
+Improved version with stronger model search and trend awareness.
+"""
+
+import inspect
+import warnings
+import numpy as np
+import pandas as pd
+from typing import List, Optional, Tuple
+from joblib import Parallel, delayed
+from pmdarima.arima import ARIMA, nsdiffs
+from pmdarima.arima.utils import is_constant
+from pmdarima.utils import diff
+from statsmodels.tools.sm_exceptions import ValueWarning
+
+from core.progress import OperationCancelled, ProgressCallback, report
+from preprocessing.stationarity import differencing_order
+from preprocessing.seasonality import detect_seasonality
+
+# longest season worth a seasonal ARIMA search; longer cycles are left to Fourier features
+MAX_SEASONAL_PERIOD = 52
+
+# exhaustive search bounds (pmdarima's non-stepwise auto_arima with our settings)
+MAX_P = MAX_Q = 6
+MAX_SEASONAL_P = MAX_SEASONAL_Q = 1
+MAX_ORDER = 5
+
+
+# -------------------- CANDIDATE SEARCH --------------------
+
+def candidate_orders(n_samples: int, d: int, D: int, m: int) -> List[Tuple[tuple, tuple]]:
+    """(order, seasonal_order) pairs of the exhaustive search; m <= 1 means non-seasonal."""
+    max_p = int(min(MAX_P, n_samples // 3))
+    max_q = int(min(MAX_Q, n_samples // 3))
+
+    if m <= 1:
+        return [
+            ((p, d, q), (0, 0, 0, 0))
+            for p in range(max_p + 1)
+            for q in range(max_q + 1)
+            if p + q <= MAX_ORDER
+        ]
+
+    max_p, max_q = min(max_p, m - 1), min(max_q, m - 1)
+    return [
+        ((p, d, q), (P, D, Q, m))
+        for p in range(max_p + 1)
+        for q in range(max_q + 1)
+        for P in range(MAX_SEASONAL_P + 1)
+        for Q in range(MAX_SEASONAL_Q + 1)
+        if p + q + P + Q <= MAX_ORDER
+    ]
+
+
+def _fit_candidate(index: int, series: pd.Series, order: tuple, seasonal_order: tuple, with_intercept: bool):
+    """Fits one candidate; any failure (non-stationary, singular, optimizer) comes back with an infinite AIC."""
+    model = ARIMA(
+        order=order,
+        seasonal_order=seasonal_order,
+        trend="t",
+        with_intercept=with_intercept,
+        suppress_warnings=True,
+    )
+    try:
+        model.fit(series)
+    except Exception:
+        return index, None, np.inf
+    return index, model, model.aic()
+
+
+class AutoARIMAModel:
+    def __init__(self):
+        self.model = None
+        self.order = None
+        self.seasonal_order = None
+        self.partial = False
+        # index of the rows the state-space results cover (the trend clock starts at its first row)
+        self.index = None
+
+    # -------------------- TRAINING --------------------
+
+    def fit(
+        self,
+        series: pd.Series,
+        d: Optional[int] = None,
+        seasonal_period: Optional[int] = None,
+        progress: Optional[ProgressCallback] = None,
+    ):
+        """
+        Trains optimized Auto ARIMA model on univariate series.
+        d defaults to the (cached) ADF+KPSS differencing order so the search doesn't re-derive it.
+        Seasonal terms are searched only for a strong detected period (or the one given).
+
+        The exhaustive candidate search runs in parallel and reports every finished
+        candidate with the best AIC so far. If progress raises OperationCancelled the
+        search stops and the best candidate so far is kept (self.partial is set).
+
+        As in pmdarima's auto_arima, a constant series is fitted as ARIMA(0,0,0) and a
+        series that is constant after differencing as ARIMA(0,d,0) without a search.
+        """
+        self.partial = False
+        if is_constant(series):
+            # the intercept is the level (pmdarima leaves it out and forecasts zero)
+            return self._fit_direct(series, (0, 0, 0), (0, 0, 0, 0), True, progress)
+
+        if d is None:
+            d = differencing_order(series, max_d=2)
+
+        if seasonal_period is None:
+            seasonality = detect_seasonality(series, max_period=MAX_SEASONAL_PERIOD)
+            seasonal_period = seasonality["dominant_period"]
+
+        m = seasonal_period or 1
+        try:
+            D = nsdiffs(series, m=m, test="ocsb", max_D=1) if m > 1 else -1
+        except ValueError:
+            D = 0  # OCSB regressions all singular (e.g. a deterministic series): no seasonal differencing
+        # same constant rule as pmdarima's auto_arima (D is -1 when non-seasonal)
+        with_intercept = (d + D) in (0, 1)
+
+        differenced = series.to_numpy(dtype=float)
+        if D > 0:
+            differenced = diff(differenced, differences=D, lag=m)
+        if d > 0:
+            differenced = diff(differenced, differences=d, lag=1)
+        if is_constant(differenced):
+            # a perfect (seasonal) random walk or polynomial: nothing for the search to find
+            seasonal_order = (0, D, 0, m) if D > 0 else (0, 0, 0, 0)
+            intercept = d == 0 if D > 0 else d < 2
+            return self._fit_direct(series, (0, d, 0), seasonal_order, intercept, progress)
+
+        candidates = candidate_orders(len(series), d, max(D, 0), m)
+        results = Parallel(n_jobs=-1, return_as="generator_unordered")(
+            delayed(_fit_candidate)(i, series, order, seasonal_order, with_intercept)
+            for i, (order, seasonal_order) in enumerate(candidates)
+        )
+
+        best, best_key = None, (np.inf, np.inf)
+        for done, (index, model, aic) in enumerate(results, start=1):
+            # ties go to the earlier candidate, as in a sequential search
+            if model is not None and np.isfinite(aic) and (aic, index) < best_key:
+                best, best_key = model, (aic, index)
+
+            try:
+                report(progress, done / len(candidates), self._describe(candidates[index], aic, best))
+            except OperationCancelled:
+                results.close()  # pending candidates are never started
+                self.partial = True
+                break
+
+        if best is None:
+            if self.partial:
+                raise OperationCancelled("ARIMA search cancelled before any candidate finished")
+            raise ValueError("Could not successfully fit a viable ARIMA model to the series")
+
+        self.model = best
+        self.order = self.model.order
+        self.seasonal_order = self.model.seasonal_order
+        self.index = series.index
+        return self
+
+    def _fit_direct(self, series: pd.Series, order: tuple, seasonal_order: tuple, with_intercept: bool, progress=None):
+        self.model = ARIMA(
+            order=order,
+            seasonal_order=seasonal_order,
+            with_intercept=with_intercept,
+            suppress_warnings=True,
+        ).fit(series)
+        self.order = self.model.order
+        self.seasonal_order = self.model.seasonal_order
+        self.index = series.index
+        constant = "constant" if order[1] == seasonal_order[1] == 0 else "constant after differencing"
+        report(progress, 1.0, f"Series is {constant}: ARIMA{self.order} without a search")
+        return self
+
+    @staticmethod
+    def _describe(candidate: Tuple[tuple, tuple], aic: float, best) -> str:
+        order, seasonal_order = candidate
+        name = f"ARIMA{order}" + (f"{seasonal_order[:3]}[{seasonal_order[3]}]" if seasonal_order[3] else "")
+        if best is None:
+            return f"{name} AIC {aic:.1f}"
+        return f"{name} AIC {aic:.1f} | best ARIMA{best.order} AIC {best.aic():.1f}"
+
+    # -------------------- FORECASTING --------------------
+
+    def forecast(self, periods: int = 30) -> Tuple[pd.Series, pd.DataFrame]:
+        """Generates future forecasts with confidence intervals."""
+        if self.model is None:
+            raise ValueError("Model is not trained yet")
+
+        forecast, conf_int = self.model.predict(
+            n_periods=periods,
+            return_conf_int=True
+        )
+
+        forecast_series = pd.Series(forecast, name="Forecast")
+        conf_df = pd.DataFrame(conf_int, columns=["Lower CI", "Upper CI"])
+
+        return forecast_series, conf_df
+
+    def simulate(self, periods: int = 30, n_paths: int = 1000, random_state: Optional[int] = None) -> np.ndarray:
+        """
+        Simulates future price paths from the fitted state-space model.
+        All paths are drawn in one vectorized call; returns float32 (n_paths x periods).
+        """
+        if self.model is None:
+            raise ValueError("Model is not trained yet")
+
+        results = self.model.arima_res_
+        # statsmodels >= 0.15 renamed random_state to rng
+        seed_arg = "rng" if "rng" in inspect.signature(results.simulate).parameters else "random_state"
+
+        paths = results.simulate(
+            nsimulations=periods,
+            repetitions=n_paths,
+            anchor="end",
+            **{seed_arg: np.random.default_rng(random_state)},
+        )
+
+        return np.asarray(paths, dtype=np.float32).reshape(periods, n_paths).T
+
+    # -------------------- INCREMENTAL UPDATES --------------------
+
+    def one_step_residuals(self, series: pd.Series) -> np.ndarray:
+        """
+        One-step-ahead errors over `series` using the fitted parameters.
+        Observations after the training window are genuinely out-of-sample.
+        """
+        if self.model is None:
+            raise ValueError("Model is not trained yet")
+
+        results = self._apply(series)
+        return series.to_numpy(dtype=float) - np.asarray(results.fittedvalues, dtype=float)
+
+    def refit(self, series: pd.Series, progress: Optional[ProgressCallback] = None) -> "AutoARIMAModel":
+        """Re-estimates the parameters of the chosen order on `series` (no order search)."""
+        if self.model is None:
+            raise ValueError("Model is not trained yet")
+
+        report(progress, 0.0, f"Refitting ARIMA{self.order} on {len(series)} observations")
+        self.model.fit(series)
+        self.index = series.index
+        report(progress, 1.0, "Refitted")
+        return self
+
+    def refresh(self, series: pd.Series) -> "AutoARIMAModel":
+        """Re-filters the model over an extended series without re-estimating parameters."""
+        if self.model is None:
+            raise ValueError("Model is not trained yet")
+
+        self.model.arima_res_ = self._apply(series)
+        self.index = series.index
+        return self
+
+    def _apply(self, series: pd.Series):
+        """
+        The fitted results filtered over `series`. The time-trend clock carries on
+        from the covered rows, so a window that dropped its oldest rows (or gained
+        earlier ones) is not silently re-based onto t = 1.
+        """
+        results = self.model.arima_res_
+        offset = results.model.trend_offset + self._shift(series.index)
+        with warnings.catch_warnings():
+            # trading-day indexes carry no frequency; statsmodels warns on every apply
+            warnings.simplefilter("ignore", ValueWarning)
+            return results.apply(series, refit=False, trend_offset=offset)
+
+    def _shift(self, index: pd.Index) -> int:
+        """Rows from the first covered row to the first row of `index` (negative when earlier)."""
+        if self.index is None or not len(index) or not len(self.index):
+            return 0
+        if index[0] in self.index:
+            return int(self.index.get_loc(index[0]))
+        if self.index[0] in index:
+            return -int(index.get_loc(self.index[0]))
+        return 0
+
+    # -------------------- EVALUATION --------------------
+
+    def predict_in_sample(self) -> pd.Series:
+        """Returns predictions on training data."""
+        if self.model is None:
+            raise ValueError("Model is not trained yet")
+
+        predictions = self.model.predict_in_sample()
+        return pd.Series(predictions, name="Predicted")
+
+
+# -------------------- GUI FRIENDLY FUNCTIONS --------------------
+
+def train_auto_arima(
+    series: pd.Series,
+    d: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+) -> AutoARIMAModel:
+    model = AutoARIMAModel()
+    model.fit(series, d=d, progress=progress)
+    return model
+
+
+def generate_forecast(series: pd.Series, periods: int = 30) -> Tuple[pd.Series, pd.DataFrame]:
+    model = train_auto_arima(series)
+    return model.forecast(periods)
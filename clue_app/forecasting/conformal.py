@@ -0,0 +1,127 @@
+"""
+Conformal Prediction Interval Module for CLUE Financial Forecasting
+Model-agnostic interval layer built from out-of-sample residuals.
+- Residuals are collected per forecast step (horizon)
+- Sorted once at calibration, quantiles are then index lookups
+- Works for any point model (XGBoost, ensembles, future models)
+"""
+
+import math
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+from forecasting.xgboost_model import XGBoostModel
+from preprocessing.seasonality import fourier_period
+
+
+class ConformalIntervals:
+    def __init__(self, residuals: np.ndarray):
+        """
+        residuals: (n_windows x horizon) signed out-of-sample errors (actual - forecast)
+        """
+        residuals = np.asarray(residuals, dtype=float)
+        if residuals.ndim == 1:
+            residuals = residuals[:, None]
+        if residuals.shape[0] == 0:
+            raise ValueError("At least one calibration window is required")
+
+        self.sorted_residuals = np.sort(residuals, axis=0)
+        self._offsets: Dict[float, Tuple[np.ndarray, np.ndarray]] = {}
+
+    @property
+    def n_calibration(self) -> int:
+        return self.sorted_residuals.shape[0]
+
+    @property
+    def horizon(self) -> int:
+        return self.sorted_residuals.shape[1]
+
+    # -------------------- QUANTILES --------------------
+
+    def offsets(self, alpha: float = 0.05) -> Tuple[np.ndarray, np.ndarray]:
+        """Lower / upper residual quantiles per horizon step for coverage 1 - alpha."""
+        if not 0 < alpha < 1:
+            raise ValueError("alpha must be between 0 and 1")
+
+        if alpha not in self._offsets:
+            n = self.n_calibration
+            # finite-sample conformal ranks, clipped to the available windows
+            upper_rank = min(math.ceil((n + 1) * (1 - alpha / 2)), n) - 1
+            lower_rank = max(math.floor((n + 1) * (alpha / 2)), 1) - 1
+            self._offsets[alpha] = (
+                self.sorted_residuals[lower_rank],
+                self.sorted_residuals[upper_rank],
+            )
+
+        return self._offsets[alpha]
+
+    # -------------------- INTERVALS --------------------
+
+    def intervals(self, forecast: pd.Series, alpha: float = 0.05) -> pd.DataFrame:
+        """Applies the calibrated offsets to a point forecast."""
+        lower, upper = self.offsets(alpha)
+        values = np.asarray(forecast, dtype=float)
+
+        # steps beyond the calibrated horizon reuse the widest (last) step
+        steps = np.minimum(np.arange(len(values)), self.horizon - 1)
+
+        return pd.DataFrame(
+            {
+                "Lower CI": values + lower[steps],
+                "Upper CI": values + upper[steps],
+            },
+            index=getattr(forecast, "index", None),
+        )
+
+
+# -------------------- RESIDUAL COLLECTION --------------------
+
+def xgboost_residuals(
+    series: pd.Series,
+    horizon: int = 30,
+    calibration_size: int = 120,
+    target_column: str = "Close",
+) -> np.ndarray:
+    """
+    Split-conformal residuals for XGBoost with a single fit.
+    The model is trained before the calibration block, then every
+    calibration row is used as a forecast origin in one batched pass.
+    """
+    model = XGBoostModel()
+    model.fourier_period = fourier_period(series)
+
+    featured_df = model.build_features(series, target_column)
+    X = featured_df.drop(columns=[target_column])
+    y = featured_df[target_column].to_numpy(dtype=float)
+
+    calibration_size = min(max(calibration_size, 2 * horizon), len(featured_df) // 2)
+    n_origins = calibration_size - horizon + 1
+    if n_origins < 1:
+        raise ValueError("Series is too short for conformal calibration")
+
+    split = len(featured_df) - calibration_size
+    model.fit(X.iloc[:split], featured_df[target_column].iloc[:split])
+
+    predictions = model.recursive_forecast_batch(X.iloc[split:split + n_origins], horizon)
+
+    # actuals[i, j] = y[split + i + j]
+    windows = split + np.arange(n_origins)[:, None] + np.arange(horizon)[None, :]
+    return y[windows] - predictions
+
+
+def ensemble_residuals(model, horizon: int = 30) -> np.ndarray:
+    """
+    Residuals for a fitted EnsembleModel from its blended one-step backtest errors.
+    Multi-step windows would need every member refit per origin, so the one-step
+    errors are widened by sqrt(h), the way random-walk price errors compound.
+    """
+    one_step = np.asarray(model.backtest_residuals(), dtype=float)
+    return one_step[:, None] * np.sqrt(np.arange(1, horizon + 1))[None, :]
+
+
+# -------------------- GUI FRIENDLY FUNCTION --------------------
+
+def conformal_intervals(forecast: pd.Series, residuals: np.ndarray, alpha: float = 0.05) -> pd.DataFrame:
+    return ConformalIntervals(residuals).intervals(forecast, alpha)
@@ -0,0 +1,212 @@
+"""
+Ensemble Model Module for CLUE Financial Forecasting
+Blends the forecasts of registered models with weights fitted on
+backtest predictions.
+- Members are trained concurrently
+- Weights via non-negative least squares or inverse-error weighting
+- Member predictions are cached, so re-weighting never refits
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.optimize import nnls
+
+from forecasting.base_model import BaseModel
+from forecasting.auto_arima import train_auto_arima
+from forecasting.xgboost_model import train_xgboost_on_series
+
+
+# -------------------- MEMBER REGISTRY --------------------
+
+# name -> (train on price series, forecast n periods as 1-D array)
+MemberSpec = Tuple[Callable[[pd.Series], object], Callable[[object, int], np.ndarray]]
+
+_MEMBER_REGISTRY: Dict[str, MemberSpec] = {
+    "AUTO_ARIMA": (
+        train_auto_arima,
+        lambda model, periods: np.asarray(model.forecast(periods)[0], dtype=float),
+    ),
+    "XGBOOST": (
+        train_xgboost_on_series,
+        lambda model, periods: np.asarray(model.forecast(periods), dtype=float),
+    ),
+}
+
+
+def register_member(name: str, train_fn: Callable, forecast_fn: Callable):
+    """Makes a new model type available as an ensemble member."""
+    _MEMBER_REGISTRY[name] = (train_fn, forecast_fn)
+
+
+def available_members() -> Tuple[str, ...]:
+    return tuple(_MEMBER_REGISTRY)
+
+
+# -------------------- WEIGHT SOLVERS --------------------
+
+def _error_matrix(residuals: np.ndarray, y_true: np.ndarray, metric: str) -> np.ndarray:
+    """Per-member error for a (horizon x members) residual matrix."""
+    if metric == "mae":
+        return np.mean(np.abs(residuals), axis=0)
+    if metric == "mse":
+        return np.mean(residuals ** 2, axis=0)
+    if metric == "rmse":
+        return np.sqrt(np.mean(residuals ** 2, axis=0))
+    if metric == "mape":
+        safe_true = np.where(y_true == 0, 1e-8, y_true)
+        return np.mean(np.abs(residuals / safe_true[:, None]), axis=0) * 100
+    raise ValueError(f"Unsupported metric: {metric}")
+
+
+def inverse_error_weights(predictions: np.ndarray, y_true: np.ndarray, metric: str = "rmse") -> np.ndarray:
+    """Weights proportional to 1 / error of each member column."""
+    residuals = y_true[:, None] - predictions
+    inverse = 1.0 / (_error_matrix(residuals, y_true, metric) + 1e-8)
+    return inverse / inverse.sum()
+
+
+def nnls_weights(predictions: np.ndarray, y_true: np.ndarray) -> np.ndarray:
+    """Non-negative least squares stacking weights, normalised to sum to one."""
+    weights, _ = nnls(predictions, y_true)
+    total = weights.sum()
+    if total <= 0:
+        return np.full(predictions.shape[1], 1.0 / predictions.shape[1])
+    return weights / total
+
+
+class EnsembleModel(BaseModel):
+    def __init__(
+        self,
+        members: Iterable[str] = ("AUTO_ARIMA", "XGBOOST"),
+        weighting: str = "nnls",
+        metric: str = "rmse",
+        backtest_periods: int = 30,
+        max_workers: Optional[int] = None,
+    ):
+        self.members = tuple(members)
+        for name in self.members:
+            if name not in _MEMBER_REGISTRY:
+                raise ValueError(f"Unsupported ensemble member: {name}")
+
+        self.weighting = weighting
+        self.metric = metric
+        self.backtest_periods = backtest_periods
+        self.max_workers = max_workers or 2 * len(self.members)
+
+        self.fitted_members: Dict[str, object] = {}
+        self.weights: Optional[np.ndarray] = None
+        self.backtest_actuals: Optional[pd.Series] = None
+        self._backtest_predictions: Optional[np.ndarray] = None  # (horizon x members)
+        self._backtest_residuals: Optional[np.ndarray] = None    # one-step errors, (horizon x members)
+        self._forecast_cache: Dict[int, np.ndarray] = {}         # periods -> (periods x members)
+
+    # -------------------- TRAINING --------------------
+
+    def fit(self, X: pd.Series, y=None) -> "EnsembleModel":
+        """Backtests every member, fits blend weights, then refits members on the full series."""
+        series = X["Close"] if isinstance(X, pd.DataFrame) else X
+        if len(series) <= self.backtest_periods:
+            raise ValueError("Series is too short for the ensemble backtest window")
+
+        train_part = series.iloc[:-self.backtest_periods]
+        self.backtest_actuals = series.iloc[-self.backtest_periods:]
+
+        # backtest fits and full-history fits are independent, so run them all at once
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            backtest_jobs = {name: pool.submit(_MEMBER_REGISTRY[name][0], train_part) for name in self.members}
+            full_jobs = {name: pool.submit(_MEMBER_REGISTRY[name][0], series) for name in self.members}
+
+            self._backtest_predictions = np.column_stack([
+                _MEMBER_REGISTRY[name][1](backtest_jobs[name].result(), self.backtest_periods)
+                for name in self.members
+            ])
+            # the backtest members never saw this window, so these errors are out-of-sample
+            self._backtest_residuals = np.column_stack([
+                backtest_jobs[name].result().one_step_residuals(series)[-self.backtest_periods:]
+                for name in self.members
+            ])
+            self.fitted_members = {name: job.result() for name, job in full_jobs.items()}
+
+        self._forecast_cache = {}
+        self.reweight()
+        return self
+
+    def reweight(self, weighting: Optional[str] = None, metric: Optional[str] = None, horizon: Optional[int] = None) -> Dict[str, float]:
+        """Re-solves blend weights from cached backtest predictions (no refit)."""
+        if self._backtest_predictions is None:
+            raise ValueError("Model is not trained yet")
+
+        self.weighting = weighting or self.weighting
+        self.metric = metric or self.metric
+        horizon = min(horizon or self.backtest_periods, self.backtest_periods)
+
+        predictions = self._backtest_predictions[:horizon]
+        y_true = self.backtest_actuals.to_numpy(dtype=float)[:horizon]
+
+        if self.weighting == "nnls":
+            self.weights = nnls_weights(predictions, y_true)
+        elif self.weighting == "inverse_error":
+            self.weights = inverse_error_weights(predictions, y_true, self.metric)
+        else:
+            raise ValueError(f"Unsupported weighting: {self.weighting}")
+
+        return self.get_weights()
+
+    # -------------------- PREDICTION --------------------
+
+    def predict(self, X=None) -> pd.Series:
+        """Blended out-of-sample predictions over the backtest window."""
+        if self.weights is None:
+            raise ValueError("Model is not trained yet")
+
+        blended = self._backtest_predictions @ self.weights
+        return pd.Series(blended, index=self.backtest_actuals.index, name="Predicted")
+
+    def backtest_residuals(self) -> np.ndarray:
+        """Blended one-step out-of-sample errors over the backtest window."""
+        if self.weights is None:
+            raise ValueError("Model is not trained yet")
+        return self._backtest_residuals @ self.weights
+
+    def member_backtests(self) -> pd.DataFrame:
+        """Each member's out-of-sample predictions over the backtest window."""
+        if self._backtest_predictions is None:
+            raise ValueError("Model is not trained yet")
+        return pd.DataFrame(self._backtest_predictions, index=self.backtest_actuals.index, columns=list(self.members))
+
+    # -------------------- FORECASTING --------------------
+
+    def member_forecasts(self, periods: int = 30) -> pd.DataFrame:
+        """Per-member forecasts, cached by horizon."""
+        if not self.fitted_members:
+            raise ValueError("Model is not trained yet")
+
+        cached = [h for h in self._forecast_cache if h >= periods]
+        if cached:
+            predictions = self._forecast_cache[min(cached)][:periods]
+        else:
+            predictions = np.column_stack([
+                _MEMBER_REGISTRY[name][1](self.fitted_members[name], periods)
+                for name in self.members
+            ])
+            self._forecast_cache[periods] = predictions
+
+        return pd.DataFrame(predictions, columns=list(self.members))
+
+    def forecast(self, periods: int = 30) -> pd.Series:
+        member_df = self.member_forecasts(periods)
+        return pd.Series(member_df.to_numpy() @ self.weights, name="Forecast")
+
+    def get_weights(self) -> Dict[str, float]:
+        return {name: float(w) for name, w in zip(self.members, self.weights)}
+
+
+# -------------------- GUI FRIENDLY FUNCTIONS --------------------
+
+def train_ensemble(series: pd.Series, members: Iterable[str] = ("AUTO_ARIMA", "XGBOOST"), weighting: str = "nnls") -> EnsembleModel:
+    model = EnsembleModel(members=members, weighting=weighting)
+    model.fit(series)
+    return model
@@ -0,0 +1,137 @@
+"""
+Lookback Window Optimizer for CLUE Financial Forecasting
+Chooses how much history each model is trained on.
+- Scores a few candidate window lengths with a cheap holdout backtest
+- Picks the shortest window within a tolerance of the best error
+- Caches the choice per (model type, dataset) so fit cost stays flat
+"""
+
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from pmdarima import ARIMA
+from statsmodels.tools.sm_exceptions import ValueWarning
+
+from core.logger import get_logger
+from forecasting.xgboost_model import train_xgboost_on_series
+
+
+logger = get_logger("lookback")
+
+DEFAULT_CANDIDATES = (250, 500, 1000, 2000, 4000)
+
+
+# -------------------- CHEAP SCORERS --------------------
+
+def _arima_holdout_errors(train: pd.Series, evaluation: pd.Series) -> np.ndarray:
+    """Fixed low-order ARIMA instead of a full auto_arima search."""
+    model = ARIMA(order=(1, 1, 1), suppress_warnings=True).fit(train)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", ValueWarning)
+        results = model.arima_res_.apply(evaluation, refit=False)
+    return evaluation.to_numpy(dtype=float) - np.asarray(results.fittedvalues, dtype=float)
+
+
+def _xgboost_holdout_errors(train: pd.Series, evaluation: pd.Series) -> np.ndarray:
+    return train_xgboost_on_series(train).one_step_residuals(evaluation)
+
+
+_SCORERS: Dict[str, Callable[[pd.Series, pd.Series], np.ndarray]] = {
+    "AUTO_ARIMA": _arima_holdout_errors,
+    "XGBOOST": _xgboost_holdout_errors,
+}
+
+
+class LookbackOptimizer:
+    def __init__(
+        self,
+        candidates: Sequence[int] = DEFAULT_CANDIDATES,
+        holdout: int = 60,
+        tolerance: float = 0.05,
+        max_age_seconds: float = 30 * 24 * 3600,
+    ):
+        self.candidates = tuple(sorted(candidates))
+        self.holdout = holdout
+        self.tolerance = tolerance
+        self.max_age_seconds = max_age_seconds
+
+        self._cache: Dict[Tuple[str, str], Dict] = {}
+
+    # -------------------- PUBLIC METHODS --------------------
+
+    def select(self, model_type: str, dataset_key: str, series: pd.Series) -> int:
+        """Returns the training window length (number of observations) to use."""
+        if model_type not in _SCORERS:
+            return len(series)
+
+        key = (model_type, dataset_key)
+        cached = self._cache.get(key)
+        if cached is not None and time.time() - cached["chosen_at"] < self.max_age_seconds:
+            return min(cached["window"], len(series))
+
+        window, errors = self._evaluate(model_type, series)
+        self._cache[key] = {"window": window, "errors": errors, "chosen_at": time.time()}
+
+        logger.info(
+            "Lookback for %s on %s: %d of %d observations (holdout MAE by window: %s)",
+            model_type, dataset_key, window, len(series),
+            ", ".join(f"{w}={e:.4f}" for w, e in errors.items()),
+        )
+        return window
+
+    def trim(self, model_type: str, dataset_key: str, data):
+        """Trims a Series or a Close-column DataFrame to the selected window."""
+        series = data["Close"] if isinstance(data, pd.DataFrame) else data
+        return data.iloc[-self.select(model_type, dataset_key, series):]
+
+    def export(self, dataset_key: str) -> Dict[str, Dict]:
+        return {k[0]: dict(cached) for k, cached in self._cache.items() if k[1] == dataset_key}
+
+    def restore(self, dataset_key: str, cached: Dict[str, Dict]):
+        for model_type, choice in cached.items():
+            self._cache[(model_type, dataset_key)] = dict(choice)
+
+    def invalidate(self, dataset_key: str = None):
+        if dataset_key is None:
+            self._cache.clear()
+            return
+        for key in [k for k in self._cache if k[1] == dataset_key]:
+            del self._cache[key]
+
+    # -------------------- BACKTEST --------------------
+
+    def _evaluate(self, model_type: str, series: pd.Series) -> Tuple[int, Dict[int, float]]:
+        usable = len(series) - self.holdout
+        windows = [w for w in self.candidates if w < usable] + [usable]
+        if usable <= 0 or len(windows) == 1:
+            return len(series), {}
+
+        scorer = _SCORERS[model_type]
+
+        def score(window: int) -> float:
+            # train on `window` points before the holdout, score one-step errors on the holdout
+            start = usable - window
+            residuals = scorer(series.iloc[start:usable], series.iloc[start:])
+            return float(np.mean(np.abs(residuals[-self.holdout:])))
+
+        with ThreadPoolExecutor(max_workers=len(windows)) as pool:
+            errors = dict(zip(windows, pool.map(score, windows)))
+
+        best = min(errors.values())
+        chosen = min(w for w, e in errors.items() if e <= best * (1 + self.tolerance))
+
+        # "all usable history" means the full series once the holdout is no longer held out
+        return (len(series) if chosen == usable else chosen), errors
+
+
+# -------------------- GUI FRIENDLY FUNCTION --------------------
+
+default_optimizer = LookbackOptimizer()
+
+
+def select_training_window(model_type: str, dataset_key: str, data):
+    return default_optimizer.trim(model_type, dataset_key, data)
@@ -0,0 +1,60 @@
+"""
+Path Simulation Analytics for CLUE Financial Forecasting
+Summaries over simulated price paths (n_paths x horizon):
+- Quantile bands for fan charts
+- Value at Risk / Expected Shortfall
+- Probability of touching a price level
+"""
+
+from typing import Dict, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_QUANTILES = (0.05, 0.10, 0.25, 0.50, 0.75, 0.90, 0.95)
+
+
+def path_quantiles(paths: np.ndarray, quantiles: Sequence[float] = DEFAULT_QUANTILES) -> pd.DataFrame:
+    """Per-step quantiles of simulated paths; one column per quantile."""
+    values = np.quantile(paths, quantiles, axis=0)
+    return pd.DataFrame(values.T, columns=list(quantiles))
+
+
+def value_at_risk(paths: np.ndarray, last_price: float, alpha: float = 0.05) -> Dict[str, np.ndarray]:
+    """
+    Loss quantile of the cumulative return at every horizon step.
+    Returned as positive fractions of the last observed price.
+    """
+    returns = paths / last_price - 1.0
+    var = -np.quantile(returns, alpha, axis=0)
+
+    tail = returns <= -var
+    tail_counts = np.maximum(tail.sum(axis=0), 1)
+    expected_shortfall = -(np.where(tail, returns, 0.0).sum(axis=0) / tail_counts)
+
+    return {
+        "VaR": var,
+        "Expected Shortfall": expected_shortfall,
+    }
+
+
+def probability_of_hitting(paths: np.ndarray, level: float, last_price: float) -> float:
+    """Share of paths that touch `level` at any step before the horizon."""
+    if level >= last_price:
+        touched = paths.max(axis=1) >= level
+    else:
+        touched = paths.min(axis=1) <= level
+    return float(touched.mean())
+
+
+# -------------------- GUI FRIENDLY FUNCTION --------------------
+
+def simulation_summary(paths: np.ndarray, last_price: float, alpha: float = 0.05) -> Dict:
+    risk = value_at_risk(paths, last_price, alpha)
+    return {
+        "quantiles": path_quantiles(paths),
+        "VaR": float(risk["VaR"][-1]),
+        "Expected Shortfall": float(risk["Expected Shortfall"][-1]),
+        "n_paths": paths.shape[0],
+    }
@@ -1,69 +1,256 @@
-"""
-XGBoost Model Module for CLUE Financial Forecasting
-Handles training and forecasting for engineered univariate time series features.
-Designed for AutoML pipeline and GUI integration.
-"""
-
-import pandas as pd
-from typing import Tuple
-from xgboost import XGBRegressor
-
-
-class XGBoostModel:
-    def __init__(self):
-        self.model = XGBRegressor(
-            n_estimators=500,
-            learning_rate=0.05,
-            max_depth=5,
-            subsample=0.8,
-            colsample_bytree=0.8,
-            objective="reg:squarederror"
-        )
-
-    # -------------------- TRAINING --------------------
-
-    def fit(self, X_train: pd.DataFrame, y_train: pd.Series):
-        self.model.fit(X_train, y_train)
-        return self
-
-    # -------------------- PREDICTION --------------------
-
-    def predict(self, X_test: pd.DataFrame) -> pd.Series:
-        predictions = self.model.predict(X_test)
-        return pd.Series(predictions, index=X_test.index, name="Predicted")
-
-    # -------------------- FORECASTING --------------------
-
-    def recursive_forecast(self, last_known_data: pd.DataFrame, future_steps: int = 30) -> pd.Series:
-        """
-        Recursive forecasting for future time steps using last available row.
-        """
-        predictions = []
-        current_input = last_known_data.copy()
-
-        for _ in range(future_steps):
-            pred = self.model.predict(current_input)[0]
-            predictions.append(pred)
-
-            # shift lag features
-            lag_cols = [col for col in current_input.columns if col.startswith("lag_")]
-            for lag in reversed(lag_cols):
-                lag_num = int(lag.split("_")[1])
-                if lag_num == 1:
-                    current_input[lag] = pred
-                else:
-                    current_input[f"lag_{lag_num}"] = current_input[f"lag_{lag_num-1}"]
-        
-        return pd.Series(predictions, name="Forecast")
-
-
-# -------------------- GUI FRIENDLY FUNCTIONS --------------------
-
-def train_xgboost_model(X_train: pd.DataFrame, y_train: pd.Series) -> XGBoostModel:
-    model = XGBoostModel()
-    model.fit(X_train, y_train)
-    return model
-
-
-def predict_xgboost(model: XGBoostModel, X_test: pd.DataFrame) -> pd.Series:
-    return model.predict(X_test)
\ No newline at end of file
+"""
+XGBoost Model Module for CLUE Financial Forecasting
+Handles training and forecasting for engineered univariate time series features.
+Designed for AutoML pipeline and GUI integration.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Callable, List, Optional, Tuple
+from xgboost import XGBRegressor
+from xgboost.callback import TrainingCallback
+
+from core.progress import OperationCancelled, ProgressCallback, report
+from preprocessing.feature_engineering import create_features
+from preprocessing.seasonality import fourier_period
+
+
+class _RoundProgress(TrainingCallback):
+    """Reports the eval loss after every boosting round; stops boosting on OperationCancelled."""
+
+    def __init__(self, progress: ProgressCallback, n_rounds: int):
+        super().__init__()
+        self.progress = progress
+        self.n_rounds = n_rounds
+        self.rounds = 0
+        self.cancelled = False
+
+    def after_iteration(self, model, epoch: int, evals_log) -> bool:
+        self.rounds = epoch + 1
+        metric, losses = next(iter(next(iter(evals_log.values())).items()))
+        try:
+            report(self.progress, self.rounds / self.n_rounds, f"round {self.rounds}/{self.n_rounds} {metric} {losses[-1]:.4f}")
+        except OperationCancelled:
+            self.cancelled = True
+            return True  # keep the trees built so far
+        return False
+
+
+class XGBoostModel:
+    def __init__(self):
+        self.last_features = None
+        self.fourier_period = None
+        self.step_offset = None  # spacing of the training rows, to date future steps
+        self.partial = False
+        self.model = XGBRegressor(
+            n_estimators=500,
+            learning_rate=0.05,
+            max_depth=5,
+            subsample=0.8,
+            colsample_bytree=0.8,
+            objective="reg:squarederror"
+        )
+
+    # -------------------- TRAINING --------------------
+
+    def fit(
+        self,
+        X_train: pd.DataFrame,
+        y_train: pd.Series,
+        progress: Optional[ProgressCallback] = None,
+        eval_set: Optional[List[Tuple[pd.DataFrame, pd.Series]]] = None,
+    ):
+        """
+        progress receives the eval loss of every boosting round (on eval_set,
+        else the training data). If it raises OperationCancelled, boosting
+        stops and the trees built so far are kept (self.partial is set).
+        """
+        if progress is None:
+            self.model.fit(X_train, y_train)
+        else:
+            callback = _RoundProgress(progress, self.model.get_params()["n_estimators"])
+            # callbacks are model params; never leave one behind on the estimator
+            self.model.set_params(callbacks=[callback])
+            try:
+                self.model.fit(X_train, y_train, eval_set=eval_set or [(X_train, y_train)], verbose=False)
+            finally:
+                self.model.set_params(callbacks=None)
+
+            if callback.cancelled and callback.rounds == 0:
+                raise OperationCancelled("XGBoost cancelled before the first round")
+            self.partial = callback.cancelled
+
+        self.last_features = X_train.iloc[[-1]]
+        self.step_offset = _step_offset(X_train.index)
+        return self
+
+    # -------------------- PREDICTION --------------------
+
+    def predict(self, X_test: pd.DataFrame) -> pd.Series:
+        predictions = self.model.predict(X_test)
+        return pd.Series(predictions, index=X_test.index, name="Predicted")
+
+    # -------------------- FORECASTING --------------------
+
+    def recursive_forecast(self, last_known_data: pd.DataFrame, future_steps: int = 30) -> pd.Series:
+        """
+        Recursive forecasting for future time steps using last available row.
+        """
+        predictions = []
+        current_input = last_known_data.copy()
+        seasonal_clock = self._seasonal_clock(current_input)
+
+        for step in range(future_steps):
+            pred = self.model.predict(current_input)[0]
+            predictions.append(pred)
+            self._set_fourier(current_input, seasonal_clock, step + 1)
+
+            # shift lag features
+            lag_cols = [col for col in current_input.columns if col.startswith("lag_")]
+            for lag in reversed(lag_cols):
+                lag_num = int(lag.split("_")[1])
+                if lag_num == 1:
+                    current_input[lag] = pred
+                else:
+                    current_input[f"lag_{lag_num}"] = current_input[f"lag_{lag_num-1}"]
+        
+        return pd.Series(predictions, name="Forecast")
+
+    def recursive_forecast_batch(self, start_rows: pd.DataFrame, future_steps: int = 30) -> np.ndarray:
+        """
+        Recursive forecasting from many starting rows at once.
+        Returns an array of shape (len(start_rows), future_steps).
+        """
+        current_input = start_rows.copy()
+        lag_cols = sorted(
+            [col for col in current_input.columns if col.startswith("lag_")],
+            key=lambda col: int(col.split("_")[1]),
+        )
+        predictions = np.empty((len(start_rows), future_steps))
+        seasonal_clock = self._seasonal_clock(current_input)
+
+        for step in range(future_steps):
+            pred = self.model.predict(current_input)
+            predictions[:, step] = pred
+            self._set_fourier(current_input, seasonal_clock, step + 1)
+
+            # shift lag features for every row in one assignment
+            if lag_cols:
+                current_input[lag_cols[1:]] = current_input[lag_cols[:-1]].to_numpy()
+                current_input[lag_cols[0]] = pred
+
+        return predictions
+
+    # -------------------- SEASONAL TERMS --------------------
+
+    def _seasonal_clock(self, rows: pd.DataFrame) -> Optional[Callable[[int], np.ndarray]]:
+        """
+        steps_ahead -> seasonal phase (in cycles) of the row that many steps after
+        each starting row, computed the way FeatureEngineer does; None without Fourier terms.
+        """
+        if self.fourier_period is None or "fourier_sin_1" not in rows.columns:
+            return None
+
+        if isinstance(self.fourier_period, pd.Timedelta) and isinstance(rows.index, pd.DatetimeIndex):
+            if self.step_offset is None:
+                return None
+            start = rows.index
+            return lambda steps: np.asarray(
+                (start + steps * self.step_offset - pd.Timestamp(0)) / self.fourier_period, dtype=float
+            )
+
+        # positional phases: read back from the first harmonic, one period per fourier_period rows
+        start = np.arctan2(rows["fourier_sin_1"].to_numpy(), rows["fourier_cos_1"].to_numpy()) / (2 * np.pi)
+        return lambda steps: start + steps / float(self.fourier_period)
+
+    @staticmethod
+    def _set_fourier(rows: pd.DataFrame, seasonal_clock, steps_ahead: int):
+        if seasonal_clock is None:
+            return
+        cycles = seasonal_clock(steps_ahead)
+        k = 1
+        while f"fourier_sin_{k}" in rows.columns:
+            rows[f"fourier_sin_{k}"] = np.sin(2 * np.pi * k * cycles)
+            rows[f"fourier_cos_{k}"] = np.cos(2 * np.pi * k * cycles)
+            k += 1
+
+    # -------------------- INCREMENTAL UPDATES --------------------
+
+    def build_features(self, series: pd.Series, target_column: str = "Close") -> pd.DataFrame:
+        """Feature frame for a raw price series, using the seasonality chosen at training."""
+        return create_features(
+            series.to_frame(name=target_column),
+            target_column=target_column,
+            fourier_period=self.fourier_period,
+        )
+
+    def one_step_residuals(self, series: pd.Series, target_column: str = "Close") -> np.ndarray:
+        """One-step-ahead errors over the feature rows of a raw price series."""
+        featured_df = self.build_features(series, target_column)
+        predictions = self.model.predict(featured_df.drop(columns=[target_column]))
+        return featured_df[target_column].to_numpy(dtype=float) - predictions
+
+    def refit(
+        self,
+        series: pd.Series,
+        target_column: str = "Close",
+        progress: Optional[ProgressCallback] = None,
+    ) -> "XGBoostModel":
+        """Retrains on a raw price series with the seasonality chosen at the first fit."""
+        featured_df = self.build_features(series, target_column)
+        return self.fit(featured_df.drop(columns=[target_column]), featured_df[target_column], progress=progress)
+
+    def refresh(self, series: pd.Series, target_column: str = "Close") -> "XGBoostModel":
+        """Moves the forecast origin to the end of `series` without retraining."""
+        featured_df = self.build_features(series, target_column)
+        self.last_features = featured_df.drop(columns=[target_column]).iloc[[-1]]
+        return self
+
+    def forecast(self, periods: int = 30) -> pd.Series:
+        """Recursive forecast starting from the last training row."""
+        if self.last_features is None:
+            raise ValueError("Model is not trained yet")
+
+        return self.recursive_forecast(self.last_features, periods)
+
+
+def _step_offset(index: pd.Index):
+    """The index frequency (business days keep skipping weekends), else the median spacing."""
+    if not isinstance(index, pd.DatetimeIndex) or len(index) < 3:
+        return None
+    freq = pd.infer_freq(index[-64:])
+    if freq is not None:
+        return pd.tseries.frequencies.to_offset(freq)
+    return pd.Series(index).diff().median()
+
+
+# -------------------- GUI FRIENDLY FUNCTIONS --------------------
+
+def train_xgboost_model(
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    progress: Optional[ProgressCallback] = None,
+) -> XGBoostModel:
+    model = XGBoostModel()
+    model.fit(X_train, y_train, progress=progress)
+    return model
+
+
+def predict_xgboost(model: XGBoostModel, X_test: pd.DataFrame) -> pd.Series:
+    return model.predict(X_test)
+
+
+def train_xgboost_on_series(
+    series: pd.Series,
+    target_column: str = "Close",
+    progress: Optional[ProgressCallback] = None,
+) -> XGBoostModel:
+    """
+    Builds lag/rolling features from a raw price series and trains on all rows.
+    Fourier terms are added only when a strong seasonal period is detected.
+    """
+    model = XGBoostModel()
+    model.fourier_period = fourier_period(series)
+
+    featured_df = model.build_features(series, target_column)
+    return model.fit(featured_df.drop(columns=[target_column]), featured_df[target_column], progress=progress)
@@ -1,25 +1,58 @@
-"""
-CLUE Application Entry Point
-Initializes PySide6 Application and launches the MainWindow
-connected with UIController.
-"""
-
-import sys
-from PySide6.QtWidgets import QApplication
-
-from ui.main_window import MainWindow
-from ui.controllers.ui_controller import UIController
-
-
-def main():
-    app = QApplication(sys.argv)
-
-    window = MainWindow()
-    controller = UIController(window)
-
-    window.show()
-    sys.exit(app.exec())
-
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
+"""
+CLUE Application Entry Point
+Initializes PySide6 Application and launches the MainWindow
+connected with UIController.
+Startup timings (imports, window, first paint) are written to the log.
+"""
+
+import time
+
+STARTED = time.perf_counter()
+
+import sys
+from PySide6.QtCore import QEvent, QObject
+from PySide6.QtWidgets import QApplication
+
+from core.logger import get_logger
+from ui.main_window import MainWindow
+from ui.controllers.ui_controller import UIController
+
+
+logger = get_logger("startup")
+
+
+class FirstPaintWatcher(QObject):
+    """Logs time-to-first-paint of a widget, then runs `then` once."""
+
+    def __init__(self, widget, then):
+        super().__init__(widget)
+        self.widget = widget
+        self.then = then
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            self.widget.removeEventFilter(self)
+            logger.info("First paint after %.0f ms", (time.perf_counter() - STARTED) * 1000)
+            self.then()
+        return False
+
+
+def main():
+    logger.info("Imports done after %.0f ms", (time.perf_counter() - STARTED) * 1000)
+    app = QApplication(sys.argv)
+
+    window = MainWindow()
+    controller = UIController(window)
+    app.aboutToQuit.connect(controller.shutdown)
+    logger.info("Window built after %.0f ms", (time.perf_counter() - STARTED) * 1000)
+
+    # heavy libraries load in the background once the welcome page is on screen
+    FirstPaintWatcher(window.welcome_page, controller.warm_up)
+
+    window.show()
+    sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    main()
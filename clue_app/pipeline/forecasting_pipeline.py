@@ -1,35 +1,97 @@
-from typing import Dict
-
-from core.data_loader import load_financial_data
-from forecasting.auto_arima import train_auto_arima
-from forecasting.xgboost_model import train_xgboost_model, predict_xgboost
-from preprocessing.feature_engineering import create_features
-
-
-def run_forecast(model_type: str, source_config: Dict, forecast_periods: int = 30):
-    df = load_financial_data(**source_config)
-    close_series = df["Close"]
-
-    if model_type == "AUTO_ARIMA":
-        model = train_auto_arima(close_series)
-        forecast, conf_int = model.forecast(forecast_periods)
-
-        return {
-            "model_type": model_type,
-            "forecast": forecast,
-            "confidence_intervals": conf_int,
-        }
-
-    elif model_type == "XGBOOST":
-        df_features = create_features(df)
-        model = train_xgboost_model(df_features)
-        forecast = predict_xgboost(model, df_features, forecast_periods)
-
-        return {
-            "model_type": model_type,
-            "forecast": forecast,
-            "confidence_intervals": None,
-        }
-
-    else:
-        raise ValueError(f"Unsupported model: {model_type}")
+from typing import Dict, Optional
+
+import pandas as pd
+
+from core.data_loader import load_financial_data
+from core.progress import ProgressCallback, report, scaled
+from forecasting.ensemble import train_ensemble
+from forecasting.conformal import ConformalIntervals, conformal_intervals, ensemble_residuals, xgboost_residuals
+from forecasting.simulation import simulation_summary
+from forecasting.lookback import select_training_window
+from evaluation.streaming import ForecastMonitor
+from pipeline.retraining import dataset_key, default_controller
+
+
+def run_forecast(
+    model_type: str,
+    source_config: Dict,
+    forecast_periods: int = 30,
+    n_paths: int = 2000,
+    progress: Optional[ProgressCallback] = None,
+    df: Optional[pd.DataFrame] = None,
+):
+    """
+    progress(fraction, message) is called between stages and may raise to cancel.
+    df is the already loaded data for source_config; it is loaded here when omitted.
+    """
+    report(progress, 0.0, "Loading data")
+    if df is None:
+        df = load_financial_data(**source_config)
+    close_series = df["Close"]
+    key = dataset_key(source_config)
+
+    if model_type == "AUTO_ARIMA":
+        report(progress, 0.1, "Fitting model")
+        train_series = select_training_window(model_type, key, close_series)
+        model = default_controller.get_model(model_type, key, train_series, progress=scaled(progress, 0.1, 0.7))
+        forecast, conf_int = model.forecast(forecast_periods)
+
+        report(progress, 0.7, "Simulating paths")
+        paths = model.simulate(forecast_periods, n_paths=n_paths)
+
+        return {
+            "model_type": model_type,
+            "forecast": forecast,
+            "confidence_intervals": conf_int,
+            "simulation": simulation_summary(paths, float(close_series.iloc[-1])),
+            "origin": close_series.index[-1],
+        }
+
+    elif model_type == "XGBOOST":
+        report(progress, 0.1, "Fitting model")
+        train_series = select_training_window(model_type, key, close_series)
+        model = default_controller.get_model(model_type, key, train_series, progress=scaled(progress, 0.1, 0.5))
+        forecast = model.forecast(forecast_periods)
+
+        report(progress, 0.5, "Calibrating intervals")
+        # XGBoost has no native intervals, so calibrate them on held-out residuals;
+        # the calibration fit runs once per fitted model and horizon, not per forecast
+        calibration = default_controller.calibration(
+            model_type, key, forecast_periods,
+            lambda: ConformalIntervals(xgboost_residuals(train_series, horizon=forecast_periods)),
+        )
+        conf_int = calibration.intervals(forecast)
+
+        return {
+            "model_type": model_type,
+            "forecast": forecast,
+            "confidence_intervals": conf_int,
+            "origin": close_series.index[-1],
+        }
+
+    elif model_type == "ENSEMBLE":
+        report(progress, 0.1, "Fitting ensemble members")
+        model = train_ensemble(close_series)
+        forecast = model.forecast(forecast_periods)
+
+        report(progress, 0.8, "Calibrating intervals")
+        # blended one-step backtest errors stand in for per-origin refits of every member
+        conf_int = conformal_intervals(forecast, ensemble_residuals(model, forecast_periods))
+
+        return {
+            "model_type": model_type,
+            "forecast": forecast,
+            "member_forecasts": model.member_forecasts(forecast_periods),
+            "weights": model.get_weights(),
+            "confidence_intervals": conf_int,
+            "origin": close_series.index[-1],
+        }
+
+    else:
+        raise ValueError(f"Unsupported model: {model_type}")
+
+
+def update_forecast_monitor(monitor: ForecastMonitor, source_config: Dict) -> Dict:
+    """Reloads the source and scores the published forecast on any newly realized prices."""
+    df = load_financial_data(**source_config)
+    return monitor.observe(df["Close"])
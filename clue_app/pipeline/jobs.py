@@ -0,0 +1,123 @@
+"""
+Worker Jobs for CLUE Financial Forecasting Application
+Entry points that core.worker_pool runs in its processes.
+- Price data arrives as a shared memory handle (core.worker_pool.FrameHandle)
+- Each takes the `progress` keyword of core.progress
+- Fitted models live in the worker; sessions export and restore them here
+- Qt-free and cheap to import; the pipelines load on first call,
+  which in a warmed worker has already happened
+"""
+
+import pickle
+from typing import Dict, Optional
+
+from core.lazy import lazy_module
+from core.progress import ProgressCallback, report
+from core.worker_pool import FrameHandle, read_frame
+
+
+training_pipeline = lazy_module("pipeline.training_pipeline")
+forecasting_pipeline = lazy_module("pipeline.forecasting_pipeline")
+eda_engine = lazy_module("preprocessing.eda_engine")
+eda = lazy_module("preprocessing.eda")
+forecast_plot = lazy_module("visualization.forecast_plot")
+figures = lazy_module("visualization.figure_manager")
+report_generator = lazy_module("core.report_generator")
+retraining = lazy_module("pipeline.retraining")
+lookback = lazy_module("forecasting.lookback")
+
+
+# -------------------- MODEL JOBS --------------------
+
+def train(
+    model_type: str,
+    source_config: Dict,
+    horizon: int,
+    data: FrameHandle,
+    progress: Optional[ProgressCallback] = None,
+) -> Dict:
+    return training_pipeline.run_training(
+        model_type, source_config, forecast_periods=horizon, df=read_frame(data), progress=progress
+    )
+
+
+def forecast(
+    model_type: str,
+    source_config: Dict,
+    horizon: int,
+    data: FrameHandle,
+    progress: Optional[ProgressCallback] = None,
+) -> Dict:
+    return forecasting_pipeline.run_forecast(
+        model_type, source_config, forecast_periods=horizon, df=read_frame(data), progress=progress
+    )
+
+
+# -------------------- SESSION JOBS --------------------
+# jobs for one dataset run on the same worker, so these see the models its jobs fitted
+
+def export_models(dataset_key: str, progress: Optional[ProgressCallback] = None) -> bytes:
+    return pickle.dumps(
+        {
+            "retraining": retraining.default_controller.export(dataset_key),
+            "lookback": lookback.default_optimizer.export(dataset_key),
+        },
+        pickle.HIGHEST_PROTOCOL,
+    )
+
+
+def restore_models(dataset_key: str, models: bytes, progress: Optional[ProgressCallback] = None) -> int:
+    # only reached for a session whose models the user chose to trust when opening it
+    state = pickle.loads(models)
+    retraining.default_controller.restore(dataset_key, state["retraining"])
+    lookback.default_optimizer.restore(dataset_key, state["lookback"])
+    return len(state["retraining"])
+
+
+# -------------------- REPORT JOB --------------------
+
+def build_report(
+    output_path: str,
+    model_type: str,
+    training_result: Dict,
+    forecast_result: Dict,
+    metrics: Dict,
+    data: FrameHandle,
+    progress: Optional[ProgressCallback] = None,
+) -> str:
+    report(progress, 0.0, "Reading data")
+    df = read_frame(data)
+    stats = eda_engine.compute_eda(df)
+
+    report(progress, 0.3, "Drawing charts")
+    eda_fig = eda.generate_eda_charts(df, stats, owner="report_eda")
+    forecast_fig = forecast_plot.plot_forecast(
+        df,
+        forecast_result.get("forecast"),
+        forecast_result.get("confidence_intervals"),
+        fan=forecast_result.get("simulation", {}).get("quantiles"),
+        owner="report_forecast",
+    )
+
+    report(progress, 0.7, "Writing PDF")
+    report_generator.generate_report(
+        output_path=output_path,
+        title="CLUE Forecasting Report",
+        model_results={
+            "model_type": model_type,
+            **training_result,
+        },
+        metrics=metrics,
+        eda_summary=eda.format_eda_summary(eda.eda_summary(df, stats=stats)),
+        eda_fig=eda_fig,
+        forecast_fig=forecast_fig,
+        predicted_values=forecast_result.get("forecast"),
+        confidence_intervals=forecast_result.get("confidence_intervals"),
+        metric_intervals=training_result.get("metric_intervals"),
+        notes="Generated by CLUE AI Forecasting System",
+    )
+
+    # report figures are only needed for the PDF
+    figures.figure_manager.release("report_eda")
+    figures.figure_manager.release("report_forecast")
+    return output_path
@@ -0,0 +1,268 @@
+"""
+Retraining Controller for CLUE Financial Forecasting
+Keeps one fitted model per (model type, dataset) and refits only when needed:
+- no model yet, or the stored history was rewritten (index or values)
+- the model is older than the maximum age
+- drift in the one-step residuals of new observations
+  (CUSUM, Page-Hinkley or rolling error vs the holdout baseline)
+Otherwise the existing model is re-anchored on the new data without refitting.
+"""
+
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from core.logger import get_logger
+from core.progress import ProgressCallback, scaled
+from core.utils import series_fingerprint
+from forecasting.auto_arima import train_auto_arima
+from forecasting.xgboost_model import train_xgboost_on_series
+
+
+logger = get_logger("retraining")
+
+_TRAINERS: Dict[str, Callable[..., object]] = {
+    "AUTO_ARIMA": train_auto_arima,
+    "XGBOOST": train_xgboost_on_series,
+}
+
+
+# -------------------- DRIFT STATISTICS --------------------
+
+def cusum_statistic(z: np.ndarray, drift: float = 0.5) -> float:
+    """Largest two-sided CUSUM value over standardized residuals."""
+    # S_t = max(0, S_{t-1} + x_t) equals C_t - min(0, C_1..C_t) for C = cumsum(x)
+    upper = np.cumsum(z - drift)
+    lower = np.cumsum(-z - drift)
+    s_upper = upper - np.minimum.accumulate(np.minimum(upper, 0.0))
+    s_lower = lower - np.minimum.accumulate(np.minimum(lower, 0.0))
+    return float(max(s_upper.max(), s_lower.max()))
+
+
+def page_hinkley_statistic(errors: np.ndarray, delta: float = 0.0) -> float:
+    """Page-Hinkley statistic for an upward shift in (absolute) errors."""
+    running_mean = np.cumsum(errors) / np.arange(1, len(errors) + 1)
+    m = np.cumsum(errors - running_mean - delta)
+    return float((m - np.minimum.accumulate(m)).max())
+
+
+def detect_drift(
+    residuals: np.ndarray,
+    baseline: Dict[str, float],
+    cusum_threshold: float = 5.0,
+    page_hinkley_threshold: float = 5.0,
+    error_ratio_threshold: float = 1.5,
+    window: int = 20,
+) -> Dict:
+    """Runs every detector on residuals observed since the last fit."""
+    z = (residuals - baseline["mean"]) / baseline["std"]
+    abs_z = np.abs(residuals) / baseline["std"]
+
+    cusum = cusum_statistic(z)
+    page_hinkley = page_hinkley_statistic(abs_z, delta=0.05)
+    error_ratio = float(np.mean(np.abs(residuals[-window:])) / baseline["mae"])
+
+    reasons = []
+    if cusum > cusum_threshold:
+        reasons.append(f"CUSUM {cusum:.2f} > {cusum_threshold}")
+    if page_hinkley > page_hinkley_threshold:
+        reasons.append(f"Page-Hinkley {page_hinkley:.2f} > {page_hinkley_threshold}")
+    if len(residuals) >= window and error_ratio > error_ratio_threshold:
+        reasons.append(f"rolling MAE ratio {error_ratio:.2f} > {error_ratio_threshold}")
+
+    return {
+        "drift": bool(reasons),
+        "reasons": reasons,
+        "cusum": cusum,
+        "page_hinkley": page_hinkley,
+        "error_ratio": error_ratio,
+    }
+
+
+# -------------------- CONTROLLER --------------------
+
+class RetrainingController:
+    def __init__(
+        self,
+        max_age_seconds: float = 7 * 24 * 3600,
+        holdout: int = 60,
+        cusum_threshold: float = 5.0,
+        page_hinkley_threshold: float = 5.0,
+        error_ratio_threshold: float = 1.5,
+    ):
+        self.max_age_seconds = max_age_seconds
+        self.holdout = holdout
+        self.cusum_threshold = cusum_threshold
+        self.page_hinkley_threshold = page_hinkley_threshold
+        self.error_ratio_threshold = error_ratio_threshold
+
+        self._entries: Dict[Tuple[str, str], Dict] = {}
+
+    # -------------------- PUBLIC METHODS --------------------
+
+    def get_model(
+        self,
+        model_type: str,
+        dataset_key: str,
+        series: pd.Series,
+        progress: Optional[ProgressCallback] = None,
+    ):
+        """
+        Returns an up-to-date model for the series, refitting only when required.
+        progress is forwarded to the trainer; a partial (cancelled) fit is returned but never stored.
+        """
+        if model_type not in _TRAINERS:
+            raise ValueError(f"Unsupported model type for retraining: {model_type}")
+
+        key = (model_type, dataset_key)
+        entry = self._entries.get(key)
+        reason = self._refit_reason(entry, series)
+
+        if reason is None:
+            if series.index[-1] != entry["last_index"]:
+                report = entry["last_check"]
+                logger.info(
+                    "Reusing %s for %s fitted through %s: no drift (CUSUM %.2f, PH %.2f, MAE ratio %.2f)",
+                    model_type, dataset_key, entry["fit_end"],
+                    report["cusum"], report["page_hinkley"], report["error_ratio"],
+                )
+                entry["model"].refresh(series)
+                entry["last_index"] = series.index[-1]
+                entry["window"] = series.copy()
+            return entry["model"]
+
+        logger.info("Refitting %s for %s: %s", model_type, dataset_key, reason)
+        entry = self._fit(model_type, series, progress)
+        if entry["model"].partial:
+            logger.info("Not storing partial %s fit for %s", model_type, dataset_key)
+        else:
+            self._entries[key] = entry
+        return entry["model"]
+
+    def calibration(self, model_type: str, dataset_key: str, horizon: int, build: Callable[[], object]):
+        """
+        Interval calibration for the stored model at one horizon, built on first use.
+        It lives on the model's entry, so the next refit drops it with the old model.
+        """
+        entry = self._entries.get((model_type, dataset_key))
+        if entry is None:
+            return build()  # partial fits are never stored, nor is their calibration
+
+        cached = entry.setdefault("calibration", {})
+        if horizon not in cached:
+            cached[horizon] = build()
+        return cached[horizon]
+
+    def status(self, model_type: str, dataset_key: str) -> Optional[Dict]:
+        entry = self._entries.get((model_type, dataset_key))
+        if entry is None:
+            return None
+        return {
+            "age_seconds": time.time() - entry["fitted_at"],
+            "fit_end": entry["fit_end"],
+            "last_index": entry["last_index"],
+            "baseline": dict(entry["baseline"]),
+            "last_check": entry["last_check"],
+        }
+
+    def export(self, dataset_key: str) -> Dict[str, Dict]:
+        """Stored models for one dataset by model type, for saving with a session."""
+        return {k[0]: dict(entry) for k, entry in self._entries.items() if k[1] == dataset_key}
+
+    def restore(self, dataset_key: str, entries: Dict[str, Dict]):
+        """Puts back what export() returned; ages and drift baselines carry over."""
+        for model_type, entry in entries.items():
+            self._entries[(model_type, dataset_key)] = dict(entry)
+
+    def invalidate(self, dataset_key: Optional[str] = None):
+        """Drops stored models for one dataset, or all of them."""
+        if dataset_key is None:
+            self._entries.clear()
+            return
+        for key in [k for k in self._entries if k[1] == dataset_key]:
+            del self._entries[key]
+
+    # -------------------- DECISION --------------------
+
+    def _refit_reason(self, entry: Optional[Dict], series: pd.Series) -> Optional[str]:
+        if entry is None:
+            return "no fitted model for this dataset"
+
+        age = time.time() - entry["fitted_at"]
+        if age > self.max_age_seconds:
+            return f"model age {age / 3600:.1f}h exceeds {self.max_age_seconds / 3600:.1f}h"
+
+        if entry["last_index"] not in series.index or series.index[-1] < entry["last_index"]:
+            return "stored history no longer matches the data"
+
+        # training windows slide forward as bars arrive, so only the rows both windows share are compared
+        window = entry["window"]
+        start = max(window.index[0], series.index[0])
+        stored, current = window.loc[start:], series.loc[start:entry["last_index"]]
+        if not stored.index.equals(current.index):
+            return "stored history no longer matches the data"
+        if series_fingerprint(current) != series_fingerprint(stored):
+            return "stored history values were revised"
+
+        n_since_fit = int((series.index > entry["fit_end"]).sum())
+        if n_since_fit == 0 or series.index[-1] == entry["last_index"]:
+            return None
+
+        residuals = entry["model"].one_step_residuals(series)[-n_since_fit:]
+        report = detect_drift(
+            residuals,
+            entry["baseline"],
+            cusum_threshold=self.cusum_threshold,
+            page_hinkley_threshold=self.page_hinkley_threshold,
+            error_ratio_threshold=self.error_ratio_threshold,
+        )
+        entry["last_check"] = report
+
+        if report["drift"]:
+            return "drift detected (" + "; ".join(report["reasons"]) + ")"
+        return None
+
+    # -------------------- FITTING --------------------
+
+    def _fit(self, model_type: str, series: pd.Series, progress: Optional[ProgressCallback] = None) -> Dict:
+        """
+        Fits once on all but the holdout, so the baseline error is out-of-sample,
+        then refits the chosen model on the full series before it is deployed.
+        """
+        holdout = min(self.holdout, len(series) // 5)
+        if not holdout:
+            model = _TRAINERS[model_type](series, progress=progress)
+            residuals = model.one_step_residuals(series)
+        else:
+            model = _TRAINERS[model_type](series.iloc[:-holdout], progress=scaled(progress, 0.0, 0.8))
+            residuals = model.one_step_residuals(series)[-holdout:]
+            if not model.partial:
+                model.refit(series, progress=scaled(progress, 0.8, 1.0))
+
+        return {
+            "model": model,
+            "fitted_at": time.time(),
+            "fit_end": series.index[-1],
+            "last_index": series.index[-1],
+            "window": series.copy(),
+            "last_check": None,
+            "baseline": {
+                "mean": float(np.mean(residuals)),
+                "std": float(np.std(residuals)) + 1e-8,
+                "mae": float(np.mean(np.abs(residuals))) + 1e-8,
+            },
+        }
+
+
+# -------------------- GUI FRIENDLY FUNCTIONS --------------------
+
+default_controller = RetrainingController()
+
+
+def dataset_key(source_config: Dict) -> str:
+    """Stable identity of a data source, independent of its date range."""
+    if source_config.get("source") == "yahoo":
+        return f"yahoo:{source_config.get('ticker')}"
+    return f"{source_config.get('source')}:{source_config.get('file_path')}"
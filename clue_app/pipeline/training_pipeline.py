@@ -1,56 +1,105 @@
-from typing import Dict
-
-from core.data_loader import load_financial_data
-from preprocessing.feature_engineering import create_features
-from preprocessing.split import time_series_train_test_split
-from models.evaluation import evaluate_model
-
-from forecasting.auto_arima import train_auto_arima
-from forecasting.xgboost_model import train_xgboost_model, predict_xgboost
-
-
-def run_training(model_type: str, source_config: Dict, forecast_periods: int = 30) -> Dict:
-    """
-    Trains selected model and returns training results.
-    """
-
-    df = load_financial_data(**source_config)
-    close_series = df["Close"]
-
-    result = {"model_type": model_type}
-
-    # ================= AUTO ARIMA =================
-    if model_type == "AUTO_ARIMA":
-
-        model = train_auto_arima(close_series)
-
-        in_sample_pred = model.predict_in_sample()
-        y_true = close_series[-len(in_sample_pred):]
-
-        metrics = evaluate_model(y_true, in_sample_pred)
-
-        result.update({
-            "model_order": model.order,
-            "metrics": metrics
-        })
-
-    # ================= XGBOOST =================
-    elif model_type == "XGBOOST":
-
-        featured_df = create_features(df)
-        X_train, X_test, y_train, y_test = time_series_train_test_split(featured_df)
-
-        model = train_xgboost_model(X_train, y_train)
-        predictions = predict_xgboost(model, X_test)
-
-        metrics = evaluate_model(y_test, predictions)
-
-        result.update({
-            "model_params": model.get_params(),
-            "metrics": metrics
-        })
-
-    else:
-        raise ValueError(f"Unsupported model type: {model_type}")
-
-    return result
+from typing import Dict, Optional
+
+import pandas as pd
+
+from core.data_loader import load_financial_data
+from core.progress import ProgressCallback, report, scaled
+from preprocessing.feature_engineering import create_features
+from preprocessing.split import time_series_train_test_split
+from models.evaluation import evaluate_model
+from evaluation.comparison import compare_forecasts
+from evaluation.bootstrap import metric_intervals
+
+from forecasting.xgboost_model import train_xgboost_model, predict_xgboost
+from forecasting.ensemble import train_ensemble
+from forecasting.lookback import select_training_window
+from pipeline.retraining import dataset_key, default_controller
+
+
+def run_training(
+    model_type: str,
+    source_config: Dict,
+    forecast_periods: int = 30,
+    progress: Optional[ProgressCallback] = None,
+    df: Optional[pd.DataFrame] = None,
+) -> Dict:
+    """
+    Trains selected model and returns training results.
+    progress(fraction, message) is called between stages and may raise to cancel.
+    df is the already loaded data for source_config; it is loaded here when omitted.
+    """
+
+    report(progress, 0.0, "Loading data")
+    if df is None:
+        df = load_financial_data(**source_config)
+    close_series = df["Close"]
+    key = dataset_key(source_config)
+
+    result = {"model_type": model_type}
+
+    # ================= AUTO ARIMA =================
+    if model_type == "AUTO_ARIMA":
+
+        report(progress, 0.1, "Fitting model")
+        train_series = select_training_window(model_type, key, close_series)
+        model = default_controller.get_model(model_type, key, train_series, progress=scaled(progress, 0.1, 0.8))
+
+        report(progress, 0.8, "Evaluating")
+        in_sample_pred = model.predict_in_sample()
+        y_true = close_series[-len(in_sample_pred):]
+
+        metrics = evaluate_model(y_true, in_sample_pred)
+
+        result.update({
+            "model_order": model.order,
+            "metrics": metrics,
+            "metric_intervals": metric_intervals(y_true, in_sample_pred),
+        })
+
+    # ================= XGBOOST =================
+    elif model_type == "XGBOOST":
+
+        report(progress, 0.1, "Fitting model")
+        featured_df = create_features(select_training_window(model_type, key, df))
+        X_train, X_test, y_train, y_test = time_series_train_test_split(featured_df)
+
+        model = train_xgboost_model(X_train, y_train, progress=scaled(progress, 0.1, 0.8))
+
+        report(progress, 0.8, "Evaluating")
+        predictions = predict_xgboost(model, X_test)
+
+        metrics = evaluate_model(y_test, predictions)
+
+        result.update({
+            "model_params": model.model.get_params(),
+            "metrics": metrics,
+            "metric_intervals": metric_intervals(y_test, predictions),
+        })
+
+    # ================= ENSEMBLE =================
+    elif model_type == "ENSEMBLE":
+
+        report(progress, 0.1, "Fitting ensemble members")
+        model = train_ensemble(close_series)
+
+        report(progress, 0.8, "Evaluating")
+        # blended out-of-sample predictions over the backtest window
+        predictions = model.predict()
+        metrics = evaluate_model(model.backtest_actuals, predictions)
+
+        # are the members (and the blend) statistically distinguishable on the backtest?
+        backtests = dict(model.member_backtests().items())
+        backtests["ENSEMBLE"] = predictions
+
+        result.update({
+            "model_order": model.get_weights(),
+            "metrics": metrics,
+            "metric_intervals": metric_intervals(model.backtest_actuals, predictions),
+            "comparison": compare_forecasts(model.backtest_actuals, backtests),
+        })
+
+    else:
+        raise ValueError(f"Unsupported model type: {model_type}")
+
+    report(progress, 1.0, "Done")
+    return result
@@ -1,103 +1,111 @@
-# preprocessing/eda.py
-from typing import Dict, Any
-import matplotlib.pyplot as plt
-import pandas as pd
-import numpy as np
-
-def basic_stats(df: pd.DataFrame, target_column: str = "Close") -> Dict[str, Any]:
-    series = df[target_column]
-
-    return {
-        "start_date": df.index.min(),
-        "end_date": df.index.max(),
-        "n_observations": len(df),
-        "min": float(series.min()),
-        "max": float(series.max()),
-        "mean": float(series.mean()),
-        "median": float(series.median()),
-        "std": float(series.std()),
-    }
-
-
-def missing_values_summary(df: pd.DataFrame) -> Dict[str, int]:
-    return df.isna().sum().to_dict()
-
-
-def returns_stats(df: pd.DataFrame, target_column: str = "Close") -> Dict[str, Any]:
-    series = df[target_column]
-    returns = series.pct_change().dropna()
-
-    if returns.empty:
-        return {
-            "mean_daily_return": None,
-            "volatility": None,
-            "min_return": None,
-            "max_return": None,
-        }
-
-    return {
-        "mean_daily_return": float(returns.mean()),
-        "volatility": float(returns.std()),
-        "min_return": float(returns.min()),
-        "max_return": float(returns.max()),
-    }
-
-
-def eda_summary(df: pd.DataFrame, target_column: str = "Close") -> Dict[str, Any]:
-    """Single call EDA summary for GUI."""
-    return {
-        "basic_stats": basic_stats(df, target_column),
-        "missing_values": missing_values_summary(df),
-        "returns_stats": returns_stats(df, target_column),
-    }
-import matplotlib.pyplot as plt
-
-def generate_eda_charts(df):
-    plt.close("all")
-
-    fig, axes = plt.subplots(
-        4, 1,
-        figsize=(14, 18),
-        constrained_layout=True
-    )
-
-    # Price + Rolling Mean
-    df["Close"].plot(ax=axes[0], label="Close", color="cyan")
-    df["Close"].rolling(20).mean().plot(ax=axes[0], label="Rolling Mean (20)", color="magenta")
-    axes[0].set_title("Price with Rolling Mean")
-    axes[0].legend()
-    axes[0].grid(True)
-
-    # Returns Histogram
-    returns = df["Close"].pct_change().dropna()
-    axes[1].hist(returns, bins=60, color="purple", alpha=0.7)
-    axes[1].set_title("Distribution of Daily Returns")
-    axes[1].grid(True)
-
-    # Rolling Volatility
-    volatility = returns.rolling(20).std()
-    axes[2].plot(volatility, color="orange")
-    axes[2].set_title("Rolling Volatility (20)")
-    axes[2].grid(True)
-
-    # Cumulative Returns
-    cumulative = (1 + returns).cumprod()
-    axes[3].plot(cumulative, color="lime")
-    axes[3].set_title("Cumulative Returns")
-    axes[3].grid(True)
-
-    for ax in axes:
-        ax.set_xlabel("Date")
-
-    fig.tight_layout(pad=4)
-    return fig
-def generate_preview_charts(df):
-    fig, ax = plt.subplots(1, 1, figsize=(10, 4))
-
-    ax.plot(df["Close"], label="Close Price")
-    ax.plot(df["Close"].rolling(20).mean(), label="Rolling Mean (20)")
-    ax.set_title("Raw Price Preview (Before Cleaning)")
-    ax.legend()
-    ax.grid(True)
-
-    return fig
+# preprocessing/eda.py
+from typing import Dict, Any
+import pandas as pd
+import numpy as np
+
+from preprocessing.eda_engine import compute_eda
+from visualization.downsampling import downsample_for_axes
+from visualization.lod import attach_lod
+from visualization.figure_manager import figure_manager
+
+def basic_stats(df: pd.DataFrame, target_column: str = "Close") -> Dict[str, Any]:
+    return compute_eda(df, target_column)["basic_stats"]
+
+
+def missing_values_summary(df: pd.DataFrame) -> Dict[str, int]:
+    return df.isna().sum().to_dict()
+
+
+def returns_stats(df: pd.DataFrame, target_column: str = "Close") -> Dict[str, Any]:
+    return compute_eda(df, target_column)["returns_stats"]
+
+
+def eda_summary(df: pd.DataFrame, target_column: str = "Close", stats: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Single call EDA summary for GUI (one cached engine pass)."""
+    stats = stats or compute_eda(df, target_column)
+    return {
+        "basic_stats": stats["basic_stats"],
+        "missing_values": stats["missing_values"],
+        "returns_stats": stats["returns_stats"],
+    }
+
+
+def format_eda_summary(summary: Dict[str, Any]) -> str:
+    """Plain-text block shown on the EDA pages and in the report."""
+    stats = summary.get("basic_stats", {})
+    returns = summary.get("returns_stats", {})
+
+    return (
+        "DATA OVERVIEW\n"
+        f"Start Date   : {stats.get('start_date')}\n"
+        f"End Date     : {stats.get('end_date')}\n"
+        f"Observations : {stats.get('n_observations')}\n\n"
+        "PRICE STATISTICS\n"
+        f"Min  : {stats.get('min'):.2f}\n"
+        f"Max  : {stats.get('max'):.2f}\n"
+        f"Mean : {stats.get('mean'):.2f}\n"
+        f"Std  : {stats.get('std'):.2f}\n\n"
+        "RETURNS\n"
+        f"Mean Daily Return : {returns.get('mean_daily_return'):.4f}\n"
+        f"Volatility        : {returns.get('volatility'):.4f}\n"
+    )
+
+
+def generate_eda_charts(df, stats: Dict[str, Any] = None, owner: str = "eda"):
+    stats = stats or compute_eda(df)
+
+    # managed figure: reused per owner instead of a new pyplot figure per call
+    fig, axes = figure_manager.subplots(
+        owner,
+        4, 1,
+        figsize=(14, 18),
+        layout="constrained"
+    )
+
+    # Price + Rolling Mean
+    # long series are decimated to about the pixel width of each panel;
+    # LOD pyramids take over when the canvas is zoomed or panned
+    close = downsample_for_axes(stats["close"], axes[0])
+    rolling_mean = downsample_for_axes(stats["rolling_mean"], axes[0])
+    attach_lod(axes[0].plot(close, label="Close", color="cyan")[0], stats["close"])
+    attach_lod(axes[0].plot(rolling_mean, label="Rolling Mean (20)", color="magenta")[0], stats["rolling_mean"])
+    axes[0].set_title("Price with Rolling Mean")
+    axes[0].legend()
+    axes[0].grid(True)
+
+    # Returns Histogram (pre-binned by the engine)
+    counts, edges = stats["histogram"]
+    axes[1].hist(edges[:-1], bins=edges, weights=counts, color="purple", alpha=0.7)
+    axes[1].set_title("Distribution of Daily Returns")
+    axes[1].grid(True)
+
+    # Rolling Volatility
+    volatility = downsample_for_axes(stats["volatility"], axes[2], method="minmax")
+    attach_lod(axes[2].plot(volatility, color="orange")[0], stats["volatility"])
+    axes[2].set_title("Rolling Volatility (20)")
+    axes[2].grid(True)
+
+    # Cumulative Returns
+    attach_lod(axes[3].plot(downsample_for_axes(stats["cumulative"], axes[3]), color="lime")[0], stats["cumulative"])
+    axes[3].set_title("Cumulative Returns")
+    axes[3].grid(True)
+
+    for ax in axes:
+        ax.set_xlabel("Date")
+
+    # the constrained engine lays the panels out; tight_layout would replace it
+    fig.get_layout_engine().set(w_pad=0.25, h_pad=0.3, hspace=0.05)
+    figure_manager.track()
+    return fig
+def generate_preview_charts(df, stats: Dict[str, Any] = None, owner: str = "preview"):
+    stats = stats or compute_eda(df)
+    fig, ax = figure_manager.subplots(owner, 1, 1, figsize=(10, 4))
+
+    attach_lod(ax.plot(downsample_for_axes(stats["close"], ax), label="Close Price")[0], stats["close"])
+    attach_lod(ax.plot(downsample_for_axes(stats["rolling_mean"], ax), label="Rolling Mean (20)")[0], stats["rolling_mean"])
+    ax.set_title("Raw Price Preview (Before Cleaning)")
+    ax.legend()
+    ax.grid(True)
+
+    figure_manager.track()
+    return fig
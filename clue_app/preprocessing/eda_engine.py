@@ -0,0 +1,120 @@
+"""
+EDA Engine Module for CLUE Financial Forecasting
+Computes every EDA statistic once per dataset in vectorized passes.
+- Returns, rolling mean/volatility, cumulative returns, drawdowns
+- Return histogram and descriptive statistics
+- Cached by dataset fingerprint; summaries and charts read the same result
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+
+from core.utils import series_fingerprint
+
+
+_CACHE_SIZE = 8
+_eda_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+class EDAEngine:
+    def __init__(self, window: int = 20, bins: int = 60):
+        self.window = window
+        self.bins = bins
+
+    # -------------------- PUBLIC METHODS --------------------
+
+    def compute(self, df: pd.DataFrame, target_column: str = "Close") -> Dict[str, Any]:
+        key = (series_fingerprint(df[target_column]), target_column, self.window, self.bins)
+        with _cache_lock:
+            if key in _eda_cache:
+                _eda_cache.move_to_end(key)
+                return _eda_cache[key]
+
+        stats = self._compute(df, target_column)
+
+        with _cache_lock:
+            _eda_cache[key] = stats
+            if len(_eda_cache) > _CACHE_SIZE:
+                _eda_cache.popitem(last=False)
+
+        return stats
+
+    # -------------------- PASSES --------------------
+
+    def _compute(self, df: pd.DataFrame, target_column: str) -> Dict[str, Any]:
+        close = df[target_column]
+        values = close.to_numpy(dtype=float)
+
+        # ---------- Series ----------
+        returns = close.pct_change().dropna()
+        rolling_close = close.rolling(self.window)
+        rolling_mean = rolling_close.mean()
+        volatility = returns.rolling(self.window).std()
+
+        cumulative = (1 + returns).cumprod()
+        drawdown = cumulative / cumulative.cummax() - 1
+
+        # ---------- Histogram ----------
+        return_values = returns.to_numpy(dtype=float)
+        if len(return_values):
+            counts, edges = np.histogram(return_values, bins=self.bins)
+        else:
+            counts, edges = np.zeros(self.bins, dtype=int), np.linspace(0, 1, self.bins + 1)
+
+        # ---------- Descriptive Stats ----------
+        finite = values[~np.isnan(values)]
+        basic = {
+            "start_date": df.index.min(),
+            "end_date": df.index.max(),
+            "n_observations": len(df),
+            "min": float(finite.min()) if finite.size else float("nan"),
+            "max": float(finite.max()) if finite.size else float("nan"),
+            "mean": float(finite.mean()) if finite.size else float("nan"),
+            "median": float(np.median(finite)) if finite.size else float("nan"),
+            "std": float(finite.std(ddof=1)) if finite.size > 1 else float("nan"),
+        }
+
+        if return_values.size:
+            returns_summary = {
+                "mean_daily_return": float(return_values.mean()),
+                "volatility": float(return_values.std(ddof=1)) if return_values.size > 1 else float("nan"),
+                "min_return": float(return_values.min()),
+                "max_return": float(return_values.max()),
+                "max_drawdown": float(drawdown.min()),
+            }
+        else:
+            returns_summary = {
+                "mean_daily_return": None,
+                "volatility": None,
+                "min_return": None,
+                "max_return": None,
+                "max_drawdown": None,
+            }
+
+        return {
+            "close": close,
+            "returns": returns,
+            "rolling_mean": rolling_mean,
+            "rolling_std": rolling_close.std(),
+            "volatility": volatility,
+            "cumulative": cumulative,
+            "drawdown": drawdown,
+            "histogram": (counts, edges),
+            "basic_stats": basic,
+            "returns_stats": returns_summary,
+            "missing_values": df.isna().sum().to_dict(),
+        }
+
+
+# -------------------- GUI FRIENDLY FUNCTION --------------------
+
+default_engine = EDAEngine()
+
+
+def compute_eda(df: pd.DataFrame, target_column: str = "Close") -> Dict[str, Any]:
+    return default_engine.compute(df, target_column)
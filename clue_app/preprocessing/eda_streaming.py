@@ -0,0 +1,325 @@
+"""
+Streaming EDA Module for CLUE Financial Forecasting
+One-pass EDA for histories that don't fit in memory.
+- Welford moments, KLL quantile sketch, fixed-bin histogram
+- Chunks from any loader; shards merge in chronological order
+- Produces the same summary dict as eda_summary
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from core.data_loader import DataLoader
+
+
+# -------------------- SKETCHES --------------------
+
+class WelfordMoments:
+    """Count, mean, variance, min and max; batch updates and pairwise merge."""
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values: np.ndarray) -> "WelfordMoments":
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if values.size:
+            batch = WelfordMoments()
+            batch.n = values.size
+            batch.mean = float(values.mean())
+            batch.m2 = float(((values - batch.mean) ** 2).sum())
+            batch.min = float(values.min())
+            batch.max = float(values.max())
+            self.merge(batch)
+        return self
+
+    def merge(self, other: "WelfordMoments") -> "WelfordMoments":
+        if other.n == 0:
+            return self
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.mean += delta * other.n / n
+        self.n = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.m2 / (self.n - 1))) if self.n > 1 else float("nan")
+
+
+class KLLSketch:
+    """
+    Mergeable KLL-style compactor sketch (equal-capacity levels);
+    rank error shrinks roughly as 1/k.
+    """
+
+    def __init__(self, k: int = 200, random_state: Optional[int] = None):
+        self.k = k
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(random_state)
+
+    def update(self, values: np.ndarray) -> "KLLSketch":
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+
+        # a large chunk is decimated once straight to the level where it fits,
+        # rather than cascading through every level (one error instead of many)
+        level = 0
+        if values.size > self.k:
+            level = int(np.ceil(np.log2(values.size / self.k)))
+            step = 2 ** level
+            values = np.sort(values)[self._rng.integers(step)::step]
+            while len(self.levels) <= level:
+                self.levels.append(np.empty(0))
+
+        self.levels[level] = np.concatenate([self.levels[level], values])
+        self._compress()
+        return self
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for h, items in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], items])
+        self._compress()
+        return self
+
+    def quantiles(self, qs: Sequence[float]) -> np.ndarray:
+        items = np.concatenate(self.levels)
+        if items.size == 0:
+            return np.full(len(qs), np.nan)
+        weights = np.concatenate([np.full(len(level), 2.0 ** h) for h, level in enumerate(self.levels)])
+
+        order = np.argsort(items, kind="stable")
+        cumulative = np.cumsum(weights[order])
+        ranks = np.asarray(qs, dtype=float) * cumulative[-1]
+        positions = np.minimum(np.searchsorted(cumulative, ranks, side="left"), items.size - 1)
+        return items[order][positions]
+
+    def _compress(self):
+        compacted = True
+        while compacted:
+            compacted = False
+            for h, level in enumerate(self.levels):
+                if len(level) <= self.k:
+                    continue
+
+                # sort, keep one item back if odd, promote every other item at double weight
+                level = np.sort(level)
+                keep = level[-1:] if len(level) % 2 else level[:0]
+                promoted = level[: len(level) - len(keep)][self._rng.integers(2)::2]
+
+                self.levels[h] = keep
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1], promoted])
+                compacted = True
+
+
+class StreamingHistogram:
+    """Fixed-bin histogram with under/overflow counts; merge is addition."""
+
+    def __init__(self, lower: float = -0.2, upper: float = 0.2, bins: int = 60):
+        self.edges = np.linspace(lower, upper, bins + 1)
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+
+    def update(self, values: np.ndarray) -> "StreamingHistogram":
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        self.underflow += int((values < self.edges[0]).sum())
+        self.overflow += int((values > self.edges[-1]).sum())
+        self.counts += np.histogram(values, bins=self.edges)[0]
+        return self
+
+    def merge(self, other: "StreamingHistogram") -> "StreamingHistogram":
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("Histograms must share bin edges to merge")
+        self.counts += other.counts
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        return self
+
+
+# -------------------- STREAMING EDA --------------------
+
+class StreamingEDA:
+    """
+    Accumulates EDA statistics chunk by chunk. Chunks (and merged shards)
+    must be in chronological order so returns across chunk seams are exact.
+    """
+
+    def __init__(self, target_column: str = "Close", k: int = 200, return_range: Tuple[float, float] = (-0.2, 0.2), bins: int = 60):
+        self.target_column = target_column
+        self.price = WelfordMoments()
+        self.price_quantiles = KLLSketch(k)
+        self.returns = WelfordMoments()
+        self.return_histogram = StreamingHistogram(*return_range, bins)
+        self.missing: Dict[str, int] = {}
+
+        self.start_date = None
+        self.end_date = None
+        self.n_observations = 0
+        self.first_price: Optional[float] = None
+        self.last_price: Optional[float] = None
+
+        # drawdown of the cumulative return path (= price path relative to its running peak)
+        self.peak = -np.inf
+        self.max_drawdown = 0.0
+
+    def update(self, chunk: pd.DataFrame) -> "StreamingEDA":
+        if chunk.empty:
+            return self
+
+        for column, count in chunk.isna().sum().items():
+            self.missing[column] = self.missing.get(column, 0) + int(count)
+
+        self.start_date = chunk.index.min() if self.start_date is None else min(self.start_date, chunk.index.min())
+        self.end_date = chunk.index.max() if self.end_date is None else max(self.end_date, chunk.index.max())
+        self.n_observations += len(chunk)
+
+        prices = chunk[self.target_column].to_numpy(dtype=float)
+        prices = prices[~np.isnan(prices)]
+        if prices.size == 0:
+            return self
+
+        self.price.update(prices)
+        self.price_quantiles.update(prices)
+
+        # prepend the previous chunk's last price so the seam return is included
+        path = prices if self.last_price is None else np.concatenate([[self.last_price], prices])
+        chunk_returns = np.diff(path) / path[:-1]
+        self.returns.update(chunk_returns)
+        self.return_histogram.update(chunk_returns)
+
+        running_peak = np.maximum.accumulate(np.concatenate([[self.peak], prices]))[1:]
+        self.max_drawdown = min(self.max_drawdown, float((prices / running_peak - 1).min()))
+        self.peak = float(running_peak[-1])
+
+        if self.first_price is None:
+            self.first_price = float(prices[0])
+        self.last_price = float(prices[-1])
+        return self
+
+    def merge(self, later: "StreamingEDA") -> "StreamingEDA":
+        """
+        Appends a shard covering a later time range.
+        Moments and histograms are exact; the seam drawdown is exact unless
+        the later shard sets a new peak, in which case its pre-peak dip is approximated.
+        """
+        if later.n_observations == 0:
+            return self
+        if self.n_observations == 0:
+            self.__dict__.update(later.__dict__)
+            return self
+
+        if self.last_price is not None and later.first_price is not None:
+            seam = np.array([later.first_price / self.last_price - 1])
+            self.returns.update(seam)
+            self.return_histogram.update(seam)
+
+        if later.first_price is not None:
+            seam_drawdown = later.price.min / self.peak - 1 if self.peak > later.peak else 0.0
+            self.max_drawdown = min(self.max_drawdown, later.max_drawdown, seam_drawdown)
+            self.peak = max(self.peak, later.peak)
+
+        self.price.merge(later.price)
+        self.price_quantiles.merge(later.price_quantiles)
+        self.returns.merge(later.returns)
+        self.return_histogram.merge(later.return_histogram)
+        for column, count in later.missing.items():
+            self.missing[column] = self.missing.get(column, 0) + count
+
+        self.start_date = min(self.start_date, later.start_date)
+        self.end_date = max(self.end_date, later.end_date)
+        self.n_observations += later.n_observations
+        self.first_price = self.first_price if self.first_price is not None else later.first_price
+        self.last_price = later.last_price if later.last_price is not None else self.last_price
+        return self
+
+    def summary(self) -> Dict[str, Any]:
+        """Same layout as preprocessing.eda.eda_summary."""
+        basic = {
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "n_observations": self.n_observations,
+            "min": float(self.price.min) if self.price.n else float("nan"),
+            "max": float(self.price.max) if self.price.n else float("nan"),
+            "mean": float(self.price.mean) if self.price.n else float("nan"),
+            "median": float(self.price_quantiles.quantiles([0.5])[0]),
+            "std": self.price.std,
+        }
+
+        if self.returns.n:
+            returns_summary = {
+                "mean_daily_return": float(self.returns.mean),
+                "volatility": self.returns.std,
+                "min_return": float(self.returns.min),
+                "max_return": float(self.returns.max),
+                "max_drawdown": float(self.max_drawdown),
+            }
+        else:
+            returns_summary = {
+                "mean_daily_return": None,
+                "volatility": None,
+                "min_return": None,
+                "max_return": None,
+                "max_drawdown": None,
+            }
+
+        return {
+            "basic_stats": basic,
+            "missing_values": dict(self.missing),
+            "returns_stats": returns_summary,
+        }
+
+    def histogram(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(counts, edges) of daily returns, in the same form as the EDA engine."""
+        return self.return_histogram.counts.copy(), self.return_histogram.edges.copy()
+
+
+# -------------------- GUI FRIENDLY FUNCTIONS --------------------
+
+def streaming_eda_summary(chunks: Iterable[pd.DataFrame], target_column: str = "Close") -> Dict[str, Any]:
+    eda = StreamingEDA(target_column)
+    for chunk in chunks:
+        eda.update(chunk)
+    return eda.summary()
+
+
+def parallel_streaming_eda(
+    shards: Sequence[Iterable[pd.DataFrame]],
+    target_column: str = "Close",
+    max_workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Each shard (an iterable of chunks, in time order) is scanned in its own worker, then merged."""
+
+    def scan(chunks: Iterable[pd.DataFrame]) -> StreamingEDA:
+        eda = StreamingEDA(target_column)
+        for chunk in chunks:
+            eda.update(chunk)
+        return eda
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        partials = list(pool.map(scan, shards))
+
+    merged = StreamingEDA(target_column)
+    for partial in partials:
+        merged.merge(partial)
+    return merged.summary()
+
+
+def streaming_csv_summary(file_path: str, chunksize: int = 100_000) -> Dict[str, Any]:
+    """EDA summary of a CSV too large to load at once."""
+    return streaming_eda_summary(DataLoader().iter_csv(file_path, chunksize))
@@ -0,0 +1,113 @@
+"""
+Seasonality Detection Module for CLUE Financial Forecasting
+Finds dominant periods with an FFT periodogram and confirms them
+with an FFT-based autocorrelation, all in O(n log n).
+Used to decide whether seasonal ARIMA terms or Fourier features are worth it.
+"""
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class SeasonalityDetector:
+    def __init__(self, min_strength: float = 0.3, max_period: Optional[int] = None, top_k: int = 3):
+        self.min_strength = min_strength
+        self.max_period = max_period
+        self.top_k = top_k
+
+    # -------------------- PUBLIC METHODS --------------------
+
+    def detect(self, series: pd.Series, difference: bool = True) -> Dict[str, Any]:
+        """
+        Returns candidate periods (in observations) with their strength,
+        i.e. the autocorrelation at that lag. Prices are differenced first
+        so the trend doesn't swamp the spectrum.
+        """
+        values = series.dropna().to_numpy(dtype=float)
+        if difference:
+            values = np.diff(values)
+        values = values - values.mean() if len(values) else values
+
+        n = len(values)
+        if n < 8 or not np.any(values):
+            return self._result([], series)
+
+        max_period = min(self.max_period or n // 3, n // 2)
+
+        power = np.abs(np.fft.rfft(values)) ** 2
+        freqs = np.fft.rfftfreq(n)
+        acf = self._acf(values)
+
+        with np.errstate(divide="ignore"):
+            periods = np.where(freqs > 0, 1.0 / freqs, np.inf)
+        valid = np.flatnonzero((periods >= 2) & (periods <= max_period))
+        if valid.size == 0:
+            return self._result([], series)
+
+        # strongest spectral peaks first, confirmed by the autocorrelation at that lag
+        peaks = valid[np.argsort(power[valid])[::-1][: self.top_k * 4]]
+
+        found = {}
+        for idx in peaks:
+            period = int(round(periods[idx]))
+            lags = np.arange(max(period - 1, 2), min(period + 2, n))
+            if lags.size == 0:
+                continue
+            best_lag = int(lags[np.argmax(acf[lags])])
+            strength = float(acf[best_lag])
+            if strength >= self.min_strength and strength > found.get(best_lag, -1.0):
+                found[best_lag] = strength
+
+        # keep the strongest of neighbouring lags and drop multiples of an accepted period
+        candidates = []
+        for period, strength in sorted(found.items(), key=lambda item: item[1], reverse=True):
+            if any(abs(period - p) <= max(1, 0.1 * p) or period % p == 0 for p, _ in candidates):
+                continue
+            candidates.append((period, strength))
+
+        return self._result(candidates[: self.top_k], series)
+
+    # -------------------- HELPERS --------------------
+
+    @staticmethod
+    def _acf(values: np.ndarray) -> np.ndarray:
+        """Autocorrelation for all lags via zero-padded FFT."""
+        n = len(values)
+        size = 1 << (2 * n - 1).bit_length()
+        spectrum = np.fft.rfft(values, n=size)
+        acov = np.fft.irfft(spectrum * np.conj(spectrum), n=size)[:n]
+        return acov / acov[0]
+
+    @staticmethod
+    def _result(candidates, series: pd.Series) -> Dict[str, Any]:
+        dominant = candidates[0] if candidates else (None, 0.0)
+
+        # period length in index time, so Fourier phases don't depend on the window start
+        period_timedelta = None
+        if dominant[0] is not None and isinstance(series.index, pd.DatetimeIndex) and len(series) > 1:
+            period_timedelta = pd.Series(series.index).diff().median() * dominant[0]
+
+        return {
+            "periods": [{"period": period, "strength": strength} for period, strength in candidates],
+            "dominant_period": dominant[0],
+            "strength": dominant[1],
+            "period_timedelta": period_timedelta,
+            "is_seasonal": dominant[0] is not None,
+        }
+
+
+# -------------------- GUI FRIENDLY FUNCTION --------------------
+
+def detect_seasonality(series: pd.Series, min_strength: float = 0.3, max_period: Optional[int] = None) -> Dict[str, Any]:
+    detector = SeasonalityDetector(min_strength=min_strength, max_period=max_period)
+    return detector.detect(series)
+
+
+def fourier_period(series: pd.Series, min_strength: float = 0.3):
+    """Period to pass to FeatureEngineer, or None when there is no strong season."""
+    result = detect_seasonality(series, min_strength)
+    if not result["is_seasonal"]:
+        return None
+    return result["period_timedelta"] or result["dominant_period"]
@@ -1,58 +1,166 @@
-"""
-Stationarity Module for CLUE Financial Forecasting
-Handles ADF test and automatic differencing logic
-for univariate financial time series (Close price).
-"""
-
-import pandas as pd
-from statsmodels.tsa.stattools import adfuller
-
-
-class StationarityChecker:
-    def __init__(self, significance_level: float = 0.05):
-        self.significance_level = significance_level
-
-    # -------------------- PUBLIC METHODS --------------------
-
-    def adf_test(self, series: pd.Series) -> dict:
-        """Performs Augmented Dickey-Fuller test."""
-        result = adfuller(series.dropna())
-
-        return {
-            "adf_statistic": result[0],
-            "p_value": result[1],
-            "used_lag": result[2],
-            "n_obs": result[3],
-            "critical_values": result[4],
-            "is_stationary": result[1] < self.significance_level,
-        }
-
-    def make_stationary(self, df: pd.DataFrame, target_column: str = "Close") -> pd.DataFrame:
-        """Applies differencing until stationarity is achieved."""
-        series = df[target_column]
-        differenced = series.copy()
-        diff_count = 0
-
-        while True:
-            test_result = self.adf_test(differenced)
-            if test_result["is_stationary"]:
-                break
-            differenced = differenced.diff().dropna()
-            diff_count += 1
-
-        stationary_df = differenced.to_frame(name=target_column)
-        stationary_df.attrs["differencing_order"] = diff_count
-
-        return stationary_df
-
-
-# -------------------- GUI FRIENDLY FUNCTION --------------------
-
-def check_stationarity(df: pd.DataFrame, column: str = "Close") -> dict:
-    checker = StationarityChecker()
-    return checker.adf_test(df[column])
-
-
-def transform_to_stationary(df: pd.DataFrame, column: str = "Close") -> pd.DataFrame:
-    checker = StationarityChecker()
-    return checker.make_stationary(df, column)
\ No newline at end of file
+"""
+Stationarity Module for CLUE Financial Forecasting
+Handles ADF + KPSS testing and bounded differencing
+for univariate financial time series (Close price).
+- Differencing order is capped (max_d)
+- Results are cached per dataset fingerprint
+- Batch mode tests many series in parallel
+"""
+
+import threading
+import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+from statsmodels.tools.sm_exceptions import InterpolationWarning
+from statsmodels.tsa.stattools import adfuller, kpss
+
+from core.utils import series_fingerprint
+
+
+_CACHE_SIZE = 256
+_analysis_cache: "OrderedDict[tuple, dict]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+class StationarityChecker:
+    def __init__(self, significance_level: float = 0.05, max_d: int = 2):
+        self.significance_level = significance_level
+        self.max_d = max_d
+
+    # -------------------- PUBLIC METHODS --------------------
+
+    def adf_test(self, series: pd.Series) -> dict:
+        """Performs Augmented Dickey-Fuller test (H0: unit root)."""
+        result = adfuller(series.dropna())
+
+        return {
+            "adf_statistic": result[0],
+            "p_value": result[1],
+            "used_lag": result[2],
+            "n_obs": result[3],
+            "critical_values": result[4],
+            "is_stationary": result[1] < self.significance_level,
+        }
+
+    def kpss_test(self, series: pd.Series) -> dict:
+        """Performs KPSS test (H0: level stationary)."""
+        with warnings.catch_warnings():
+            # p-values outside the lookup table are clipped; that's fine for a decision
+            warnings.simplefilter("ignore", InterpolationWarning)
+            statistic, p_value, lags, critical_values = kpss(series.dropna(), regression="c", nlags="auto")
+
+        return {
+            "kpss_statistic": statistic,
+            "p_value": p_value,
+            "used_lag": lags,
+            "critical_values": critical_values,
+            "is_stationary": p_value >= self.significance_level,
+        }
+
+    def combined_test(self, series: pd.Series) -> dict:
+        """
+        ADF + KPSS decision:
+        both stationary -> stationary, both not -> difference,
+        ADF only -> difference stationary, KPSS only -> trend stationary (no differencing).
+        """
+        if series.dropna().nunique() <= 1:
+            # both tests reject constant input; a flat series needs no differencing
+            return {"adf": None, "kpss": None, "verdict": "constant", "needs_differencing": False}
+
+        adf = self.adf_test(series)
+        kpss_result = self.kpss_test(series)
+
+        if adf["is_stationary"] and kpss_result["is_stationary"]:
+            verdict = "stationary"
+        elif not adf["is_stationary"] and not kpss_result["is_stationary"]:
+            verdict = "non_stationary"
+        elif adf["is_stationary"]:
+            verdict = "difference_stationary"
+        else:
+            verdict = "trend_stationary"
+
+        return {
+            "adf": adf,
+            "kpss": kpss_result,
+            "verdict": verdict,
+            "needs_differencing": verdict in ("non_stationary", "difference_stationary"),
+        }
+
+    def analyze(self, series: pd.Series) -> dict:
+        """Finds the differencing order d (capped at max_d); cached per dataset fingerprint."""
+        key = (series_fingerprint(series.dropna(), include_index=False), self.significance_level, self.max_d)
+        with _cache_lock:
+            if key in _analysis_cache:
+                _analysis_cache.move_to_end(key)
+                return _analysis_cache[key]
+
+        differenced = series.dropna()
+        tests = []
+        d = 0
+
+        while True:
+            result = self.combined_test(differenced)
+            tests.append(result)
+            if not result["needs_differencing"] or d >= self.max_d:
+                break
+            differenced = differenced.diff().dropna()
+            d += 1
+
+        analysis = {
+            "differencing_order": d,
+            "is_stationary": not tests[-1]["needs_differencing"],
+            "capped": tests[-1]["needs_differencing"],
+            "tests": tests,
+        }
+
+        with _cache_lock:
+            _analysis_cache[key] = analysis
+            if len(_analysis_cache) > _CACHE_SIZE:
+                _analysis_cache.popitem(last=False)
+
+        return analysis
+
+    def analyze_many(self, series_map: Dict[str, pd.Series], max_workers: Optional[int] = None) -> Dict[str, dict]:
+        """Runs `analyze` on many series in parallel."""
+        names = list(series_map)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = pool.map(lambda name: self.analyze(series_map[name]), names)
+        return dict(zip(names, results))
+
+    def make_stationary(self, df: pd.DataFrame, target_column: str = "Close") -> pd.DataFrame:
+        """Applies the analysed differencing order (at most max_d)."""
+        series = df[target_column]
+        diff_count = self.analyze(series)["differencing_order"]
+
+        differenced = series.copy()
+        for _ in range(diff_count):
+            differenced = differenced.diff().dropna()
+
+        stationary_df = differenced.to_frame(name=target_column)
+        stationary_df.attrs["differencing_order"] = diff_count
+
+        return stationary_df
+
+
+# -------------------- GUI FRIENDLY FUNCTION --------------------
+
+def check_stationarity(df: pd.DataFrame, column: str = "Close") -> dict:
+    checker = StationarityChecker()
+    return checker.adf_test(df[column])
+
+
+def transform_to_stationary(df: pd.DataFrame, column: str = "Close") -> pd.DataFrame:
+    checker = StationarityChecker()
+    return checker.make_stationary(df, column)
+
+
+def differencing_order(series: pd.Series, max_d: int = 2) -> int:
+    return StationarityChecker(max_d=max_d).analyze(series)["differencing_order"]
+
+
+def batch_stationarity(series_map: Dict[str, pd.Series], max_workers: Optional[int] = None) -> Dict[str, dict]:
+    return StationarityChecker().analyze_many(series_map, max_workers)
@@ -0,0 +1,167 @@
+# ui/controllers/speculation.py
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from PySide6.QtCore import QObject, QThread, QThreadPool, QTimer
+
+from core.logger import get_logger
+from ui.controllers.task_runner import Task, TaskRunner
+
+
+logger = get_logger("speculation")
+
+Key = Tuple[str, str, int]  # step, model type, horizon
+
+# how long to wait before retrying while the user has model or report work running
+RETRY_MS = 500
+
+
+class SpeculativeScheduler(QObject):
+    """
+    Runs the next wizard steps in the background once a data source is loaded,
+    so that Continue finds the result already computed.
+    - The plan is every step (train, then forecast) for the selected model,
+      then for any extra models; results are cached per (step, model, horizon)
+    - Low priority: one low-priority thread, nothing starts while the user has
+      model or report work running, and a user job for another model preempts
+      the running step (it is retried afterwards)
+    - A step the user asks for while it is running is adopted, not restarted,
+      and is no longer preempted
+    - A new source cancels everything and drops the cache
+    """
+
+    def __init__(self, steps: Dict[str, Callable], user_tasks: TaskRunner, extra_models: Sequence[str] = ()):
+        super().__init__()
+        # step name -> task function(model_type, source_config, horizon, data, progress)
+        self.steps = steps
+        self.user_tasks = user_tasks
+        self.extra_models = tuple(extra_models)
+
+        pool = QThreadPool(self)
+        pool.setMaxThreadCount(1)
+        pool.setThreadPriority(QThread.LowPriority)
+        self.runner = TaskRunner(pool)
+
+        self.source_config: Optional[Dict] = None
+        self.data = None
+        self.cache: Dict[Key, object] = {}
+        self.plan: List[Key] = []
+        self.current: Optional[Tuple[Key, Task]] = None
+        self.waiters: Dict[Key, Callable] = {}
+
+        self._retry = QTimer(self)
+        self._retry.setSingleShot(True)
+        self._retry.setInterval(RETRY_MS)
+        self._retry.timeout.connect(self._advance)
+
+    # ================= PUBLIC METHODS =================
+
+    def start(self, source_config: Dict, data, model_type: str, horizon: int, cached: Optional[Dict[Key, object]] = None):
+        """
+        Plans for the current source and selection; the cache survives unless the data changed.
+        cached seeds the cache with results computed earlier (a restored session).
+        """
+        if source_config != self.source_config or data is not self.data:
+            self.reset()
+            self.source_config = dict(source_config)
+            self.data = data
+        self.cache.update(cached or {})
+
+        models = [model_type] + [m for m in self.extra_models if m != model_type]
+        self.plan = [(step, m, horizon) for m in models for step in self.steps]
+
+        if self.current is not None and self.current[0] not in self.plan:
+            self._cancel_current()
+        self._advance()
+
+    def reset(self):
+        self.plan = []
+        self.waiters.clear()
+        self.cache.clear()
+        self._cancel_current()
+        self.source_config = None
+        self.data = None
+
+    def claim(self, key: Key, label: str, indicator, on_result: Callable) -> bool:
+        """
+        Hands a cached result to on_result, or attaches the user to the running step.
+        False when the step has not been started, so the caller should run it.
+        """
+        if key in self.cache:
+            logger.info("Using precomputed %s for %s", key[0], key[1])
+            on_result(self.cache[key])
+            return True
+
+        if self.current is not None and self.current[0] == key:
+            logger.info("Adopting running %s for %s", key[0], key[1])
+            task = self.current[1]
+            self.waiters[key] = on_result
+            task.indicator = indicator
+            indicator.start(label, on_cancel=self._cancel_current)
+            return True
+
+        return False
+
+    def record(self, key: Key, value):
+        """Stores a result the user computed, so the plan does not repeat it."""
+        self.cache[key] = value
+
+    def preempt(self, model_type: Optional[str] = None):
+        """Frees the worker for a user job, unless the running step is for the same model
+        or the user already adopted it through claim()."""
+        if self.current is None:
+            return
+        key = self.current[0]
+        if model_type is not None and key[1] == model_type:
+            return
+        if key in self.waiters:
+            return
+        logger.info("Preempting speculative %s for %s", key[0], key[1])
+        self._cancel_current()
+        self.plan.insert(0, key)
+
+    # ================= SCHEDULING =================
+
+    def _advance(self):
+        if self.current is not None or self.data is None:
+            return
+
+        self.plan = [key for key in self.plan if key not in self.cache]
+        if not self.plan:
+            return
+        if self.user_tasks.is_busy("model") or self.user_tasks.is_busy("report"):
+            self._retry.start()
+            return
+
+        key = self.plan.pop(0)
+        step, model_type, horizon = key
+        task = self.runner.submit(
+            "speculative",
+            self.steps[step],
+            model_type,
+            self.source_config,
+            horizon,
+            self.data,
+            label=f"{step.capitalize()} {model_type}",
+            on_result=lambda value, key=key: self._store(key, value),
+            on_finished=self._on_finished,
+        )
+        self.current = (key, task)
+        logger.info("Speculatively running %s for %s", step, model_type)
+
+    def _store(self, key: Key, value):
+        self.cache[key] = value
+        waiter = self.waiters.pop(key, None)
+        if waiter is not None:
+            waiter(value)
+
+    def _on_finished(self, task: Task):
+        if self.current is None or self.current[1] is not task:
+            return
+        self.waiters.pop(self.current[0], None)
+        self.current = None
+        self._advance()
+
+    def _cancel_current(self):
+        if self.current is not None:
+            self.runner.cancel("speculative")
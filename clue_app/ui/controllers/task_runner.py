@@ -0,0 +1,195 @@
+# ui/controllers/task_runner.py
+
+import threading
+import traceback
+from typing import Callable, Dict, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from core.logger import get_logger
+from core.progress import OperationCancelled
+
+
+logger = get_logger("tasks")
+
+
+class TaskSignals(QObject):
+    """
+    QRunnable cannot emit signals, so each task carries one of these.
+    Every signal passes the task first; they are emitted on a pool thread
+    and queued onto the GUI thread where the TaskRunner lives.
+    """
+
+    progress = Signal(object, object, str)  # task, fraction (None = unknown), message
+    result = Signal(object, object)         # task, return value
+    error = Signal(object, str)             # task, message
+    cancelled = Signal(object)
+    finished = Signal(object)
+
+
+class Task(QRunnable):
+    def __init__(self, resource: str, label: str, fn: Callable, args, kwargs):
+        super().__init__()
+        self.resource = resource
+        self.label = label
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = TaskSignals()
+
+        self.indicator = None
+        self.on_result: Optional[Callable] = None
+        self.on_error: Optional[Callable] = None
+        self.done_message = None
+        self.final_message = ""
+        self.failed = False
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def report(self, fraction: Optional[float] = None, message: str = ""):
+        """The progress callback handed to the task function; raises once cancelled."""
+        if self._cancel.is_set():
+            raise OperationCancelled(self.label)
+        self.signals.progress.emit(self, fraction, message)
+
+    def run(self):
+        try:
+            if self._cancel.is_set():
+                raise OperationCancelled(self.label)
+            value = self.fn(*self.args, progress=self.report, **self.kwargs)
+            if self._cancel.is_set():
+                raise OperationCancelled(self.label)
+            self.signals.result.emit(self, value)
+        except OperationCancelled:
+            logger.info("%s cancelled", self.label)
+            self.signals.cancelled.emit(self)
+        except Exception as exc:
+            logger.error("%s failed:\n%s", self.label, traceback.format_exc())
+            self.signals.error.emit(self, str(exc))
+        finally:
+            self.signals.finished.emit(self)
+
+
+class TaskRunner(QObject):
+    """
+    Runs heavy jobs on a QThreadPool, at most one per resource.
+    - submit() on a busy resource cancels the running job and queues the new
+      one to start as soon as it stops; an older queued request is dropped
+    - Task functions receive a `progress` keyword (core.progress protocol)
+    - Handlers run on the GUI thread and never see cancelled or superseded jobs
+    - The indicator stops when the job ends; done_message (a string, or a
+      function of the result) is left on it after a successful run
+    - on_finished(task) runs however the job ended (result, error or cancel)
+    """
+
+    def __init__(self, pool: Optional[QThreadPool] = None):
+        super().__init__()
+        self.pool = pool or QThreadPool.globalInstance()
+        self._running: Dict[str, Task] = {}
+        self._queued: Dict[str, Task] = {}
+
+    # ================= PUBLIC METHODS =================
+
+    def submit(
+        self,
+        resource: str,
+        fn: Callable,
+        *args,
+        label: str = "",
+        indicator=None,
+        on_result: Optional[Callable] = None,
+        on_error: Optional[Callable] = None,
+        done_message=None,
+        on_finished: Optional[Callable] = None,
+        **kwargs,
+    ) -> Task:
+        task = Task(resource, label or resource, fn, args, kwargs)
+        task.indicator = indicator
+        task.on_result = on_result
+        task.on_error = on_error
+        task.done_message = done_message
+
+        task.signals.progress.connect(self._on_progress)
+        task.signals.result.connect(self._on_result)
+        task.signals.error.connect(self._on_error)
+        task.signals.finished.connect(self._on_finished)
+        # connected before the task can start, after the runner's own bookkeeping
+        if on_finished is not None:
+            task.signals.finished.connect(on_finished)
+
+        running = self._running.get(resource)
+        if running is None:
+            self._start(task)
+            return task
+
+        stale = self._queued.pop(resource, None)
+        if stale is not None:
+            logger.info("%s superseded before it started", stale.label)
+        running.cancel()
+        self._queued[resource] = task
+        if indicator is not None:
+            indicator.start(f"{task.label}: waiting for the previous job to stop")
+        return task
+
+    def cancel(self, resource: str):
+        queued = self._queued.pop(resource, None)
+        if queued is not None and queued.indicator is not None:
+            queued.indicator.stop()
+
+        running = self._running.get(resource)
+        if running is not None:
+            running.cancel()
+            if running.indicator is not None:
+                running.indicator.set_progress(None, "Cancelling...")
+
+    def cancel_all(self):
+        for resource in list(self._running) + list(self._queued):
+            self.cancel(resource)
+
+    def is_busy(self, resource: str) -> bool:
+        return resource in self._running or resource in self._queued
+
+    # ================= LIFECYCLE =================
+
+    def _start(self, task: Task):
+        self._running[task.resource] = task
+        if task.indicator is not None:
+            task.indicator.start(task.label, on_cancel=lambda: self.cancel(task.resource))
+        self.pool.start(task)
+
+    def _on_progress(self, task: Task, fraction, message: str):
+        if not task.is_cancelled and task.indicator is not None:
+            task.indicator.set_progress(fraction, message)
+
+    def _on_result(self, task: Task, value):
+        if task.is_cancelled:
+            return
+        if task.done_message is not None:
+            task.final_message = task.done_message(value) if callable(task.done_message) else task.done_message
+        if task.on_result is not None:
+            task.on_result(value)
+
+    def _on_error(self, task: Task, message: str):
+        if task.is_cancelled:
+            return
+        task.failed = True
+        if task.indicator is not None:
+            task.indicator.fail(f"{task.label} failed: {message}")
+        if task.on_error is not None:
+            task.on_error(message)
+
+    def _on_finished(self, task: Task):
+        if self._running.get(task.resource) is task:
+            del self._running[task.resource]
+        if task.indicator is not None and not task.failed:
+            task.indicator.stop(task.final_message)
+
+        queued = self._queued.pop(task.resource, None)
+        if queued is not None:
+            self._start(queued)
@@ -1,219 +1,535 @@
-# ui/controllers/ui_controller.py
-
-from typing import Dict
-
-from ui.main_window import MainWindow
-from preprocessing.eda import eda_summary, generate_eda_charts, generate_preview_charts
-from pipeline.training_pipeline import run_training
-from pipeline.forecasting_pipeline import run_forecast
-from core.report_generator import generate_report
-from core.data_loader import load_financial_data
-from visualization.forecast_plot import plot_forecast
-
-
-class UIController:
-    def __init__(self, main_window: MainWindow):
-        self.main_window = main_window
-
-        self.current_model_type: str = "AUTO_ARIMA"
-        self.source_config: Dict = {}
-        self.last_training_result: Dict = {}
-        self.last_forecast_result: Dict = {}
-        self.last_metrics: Dict = {}
-        self.forecast_horizon: int = 30
-
-        # Navigation history for Back button
-        self.page_history = []
-
-        self._connect_signals()
-
-    # ================= SAFE NAVIGATION =================
-
-    def go_to(self, page):
-        """Navigate and store history safely."""
-        current = None
-        if hasattr(self.main_window, "stack"):
-            current = self.main_window.stack.currentWidget()
-        if current:
-            self.page_history.append(current)
-        self.main_window.go_to_page(page)
-
-    def go_back(self):
-        if self.page_history:
-            self.main_window.go_to_page(self.page_history.pop())
-
-    # ================= SIGNAL CONNECTIONS =================
-
-    def _connect_signals(self):
-        w = self.main_window
-
-        w.welcome_page.continue_clicked.connect(lambda: self.go_to(w.data_source_page))
-        w.data_source_page.data_config_ready.connect(self._on_data_selected)
-        w.model_selection_page.model_selected.connect(self._on_model_selected)
-        w.before_eda_page.run_eda_clicked.connect(self._run_eda)
-        w.after_eda_page.continue_to_model_clicked.connect(self._run_training)
-        w.model_result_page.continue_to_forecast_clicked.connect(self._run_forecast)
-
-        if hasattr(w.forecast_page, "continue_to_evaluation_clicked"):
-            w.forecast_page.continue_to_evaluation_clicked.connect(self._show_evaluation)
-
-        if hasattr(w.evaluation_page, "continue_to_report_clicked"):
-            w.evaluation_page.continue_to_report_clicked.connect(lambda: self.go_to(w.report_page))
-
-        if hasattr(w.report_page, "generate_report_clicked"):
-            w.report_page.generate_report_clicked.connect(self._generate_report)
-
-    # ================= DATA PREVIEW (BEFORE EDA) =================
-
-    def _on_data_selected(self, config: dict):
-        self.source_config = config
-        df = load_financial_data(**self.source_config)
-
-        summary = eda_summary(df)
-        preview_fig = generate_preview_charts(df)
-
-        page = self.main_window.before_eda_page
-        page.set_status("Preview of raw data (Before Cleaning)")
-        page.set_eda_summary(self._format_eda_summary(summary))
-        page.set_preview_plot(preview_fig)
-
-        self.go_to(page)
-
-    # ================= MODEL SELECTED =================
-
-    def _on_model_selected(self, model_type: str, horizon: int = 30):
-        self.current_model_type = model_type
-        self.forecast_horizon = horizon
-        self.go_to(self.main_window.before_eda_page)
-
-    # ================= FULL EDA =================
-
-    def _run_eda(self):
-        df = load_financial_data(**self.source_config)
-
-        summary = eda_summary(df)
-        fig = generate_eda_charts(df)
-
-        page = self.main_window.after_eda_page
-        page.set_eda_summary(self._format_eda_summary(summary))
-        page.set_eda_plot(fig)
-
-        self.go_to(page)
-
-    # ================= TRAIN MODEL =================
-
-    def _run_training(self):
-        result = run_training(
-            self.current_model_type,
-            self.source_config,
-            forecast_periods=self.forecast_horizon,
-        )
-
-        self.last_training_result = result
-        self.last_metrics = result.get("metrics", {})
-
-        model_order = result.get("model_order", "N/A")
-
-        self.main_window.model_result_page.set_results(
-            model_type=self.current_model_type,
-            model_order=model_order,
-            metrics=self.last_metrics,
-        )
-
-        self.go_to(self.main_window.model_result_page)
-
-    # ================= FORECAST =================
-
-    def _run_forecast(self):
-        result = run_forecast(
-            self.current_model_type,
-            self.source_config,
-            forecast_periods=self.forecast_horizon,
-        )
-
-        self.last_forecast_result = result
-        df = load_financial_data(**self.source_config)
-
-        fig = plot_forecast(
-            df,
-            result.get("forecast"),
-            result.get("confidence_intervals"),
-        )
-
-        page = self.main_window.forecast_page
-        page.set_forecast_plot(fig)
-
-        if hasattr(page, "set_predicted_values"):
-            page.set_predicted_values(result.get("forecast"))
-
-        self.go_to(page)
-
-    # ================= EVALUATION =================
-
-    def _show_evaluation(self):
-        if hasattr(self.main_window.evaluation_page, "set_metrics"):
-            self.main_window.evaluation_page.set_metrics(
-                self._format_metrics(self.last_metrics)
-            )
-        self.go_to(self.main_window.evaluation_page)
-
-    # ================= REPORT =================
-
-    def _generate_report(self, output_path: str):
-        if not output_path:
-            output_path = "clue_report.pdf"
-        if not output_path.lower().endswith(".pdf"):
-            output_path += ".pdf"
-
-        df = load_financial_data(**self.source_config)
-
-        generate_report(
-            output_path=output_path,
-            title="CLUE Forecasting Report",
-            model_results={
-                "model_type": self.current_model_type,
-                **self.last_training_result,
-            },
-            metrics=self.last_metrics,
-            eda_summary=self._format_eda_summary(eda_summary(df)),
-            eda_fig=generate_eda_charts(df),
-            forecast_fig=plot_forecast(
-                df,
-                self.last_forecast_result.get("forecast"),
-                self.last_forecast_result.get("confidence_intervals"),
-            ),
-            predicted_values=self.last_forecast_result.get("forecast"),
-            notes="Generated by CLUE AI Forecasting System",
-        )
-
-    # ================= HELPERS =================
-
-    def _format_eda_summary(self, summary: dict) -> str:
-        stats = summary.get("basic_stats", {})
-        returns = summary.get("returns_stats", {})
-
-        return (
-            "DATA OVERVIEW\n"
-            f"Start Date   : {stats.get('start_date')}\n"
-            f"End Date     : {stats.get('end_date')}\n"
-            f"Observations : {stats.get('n_observations')}\n\n"
-            "PRICE STATISTICS\n"
-            f"Min  : {stats.get('min'):.2f}\n"
-            f"Max  : {stats.get('max'):.2f}\n"
-            f"Mean : {stats.get('mean'):.2f}\n"
-            f"Std  : {stats.get('std'):.2f}\n\n"
-            "RETURNS\n"
-            f"Mean Daily Return : {returns.get('mean_daily_return'):.4f}\n"
-            f"Volatility        : {returns.get('volatility'):.4f}\n"
-        )
-
-    def _format_metrics(self, metrics: dict) -> str:
-        if not metrics:
-            return "No metrics available."
-
-        return (
-            f"MAE  : {metrics.get('MAE', 0.0):.4f}\n"
-            f"MSE  : {metrics.get('MSE', 0.0):.4f}\n"
-            f"RMSE : {metrics.get('RMSE', 0.0):.4f}\n"
-            f"MAPE : {metrics.get('MAPE', 0.0):.4f}%"
+# ui/controllers/ui_controller.py
+
+import threading
+from typing import Dict
+
+from ui.main_window import MainWindow
+from ui.controllers.task_runner import TaskRunner
+from ui.controllers.speculation import SpeculativeScheduler
+from core.lazy import lazy_module, preload
+from core.progress import report, scaled
+
+# the scientific stack loads on first use, or from warm_up() after the first paint
+data_loader = lazy_module("core.data_loader")
+eda_engine = lazy_module("preprocessing.eda_engine")
+eda = lazy_module("preprocessing.eda")
+rendering = lazy_module("visualization.render_service")
+forecasting_pipeline = lazy_module("pipeline.forecasting_pipeline")
+retraining = lazy_module("pipeline.retraining")
+streaming = lazy_module("evaluation.streaming")
+workers = lazy_module("core.worker_pool")
+jobs = lazy_module("pipeline.jobs")
+sessions = lazy_module("core.session")
+
+# in the order a user reaches them; model and report work runs in the worker pool
+WARM_UP_MODULES = (
+    "core.data_loader",
+    "preprocessing.eda",
+    "visualization.render_service",
+    "visualization.lod",
+    "pipeline.forecasting_pipeline",
+    "evaluation.streaming",
+)
+
+# wizard pages in order; a restored session replays them up to the one it was saved on
+WIZARD_PAGES = (
+    "before_eda_page",
+    "after_eda_page",
+    "model_result_page",
+    "forecast_page",
+    "evaluation_page",
+    "report_page",
+)
+
+
+# ================= BACKGROUND JOBS =================
+# run on the task pool; they take the `progress` keyword of core.progress
+
+def _load_eda(source_config: Dict, progress=None):
+    """Data plus one cached engine pass that feeds both the summary and the charts."""
+    report(progress, 0.0, "Loading data")
+    df = data_loader.load_financial_data(**source_config)
+
+    report(progress, 0.6, "Computing statistics")
+    stats = eda_engine.compute_eda(df)
+    return df, stats, eda.eda_summary(df, stats=stats)
+
+
+# the rest hand off to a warm worker process and wait there; the data goes as a
+# shared memory handle, and jobs for one dataset share a worker (and its fitted models)
+
+def _train(model_type: str, source_config: Dict, horizon: int, data, progress=None):
+    with data.pinned() as handle:
+        return workers.worker_pool.run(
+            jobs.train, model_type, source_config, horizon, handle,
+            affinity=retraining.dataset_key(source_config), progress=progress,
+        )
+
+
+def _forecast(model_type: str, source_config: Dict, horizon: int, data, progress=None):
+    with data.pinned() as handle:
+        return workers.worker_pool.run(
+            jobs.forecast, model_type, source_config, horizon, handle,
+            affinity=retraining.dataset_key(source_config), progress=progress,
+        )
+
+
+def _build_report(output_path: str, model_type: str, training_result, forecast_result, metrics, data, progress=None):
+    with data.pinned() as handle:
+        return workers.worker_pool.run(
+            jobs.build_report, output_path, model_type, training_result, forecast_result, metrics, handle,
+            progress=progress,
+        )
+
+
+def _refresh_live_metrics(monitor, source_config: Dict, progress=None):
+    """Reloads the source (a network fetch for Yahoo) and scores the forecast on new prices."""
+    report(progress, None, "Fetching new prices")
+    return forecasting_pipeline.update_forecast_monitor(monitor, source_config)
+
+
+def _write_session(path: str, session, source_config: Dict, progress=None):
+    """Collects the dataset's fitted models from its worker, then writes the bundle."""
+    report(progress, 0.0, "Collecting models")
+    key = retraining.dataset_key(source_config)
+    session.models = workers.worker_pool.run(jobs.export_models, key, affinity=key, progress=scaled(progress, 0.0, 0.1))
+    return sessions.save_session(path, session, progress=scaled(progress, 0.1, 1.0))
+
+
+def _read_session(path: str, load_models: bool, progress=None):
+    """The bundle (with its models back in the dataset's worker if trusted), plus the EDA pass the pages show."""
+    session = sessions.load_session(path, load_models=load_models, progress=scaled(progress, 0.0, 0.2))
+    if session.models is not None:
+        report(progress, 0.2, "Restoring models")
+        key = retraining.dataset_key(session.ui_state["source_config"])
+        workers.worker_pool.run(
+            jobs.restore_models, key, session.models, affinity=key, progress=scaled(progress, 0.2, 0.6)
+        )
+
+    report(progress, 0.6, "Computing statistics")
+    df = session.data
+    stats = eda_engine.compute_eda(df)
+    return session, (df, stats, eda.eda_summary(df, stats=stats))
+
+
+class UIController:
+    def __init__(self, main_window: MainWindow):
+        self.main_window = main_window
+
+        self.current_model_type: str = "AUTO_ARIMA"
+        self.source_config: Dict = {}
+        self.data = None
+        self.shared_data = None
+        self.loaded = None
+        self.last_training_result: Dict = {}
+        self.last_forecast_result: Dict = {}
+        self.last_metrics: Dict = {}
+        self.forecast_monitor = None
+        self.forecast_horizon: int = 30
+
+        # Navigation history for Back button
+        self.page_history = []
+
+        # heavy work runs here, one job per resource ("data", "model", "report")
+        self.tasks = TaskRunner()
+        # the next steps run ahead at low priority once data is loaded
+        self.speculation = SpeculativeScheduler({"train": _train, "forecast": _forecast}, self.tasks)
+
+        self._connect_signals()
+
+    # ================= SAFE NAVIGATION =================
+
+    def go_to(self, page):
+        """Navigate and store history safely."""
+        current = None
+        if hasattr(self.main_window, "stack"):
+            current = self.main_window.stack.currentWidget()
+        if current:
+            self.page_history.append(current)
+        self.main_window.go_to_page(page)
+
+    def go_back(self):
+        if self.page_history:
+            self.main_window.go_to_page(self.page_history.pop())
+
+    # ================= SIGNAL CONNECTIONS =================
+
+    def _connect_signals(self):
+        w = self.main_window
+
+        # pages are built on first navigation, so each is wired as it appears
+        w.page_created.connect(self._wire_page)
+        w.open_session_requested.connect(self._open_session)
+        w.save_session_requested.connect(self._save_session)
+        for name, page in w.created_pages().items():
+            self._wire_page(name, page)
+
+    def _wire_page(self, name: str, page):
+        w = self.main_window
+
+        if name == "welcome_page":
+            page.continue_clicked.connect(lambda: self.go_to(w.data_source_page))
+        elif name == "data_source_page":
+            page.data_config_ready.connect(self._on_data_selected)
+        elif name == "model_selection_page":
+            page.model_selected.connect(self._on_model_selected)
+        elif name == "before_eda_page":
+            page.run_eda_clicked.connect(self._run_eda)
+        elif name == "after_eda_page":
+            page.continue_to_model_clicked.connect(self._run_training)
+        elif name == "model_result_page":
+            page.continue_to_forecast_clicked.connect(self._run_forecast)
+        elif name == "forecast_page" and hasattr(page, "continue_to_evaluation_clicked"):
+            page.continue_to_evaluation_clicked.connect(self._show_evaluation)
+        elif name == "evaluation_page" and hasattr(page, "continue_to_report_clicked"):
+            page.continue_to_report_clicked.connect(lambda: self.go_to(w.report_page))
+        elif name == "report_page" and hasattr(page, "generate_report_clicked"):
+            page.generate_report_clicked.connect(self._generate_report)
+
+    # ================= STARTUP / SHUTDOWN =================
+
+    def warm_up(self):
+        """Imports the heavy modules and starts the worker pool in the background once the first screen is up."""
+        preload(WARM_UP_MODULES)
+        # even importing core.worker_pool pulls in pandas, so it happens on this thread too
+        threading.Thread(target=lambda: workers.worker_pool.warm_up(), name="clue-workers-start", daemon=True).start()
+
+    def shutdown(self):
+        self.speculation.reset()
+        self.tasks.cancel_all()
+        if rendering.loaded:
+            rendering.render_service.shutdown()
+        if workers.loaded:
+            workers.worker_pool.shutdown()
+            if self.shared_data is not None:
+                self.shared_data.retire()
+
+    # ================= DATA PREVIEW (BEFORE EDA) =================
+
+    def _on_data_selected(self, config: dict):
+        self.source_config = config
+        self.loaded = None
+
+        # anything still running, rendering or precomputed for the previous source is stale now
+        self.speculation.reset()
+        self.tasks.cancel("model")
+        if rendering.loaded:
+            rendering.render_service.cancel("eda")
+
+        self.tasks.submit(
+            "data",
+            _load_eda,
+            self.source_config,
+            label="Loading data",
+            indicator=self.main_window.data_source_page.busy,
+            on_result=self._show_preview,
+        )
+
+    def _show_preview(self, loaded):
+        self.loaded = loaded
+        self._set_data(loaded[0])
+        self.speculation.start(self.source_config, self.shared_data, self.current_model_type, self.forecast_horizon)
+        self._go_to_preview(loaded)
+
+    def _go_to_preview(self, loaded):
+        df, stats, summary = loaded
+        page = self.main_window.before_eda_page
+        page.set_status("Preview of raw data (Before Cleaning)")
+        page.set_eda_summary(eda.format_eda_summary(summary))
+        page.set_data_preview(df)
+        page.render_preview_plot(eda.generate_preview_charts, df, stats)
+
+        self.go_to(page)
+
+    # ================= MODEL SELECTED =================
+
+    def _on_model_selected(self, model_type: str, horizon: int = 30):
+        self.current_model_type = model_type
+        self.forecast_horizon = horizon
+        if self.shared_data is not None:
+            self.speculation.start(self.source_config, self.shared_data, model_type, horizon)
+        self.go_to(self.main_window.before_eda_page)
+
+    # ================= FULL EDA =================
+
+    def _run_eda(self):
+        # the preview load already computed the statistics for this source
+        if self.loaded is not None:
+            self._show_eda(self.loaded)
+            return
+
+        self.tasks.submit(
+            "data",
+            _load_eda,
+            self.source_config,
+            label="Running EDA",
+            indicator=self.main_window.before_eda_page.busy,
+            on_result=self._show_eda,
+        )
+
+    def _show_eda(self, loaded):
+        df, stats, summary = loaded
+        if df is not self.data:
+            self._set_data(df)
+            self.speculation.start(self.source_config, self.shared_data, self.current_model_type, self.forecast_horizon)
+
+        page = self.main_window.after_eda_page
+        page.set_eda_summary(eda.format_eda_summary(summary))
+        page.render_eda_plot(eda.generate_eda_charts, df, stats)
+
+        self.go_to(page)
+
+    # ================= TRAIN MODEL =================
+
+    def _run_training(self):
+        self._run_model_step(
+            "train",
+            _train,
+            label=f"Training {self.current_model_type}",
+            indicator=self.main_window.after_eda_page.busy,
+            on_result=self._show_training,
+        )
+
+    def _show_training(self, result: Dict):
+        self.last_training_result = result
+        self.last_metrics = result.get("metrics", {})
+
+        model_order = result.get("model_order", "N/A")
+
+        self.main_window.model_result_page.set_results(
+            model_type=self.current_model_type,
+            model_order=model_order,
+            metrics=self.last_metrics,
+        )
+
+        self.go_to(self.main_window.model_result_page)
+
+    # ================= FORECAST =================
+
+    def _run_forecast(self):
+        self._run_model_step(
+            "forecast",
+            _forecast,
+            label=f"Forecasting with {self.current_model_type}",
+            indicator=self.main_window.model_result_page.busy,
+            on_result=self._show_forecast,
+        )
+
+    def _show_forecast(self, result: Dict):
+        self.last_forecast_result = result
+        self.forecast_monitor = streaming.monitor_forecast(result.get("forecast"), result.get("origin"))
+
+        page = self.main_window.forecast_page
+        page.update_forecast(
+            self.data["Close"],
+            result.get("forecast"),
+            result.get("confidence_intervals"),
+            fan=result.get("simulation", {}).get("quantiles"),
+        )
+
+        if hasattr(page, "set_predicted_values"):
+            page.set_predicted_values(result.get("forecast"), result.get("confidence_intervals"))
+
+        self.go_to(page)
+
+    # ================= EVALUATION =================
+
+    def _show_evaluation(self):
+        page = self.main_window.evaluation_page
+        if hasattr(page, "set_metrics"):
+            page.set_metrics(
+                self._format_metrics(
+                    self.last_metrics,
+                    self.last_training_result.get("metric_intervals", {}),
+                )
+            )
+        # reloading the source can be a network fetch, so it never runs on the GUI thread
+        if self.forecast_monitor is not None and hasattr(page, "set_live_metrics"):
+            self.tasks.submit(
+                "data",
+                _refresh_live_metrics,
+                self.forecast_monitor,
+                self.source_config,
+                label="Checking for new prices",
+                indicator=page.busy,
+                on_result=page.set_live_metrics,
+            )
+        self.go_to(page)
+
+    # ================= REPORT =================
+
+    def _generate_report(self, output_path: str):
+        if not output_path:
+            output_path = "clue_report.pdf"
+        if not output_path.lower().endswith(".pdf"):
+            output_path += ".pdf"
+
+        # the job works on a snapshot, so later navigation cannot change its inputs
+        self.speculation.preempt()
+        self.tasks.submit(
+            "report",
+            _build_report,
+            output_path,
+            self.current_model_type,
+            dict(self.last_training_result),
+            dict(self.last_forecast_result),
+            dict(self.last_metrics),
+            self.shared_data,
+            label="Generating report",
+            indicator=self.main_window.report_page.busy,
+            done_message=lambda path: f"Report saved to {path}",
+        )
+
+    # ================= SESSIONS =================
+
+    def _save_session(self, path: str):
+        indicator = getattr(self.main_window.stack.currentWidget(), "busy", None) or self.main_window.data_source_page.busy
+        if self.data is None:
+            indicator.fail("Load data before saving a session")
+            return
+        if not path.lower().endswith(".clue"):
+            path += ".clue"
+
+        session = sessions.Session(
+            data=self.data,
+            results={
+                "training": dict(self.last_training_result),
+                "forecast": dict(self.last_forecast_result),
+                "metrics": dict(self.last_metrics),
+                # precomputed steps too, so nothing already trained runs again after opening
+                "steps": dict(self.speculation.cache),
+            },
+            ui_state=self._ui_state(),
+        )
+
+        # collecting the models waits for the dataset's worker, so free it as a report would
+        self.speculation.preempt()
+        self.tasks.submit(
+            "session",
+            _write_session,
+            path,
+            session,
+            self.source_config,
+            label="Saving session",
+            indicator=indicator,
+            done_message=lambda saved: f"Session saved to {saved}",
+        )
+
+    def _open_session(self, path: str, load_models: bool = False):
+        self.loaded = None
+
+        # like choosing a new source: everything for the current data is stale
+        self.speculation.reset()
+        self.tasks.cancel("model")
+        if rendering.loaded:
+            rendering.render_service.cancel("eda")
+
+        page = self.main_window.data_source_page
+        if self.main_window.stack.currentWidget() is not page:
+            self.go_to(page)
+        self.tasks.submit(
+            "data",
+            _read_session,
+            path,
+            load_models,
+            label="Opening session",
+            indicator=page.busy,
+            on_result=self._restore_session,
+        )
+
+    def _restore_session(self, restored):
+        session, loaded = restored
+        state = session.ui_state
+
+        self.source_config = dict(state["source_config"])
+        self.current_model_type = state["model_type"]
+        self.forecast_horizon = state["horizon"]
+        self.last_training_result = session.results.get("training", {})
+        self.last_forecast_result = session.results.get("forecast", {})
+        self.last_metrics = session.results.get("metrics", {})
+        self.forecast_monitor = None
+
+        self.loaded = loaded
+        self._set_data(loaded[0])
+        self.speculation.start(
+            self.source_config,
+            self.shared_data,
+            self.current_model_type,
+            self.forecast_horizon,
+            cached=session.results.get("steps"),
+        )
+
+        # replay the wizard up to the saved page, so the pages behind it (and Back) work as before
+        page = state.get("page")
+        reached = WIZARD_PAGES.index(page) if page in WIZARD_PAGES else 0
+        self._go_to_preview(loaded)
+        if reached >= 1:
+            self._show_eda(loaded)
+        if reached >= 2 and self.last_training_result:
+            self._show_training(self.last_training_result)
+        if reached >= 3 and self.last_forecast_result:
+            self._show_forecast(self.last_forecast_result)
+        if reached >= 4:
+            self._show_evaluation()
+        if reached >= 5:
+            self.go_to(self.main_window.report_page)
+
+    def _ui_state(self) -> Dict:
+        current = self.main_window.stack.currentWidget()
+        return {
+            "source_config": dict(self.source_config),
+            "model_type": self.current_model_type,
+            "horizon": self.forecast_horizon,
+            "page": next((name for name, page in self.main_window.created_pages().items() if page is current), None),
+        }
+
+    # ================= HELPERS =================
+
+    def _run_model_step(self, step: str, job, label: str, indicator, on_result):
+        """Uses the precomputed (or still running) speculative result when there is one."""
+        key = (step, self.current_model_type, self.forecast_horizon)
+        if self.speculation.claim(key, label, indicator, on_result):
+            return
+
+        def done(value):
+            self.speculation.record(key, value)
+            on_result(value)
+
+        self.speculation.preempt(self.current_model_type)
+        self.tasks.submit(
+            "model",
+            job,
+            self.current_model_type,
+            self.source_config,
+            self.forecast_horizon,
+            self.shared_data,
+            label=label,
+            indicator=indicator,
+            on_result=done,
+        )
+
+    def _set_data(self, df):
+        """Keeps the loaded frame for plots and republishes it to the workers' shared memory."""
+        if self.shared_data is not None:
+            self.shared_data.retire()
+        self.data = df
+        self.shared_data = workers.share_frame(df)
+
+    def _format_metrics(self, metrics: dict, intervals: dict = None) -> str:
+        if not metrics:
+            return "No metrics available."
+
+        intervals = intervals or {}
+
+        def ci(name: str) -> str:
+            if name not in intervals:
+                return ""
+            low, high = intervals[name]
+            return f"   (95% CI {low:.4f} - {high:.4f})"
+
+        return (
+            f"MAE  : {metrics.get('MAE', 0.0):.4f}{ci('MAE')}\n"
+            f"MSE  : {metrics.get('MSE', 0.0):.4f}{ci('MSE')}\n"
+            f"RMSE : {metrics.get('RMSE', 0.0):.4f}{ci('RMSE')}\n"
+            f"MAPE : {metrics.get('MAPE', 0.0):.4f}%{ci('MAPE')}"
         )
\ No newline at end of file
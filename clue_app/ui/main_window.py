@@ -1,52 +1,111 @@
-from PySide6.QtWidgets import QMainWindow, QStackedWidget
-
-from ui.pages.welcome_page import WelcomePage
-from ui.pages.model_selection_page import ModelSelectionPage
-from ui.pages.before_eda_page import BeforeEDAPage
-from ui.pages.after_eda_page import AfterEDAPage
-from ui.pages.model_result_page import ModelResultPage
-from ui.pages.forecast_page import ForecastPage
-from ui.pages.evaluation_page import EvaluationPage
-from ui.pages.report_page import ReportPage
-from ui.pages.data_source_page import DataSourcePage
-
-
-class MainWindow(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("CLUE - Financial Forecasting")
-
-        # ✅ Correct and consistent stack usage
-        self.stack = QStackedWidget()
-        self.setCentralWidget(self.stack)
-
-        self._init_pages()
-
-        # ✅ Show Welcome Page FIRST
-        self.stack.setCurrentWidget(self.welcome_page)
-
-    def _init_pages(self):
-        self.welcome_page = WelcomePage()
-        self.data_source_page = DataSourcePage()
-        self.model_selection_page = ModelSelectionPage()
-        self.before_eda_page = BeforeEDAPage()
-        self.after_eda_page = AfterEDAPage()
-        self.model_result_page = ModelResultPage()
-        self.forecast_page = ForecastPage()
-        self.evaluation_page = EvaluationPage()
-        self.report_page = ReportPage()
-
-        # ✅ Add ALL pages to stack
-        self.stack.addWidget(self.welcome_page)
-        self.stack.addWidget(self.data_source_page)
-        self.stack.addWidget(self.model_selection_page)
-        self.stack.addWidget(self.before_eda_page)
-        self.stack.addWidget(self.after_eda_page)
-        self.stack.addWidget(self.model_result_page)
-        self.stack.addWidget(self.forecast_page)
-        self.stack.addWidget(self.evaluation_page)
-        self.stack.addWidget(self.report_page)
-
-    # ✅ Universal navigation
-    def go_to_page(self, page):
-        self.stack.setCurrentWidget(page)
+import importlib
+
+from PySide6.QtCore import Signal
+from PySide6.QtGui import QKeySequence
+from PySide6.QtWidgets import QFileDialog, QMainWindow, QMessageBox, QStackedWidget
+
+from ui.pages.welcome_page import WelcomePage
+
+
+# attribute name -> (module, class); pages are imported and built on first access
+PAGES = {
+    "data_source_page": ("ui.pages.data_source_page", "DataSourcePage"),
+    "model_selection_page": ("ui.pages.model_selection_page", "ModelSelectionPage"),
+    "before_eda_page": ("ui.pages.before_eda_page", "BeforeEDAPage"),
+    "after_eda_page": ("ui.pages.after_eda_page", "AfterEDAPage"),
+    "model_result_page": ("ui.pages.model_result_page", "ModelResultPage"),
+    "forecast_page": ("ui.pages.forecast_page", "ForecastPage"),
+    "evaluation_page": ("ui.pages.evaluation_page", "EvaluationPage"),
+    "report_page": ("ui.pages.report_page", "ReportPage"),
+}
+
+SESSION_FILTER = "CLUE Sessions (*.clue)"
+
+
+class MainWindow(QMainWindow):
+    # emitted once per page, right after it is built (name, page)
+    page_created = Signal(str, object)
+    # File menu; each carries the chosen path (opening also whether to load the fitted models)
+    open_session_requested = Signal(str, bool)
+    save_session_requested = Signal(str)
+
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("CLUE - Financial Forecasting")
+
+        # ✅ Correct and consistent stack usage
+        self.stack = QStackedWidget()
+        self.setCentralWidget(self.stack)
+
+        self._pages = {}
+        self._init_pages()
+        self._init_menu()
+
+        # ✅ Show Welcome Page FIRST
+        self.stack.setCurrentWidget(self.welcome_page)
+
+    def _init_pages(self):
+        # only the first screen is built eagerly; the rest on first navigation
+        self.welcome_page = WelcomePage()
+        self.stack.addWidget(self.welcome_page)
+        self._pages["welcome_page"] = self.welcome_page
+
+    def _init_menu(self):
+        file_menu = self.menuBar().addMenu("&File")
+        file_menu.addAction("&Open Session...", QKeySequence.Open, self._choose_session_to_open)
+        file_menu.addAction("&Save Session...", QKeySequence.Save, self._choose_session_to_save)
+
+    def _choose_session_to_open(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Open Session", "", SESSION_FILTER)
+        if not path:
+            return
+
+        # the fitted models are pickled, and unpickling a file can run any code in it
+        box = QMessageBox(self)
+        box.setIcon(QMessageBox.Warning)
+        box.setWindowTitle("Open Session")
+        box.setText("Load the fitted models saved in this session?")
+        box.setInformativeText(
+            "Models are stored with Python pickle, which can run code when loaded. "
+            "Only load models from a session file you trust. Without them, the data "
+            "and results still open and models are trained again when needed."
+        )
+        trusted = box.addButton("Load Models", QMessageBox.AcceptRole)
+        untrusted = box.addButton("Open Without Models", QMessageBox.ActionRole)
+        box.addButton(QMessageBox.Cancel)
+        box.setDefaultButton(untrusted)
+        box.exec()
+
+        if box.clickedButton() in (trusted, untrusted):
+            self.open_session_requested.emit(path, box.clickedButton() is trusted)
+
+    def _choose_session_to_save(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Save Session", "", SESSION_FILTER)
+        if path:
+            self.save_session_requested.emit(path)
+
+    # ================= DEFERRED PAGES =================
+
+    def __getattr__(self, name):
+        # only reached for attributes that don't exist yet, i.e. unbuilt pages
+        if name in PAGES:
+            return self.page(name)
+        raise AttributeError(name)
+
+    def page(self, name: str):
+        if name not in self._pages:
+            module_name, class_name = PAGES[name]
+            page = getattr(importlib.import_module(module_name), class_name)()
+
+            self._pages[name] = page
+            setattr(self, name, page)
+            self.stack.addWidget(page)
+            self.page_created.emit(name, page)
+        return self._pages[name]
+
+    def created_pages(self):
+        return dict(self._pages)
+
+    # ✅ Universal navigation
+    def go_to_page(self, page):
+        self.stack.setCurrentWidget(page)
@@ -1,67 +1,90 @@
-from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QTextEdit, QPushButton,
-    QScrollArea, QSizePolicy
-)
-from PySide6.QtCore import Qt
-from ui.widgets.matplotlib_canvas import MatplotlibCanvas
-
-
-class BeforeEDAPage(QWidget):
-    def __init__(self):
-        super().__init__()
-
-        layout = QVBoxLayout(self)
-        layout.setSpacing(15)
-
-        self.title = QLabel("Before EDA - Raw Data Preview")
-        self.title.setAlignment(Qt.AlignCenter)
-        self.title.setStyleSheet("font-size: 18px; font-weight: bold;")
-        layout.addWidget(self.title)
-
-        self.status_label = QLabel("")
-        layout.addWidget(self.status_label)
-
-        self.summary_box = QTextEdit()
-        self.summary_box.setReadOnly(True)
-        self.summary_box.setMinimumHeight(200)
-        self.summary_box.setStyleSheet("""
-            background:#1e1e1e;
-            color:white;
-            padding:10px;
-            font-family: Consolas;
-        """)
-        layout.addWidget(self.summary_box)
-
-        # SCROLL AREA FOR PLOT
-        self.scroll = QScrollArea()
-        self.scroll.setWidgetResizable(True)
-
-        self.plot_widget = QWidget()
-        self.plot_layout = QVBoxLayout(self.plot_widget)
-        self.plot_layout.setContentsMargins(0, 0, 0, 0)
-
-        self.canvas = MatplotlibCanvas()
-        self.canvas.setMinimumHeight(900)
-        self.canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-
-        self.plot_layout.addWidget(self.canvas)
-        self.scroll.setWidget(self.plot_widget)
-
-        layout.addWidget(self.scroll, stretch=1)
-
-        self.run_eda_btn = QPushButton("Run Full EDA")
-        self.run_eda_btn.setFixedHeight(40)
-        layout.addWidget(self.run_eda_btn)
-
-    def set_status(self, text):
-        self.status_label.setText(text)
-
-    def set_eda_summary(self, text):
-        self.summary_box.setPlainText(text)
-
-    def set_preview_plot(self, fig):
-        self.canvas.draw_figure(fig)
-
-    @property
-    def run_eda_clicked(self):
-        return self.run_eda_btn.clicked
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTextEdit, QPushButton,
+    QScrollArea, QSizePolicy
+)
+from PySide6.QtCore import Qt
+from ui.widgets.busy_indicator import BusyIndicator
+from ui.widgets.chart_view import ChartView
+from ui.widgets.data_table import DataTable
+
+
+class BeforeEDAPage(QWidget):
+    def __init__(self):
+        super().__init__()
+
+        layout = QVBoxLayout(self)
+        layout.setSpacing(15)
+
+        self.title = QLabel("Before EDA - Raw Data Preview")
+        self.title.setAlignment(Qt.AlignCenter)
+        self.title.setStyleSheet("font-size: 18px; font-weight: bold;")
+        layout.addWidget(self.title)
+
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+
+        self.summary_box = QTextEdit()
+        self.summary_box.setReadOnly(True)
+        self.summary_box.setMinimumHeight(200)
+        self.summary_box.setStyleSheet("""
+            background:#1e1e1e;
+            color:white;
+            padding:10px;
+            font-family: Consolas;
+        """)
+
+        # raw rows next to the summary; virtualized, so any length is fine
+        self.data_table = DataTable("Raw Data")
+        self.data_table.setMinimumHeight(200)
+
+        top_layout = QHBoxLayout()
+        top_layout.addWidget(self.summary_box, stretch=1)
+        top_layout.addWidget(self.data_table, stretch=1)
+        layout.addLayout(top_layout)
+
+        # SCROLL AREA FOR PLOT
+        self.scroll = QScrollArea()
+        self.scroll.setWidgetResizable(True)
+
+        self.plot_widget = QWidget()
+        self.plot_layout = QVBoxLayout(self.plot_widget)
+        self.plot_layout.setContentsMargins(0, 0, 0, 0)
+
+        # rendered off the GUI thread; interactive canvas on demand
+        self.chart = ChartView(min_height=900)
+        self.chart.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+        self.plot_layout.addWidget(self.chart)
+        self.scroll.setWidget(self.plot_widget)
+
+        layout.addWidget(self.scroll, stretch=1)
+
+        self.busy = BusyIndicator()
+        layout.addWidget(self.busy)
+
+        self.run_eda_btn = QPushButton("Run Full EDA")
+        self.run_eda_btn.setFixedHeight(40)
+        layout.addWidget(self.run_eda_btn)
+
+    def set_status(self, text):
+        self.status_label.setText(text)
+
+    def set_eda_summary(self, text):
+        self.summary_box.setPlainText(text)
+
+    def set_data_preview(self, df):
+        """Shows the loaded frame as is: the date index, then every column."""
+        columns = {df.index.name or "Date": df.index}
+        columns.update({str(name): df[name] for name in df.columns})
+        self.data_table.set_columns(columns)
+
+    def set_preview_plot(self, fig):
+        self.chart.show_figure(fig)
+
+    def render_preview_plot(self, builder, *args):
+        """Builds the figure in the background; the bitmap appears when ready."""
+        self.chart.render_chart("preview", builder, *args)
+
+    @property
+    def run_eda_clicked(self):
+        return self.run_eda_btn.clicked
@@ -1,42 +1,75 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTextEdit, QPushButton
-from PySide6.QtCore import Signal
-
-class EvaluationPage(QWidget):
-
-    continue_to_report_clicked = Signal()
-
-    def __init__(self):
-        super().__init__()
-
-        layout = QVBoxLayout(self)
-
-        title = QLabel("Model Evaluation Dashboard")
-        title.setStyleSheet("font-size:18px;font-weight:bold;")
-        layout.addWidget(title)
-
-        self.metrics_box = QTextEdit()
-        self.metrics_box.setReadOnly(True)
-        layout.addWidget(self.metrics_box)
-
-        self.report_button = QPushButton("Generate Detailed Report")
-        self.report_button.setFixedHeight(40)
-        layout.addWidget(self.report_button)
-
-        self.report_button.clicked.connect(self.continue_to_report_clicked.emit)
-
-    def set_metrics(self, metrics: dict):
-        """Accepts dict and converts to formatted evaluation display"""
-
-        if not isinstance(metrics, dict):
-            self.metrics_box.setPlainText(str(metrics))
-            return
-
-        detailed_text = "MODEL PERFORMANCE METRICS\n\n"
-
-        for key, value in metrics.items():
-            if isinstance(value, float):
-                detailed_text += f"{key:<15}: {value:.6f}\n"
-            else:
-                detailed_text += f"{key:<15}: {value}\n"
-
-        self.metrics_box.setPlainText(detailed_text)
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTextEdit, QPushButton
+from PySide6.QtCore import Signal
+
+from ui.widgets.busy_indicator import BusyIndicator
+
+class EvaluationPage(QWidget):
+
+    continue_to_report_clicked = Signal()
+
+    def __init__(self):
+        super().__init__()
+
+        layout = QVBoxLayout(self)
+
+        title = QLabel("Model Evaluation Dashboard")
+        title.setStyleSheet("font-size:18px;font-weight:bold;")
+        layout.addWidget(title)
+
+        self.metrics_box = QTextEdit()
+        self.metrics_box.setReadOnly(True)
+        layout.addWidget(self.metrics_box)
+
+        live_title = QLabel("Live Forecast Monitoring")
+        live_title.setStyleSheet("font-size:14px;font-weight:bold;")
+        layout.addWidget(live_title)
+
+        self.live_box = QTextEdit()
+        self.live_box.setReadOnly(True)
+        self.live_box.setPlainText("No realized prices since the forecast yet.")
+        layout.addWidget(self.live_box)
+
+        self.busy = BusyIndicator()
+        layout.addWidget(self.busy)
+
+        self.report_button = QPushButton("Generate Detailed Report")
+        self.report_button.setFixedHeight(40)
+        layout.addWidget(self.report_button)
+
+        self.report_button.clicked.connect(self.continue_to_report_clicked.emit)
+
+    def set_metrics(self, metrics: dict):
+        """Accepts dict and converts to formatted evaluation display"""
+
+        if not isinstance(metrics, dict):
+            self.metrics_box.setPlainText(str(metrics))
+            return
+
+        detailed_text = "MODEL PERFORMANCE METRICS\n\n"
+
+        for key, value in metrics.items():
+            if isinstance(value, float):
+                detailed_text += f"{key:<15}: {value:.6f}\n"
+            else:
+                detailed_text += f"{key:<15}: {value}\n"
+
+        self.metrics_box.setPlainText(detailed_text)
+
+    def set_live_metrics(self, live: dict):
+        """Accepts {"cumulative": {...}, "recent": {...}} from the forecast monitor"""
+
+        if not live or not live.get("cumulative", {}).get("Observations"):
+            self.live_box.setPlainText("No realized prices since the forecast yet.")
+            return
+
+        text = ""
+        for section, label in (("cumulative", "SINCE FORECAST"), ("recent", "RECENT WINDOW")):
+            text += f"{label}\n"
+            for key, value in live.get(section, {}).items():
+                if isinstance(value, float):
+                    text += f"{key:<22}: {value:.4f}\n"
+                else:
+                    text += f"{key:<22}: {value}\n"
+            text += "\n"
+
+        self.live_box.setPlainText(text)
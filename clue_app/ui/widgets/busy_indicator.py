@@ -0,0 +1,73 @@
+from PySide6.QtWidgets import QHBoxLayout, QLabel, QProgressBar, QPushButton, QWidget
+
+
+class BusyIndicator(QWidget):
+    """
+    Per-page strip for a background job: message, progress bar and Cancel.
+    Hidden while idle; an indeterminate bar is shown when progress is unknown.
+    """
+
+    def __init__(self):
+        super().__init__()
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.message_label = QLabel("")
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setFixedWidth(220)
+        self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.clicked.connect(self._on_cancel_clicked)
+
+        layout.addWidget(self.message_label, stretch=1)
+        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.cancel_btn)
+
+        self._on_cancel = None
+        self._title = ""
+        self.hide()
+
+    # ================= PUBLIC METHODS =================
+
+    def start(self, message: str, on_cancel=None):
+        self._title = message
+        self._on_cancel = on_cancel
+        self.message_label.setStyleSheet("")
+        self.message_label.setText(f"{message}...")
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.show()
+        self.cancel_btn.setVisible(on_cancel is not None)
+        self.cancel_btn.setEnabled(True)
+        self.show()
+
+    def set_progress(self, fraction, message: str = ""):
+        if fraction is None:
+            self.progress_bar.setRange(0, 0)
+        else:
+            self.progress_bar.setRange(0, 100)
+            self.progress_bar.setValue(int(round(100 * min(max(fraction, 0.0), 1.0))))
+        if message:
+            self.message_label.setText(f"{self._title}: {message}")
+        if message == "Cancelling...":
+            self.cancel_btn.setEnabled(False)
+
+    def stop(self, message: str = ""):
+        """Hides the strip, or leaves a short final message without the bar."""
+        self._on_cancel = None
+        if not message:
+            self.hide()
+            return
+        self.message_label.setStyleSheet("")
+        self.message_label.setText(message)
+        self.progress_bar.hide()
+        self.cancel_btn.hide()
+
+    def fail(self, message: str):
+        self.stop(message)
+        self.message_label.setStyleSheet("color: #ff4444;")
+
+    # ================= HELPERS =================
+
+    def _on_cancel_clicked(self):
+        if self._on_cancel is not None:
+            self._on_cancel()
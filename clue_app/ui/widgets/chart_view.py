@@ -0,0 +1,120 @@
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtWidgets import QHBoxLayout, QLabel, QPushButton, QVBoxLayout, QWidget
+
+from core.lazy import lazy_module
+
+# matplotlib stays off the page-construction path; both load on first chart
+canvas_module = lazy_module("ui.widgets.matplotlib_canvas")
+rendering = lazy_module("visualization.render_service")
+
+
+class ChartView(QWidget):
+    """
+    Chart area fed by the background render service.
+    - render_chart(slot, builder, ...): the figure is built and rasterized off the
+      GUI thread; the bitmap is shown when ready, older requests are dropped
+    - "Interactive" swaps the bitmap for a MatplotlibCanvas on the same
+      figure (zoom/pan with LOD), created only when first needed
+    """
+
+    # emitted from the render thread; Qt queues it onto the GUI thread
+    rendered = Signal(object)
+
+    def __init__(self, min_height: int = 400):
+        super().__init__()
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        # ================= TOOLBAR =================
+        toolbar = QHBoxLayout()
+        self.status_label = QLabel("")
+        self.interactive_btn = QPushButton("Interactive")
+        self.interactive_btn.setCheckable(True)
+        self.interactive_btn.setEnabled(False)
+        self.interactive_btn.toggled.connect(self._set_interactive)
+        toolbar.addWidget(self.status_label, stretch=1)
+        toolbar.addWidget(self.interactive_btn)
+        layout.addLayout(toolbar)
+
+        # ================= BITMAP =================
+        self.image_label = QLabel()
+        self.image_label.setAlignment(Qt.AlignHCenter | Qt.AlignTop)
+        self.image_label.setMinimumHeight(min_height)
+        layout.addWidget(self.image_label, stretch=1)
+
+        self.canvas = None
+        self._min_height = min_height
+        self._pixmap = None
+        self._figure = None
+
+        self.rendered.connect(self._on_rendered)
+
+    # ================= PUBLIC METHODS =================
+
+    def render_chart(self, slot: str, builder, *args, **kwargs):
+        self.status_label.setText("Rendering chart...")
+        rendering.render_service.submit(slot, builder, *args, callback=self.rendered.emit, **kwargs)
+
+    def show_figure(self, fig):
+        """Shows a figure that was already built, on the interactive canvas."""
+        self._figure = fig
+        self.interactive_btn.setEnabled(True)
+        if self.interactive_btn.isChecked():
+            self.canvas.draw_figure(fig)
+        else:
+            self.interactive_btn.setChecked(True)
+
+    # ================= RENDER RESULTS =================
+
+    def _on_rendered(self, result):
+        if not rendering.render_service.accept(result):
+            return  # superseded while the signal was queued
+
+        if "error" in result:
+            self.status_label.setText(f"Chart failed: {result['error']}")
+            return
+
+        image = QImage(
+            result["image"].data, result["width"], result["height"], QImage.Format_RGBA8888
+        ).copy()  # detach from the numpy buffer
+        self._pixmap = QPixmap.fromImage(image)
+        self._figure = result["figure"]
+        self.status_label.setText("")
+        self.interactive_btn.setEnabled(True)
+
+        if self.interactive_btn.isChecked():
+            self.canvas.draw_figure(self._figure)
+        else:
+            self._show_pixmap()
+
+    def _show_pixmap(self):
+        if self._pixmap is None:
+            return
+        scaled = self._pixmap.scaledToWidth(max(self.image_label.width(), 1), Qt.SmoothTransformation)
+        self.image_label.setPixmap(scaled)
+        self.image_label.setMinimumHeight(max(scaled.height(), self._min_height))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if not self.interactive_btn.isChecked():
+            self._show_pixmap()
+
+    # ================= INTERACTIVE CANVAS =================
+
+    def _set_interactive(self, enabled: bool):
+        if enabled:
+            if self.canvas is None:
+                self.canvas = canvas_module.MatplotlibCanvas()
+                self.canvas.setMinimumHeight(self._min_height)
+                self.layout().addWidget(self.canvas, stretch=1)
+            if self._figure is not None:
+                self.canvas.draw_figure(self._figure)
+            self.image_label.hide()
+            self.canvas.show()
+        else:
+            if self.canvas is not None:
+                self.canvas.hide()
+            self.image_label.show()
+            self._show_pixmap()
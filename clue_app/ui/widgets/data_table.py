@@ -0,0 +1,249 @@
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal
+from PySide6.QtGui import QGuiApplication, QKeySequence, QShortcut
+from PySide6.QtWidgets import (
+    QFileDialog, QHBoxLayout, QHeaderView, QLabel, QPushButton, QTableView, QVBoxLayout, QWidget
+)
+
+from core.lazy import lazy_module
+
+pd = lazy_module("pandas")
+
+
+# ================= HELPERS =================
+
+def _as_array(values) -> np.ndarray:
+    """numpy view of a column; tz-aware dates are shown in their own wall time."""
+    if getattr(getattr(values, "dtype", None), "tz", None) is not None:
+        values = values.tz_localize(None) if isinstance(values, pd.Index) else values.dt.tz_localize(None)
+    return np.asarray(values)
+
+
+def _formatter(values: np.ndarray, float_format: str):
+    if values.dtype.kind == "f":
+        return float_format.format
+    if values.dtype.kind == "M":
+        unit = "D" if len(values) and (values == values.astype("datetime64[D]")).all() else "s"
+        return lambda value: str(np.datetime_as_string(value, unit=unit)).replace("T", " ")
+    return str
+
+
+def _frame(names: List[str], arrays: List[np.ndarray], formats: List, rows, columns) -> "pd.DataFrame":
+    """The selected cells as the view shows them (formatted text)."""
+    return pd.DataFrame({names[c]: [formats[c](value) for value in arrays[c][rows]] for c in columns})
+
+
+# ================= MODEL =================
+
+class ArrayTableModel(QAbstractTableModel):
+    """
+    Read-only table over one numpy array per column.
+    Cells are formatted only when the view asks for them (visible rows);
+    sorting permutes a row index and never touches the arrays.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names: List[str] = []
+        self._arrays: List[np.ndarray] = []
+        self._formats: List = []
+        self._rows = 0
+        self._order: Optional[np.ndarray] = None  # None = natural order
+        self._sort = (-1, Qt.AscendingOrder)
+
+    def set_columns(self, columns: Dict[str, object], float_format: str = "{:.2f}", formats: Dict[str, str] = None):
+        """columns: name -> array, Series or Index of equal length; formats override float_format per column."""
+        formats = formats or {}
+
+        self.beginResetModel()
+        self._names = list(columns)
+        self._arrays = [_as_array(values) for values in columns.values()]
+        self._formats = [
+            _formatter(values, formats.get(name, float_format)) for name, values in zip(self._names, self._arrays)
+        ]
+        self._rows = len(self._arrays[0]) if self._arrays else 0
+        self._order = None
+        self._sort = (-1, Qt.AscendingOrder)
+        self.endResetModel()
+
+    def append_row(self, row: Dict[str, object]):
+        """For short tables that grow (run history); the current sort is kept."""
+        self.beginInsertRows(QModelIndex(), self._rows, self._rows)
+        self._arrays = [np.append(values, [row[name]]) for name, values in zip(self._names, self._arrays)]
+        self._rows += 1
+        if self._order is not None:
+            self._order = np.append(self._order, self._rows - 1)
+        self.endInsertRows()
+
+        if self._sort[0] >= 0:
+            self.sort(*self._sort)
+
+    def source_rows(self, first: int, stop: int):
+        """Array positions of view rows first..stop-1 (a slice while unsorted)."""
+        if self._order is None:
+            return slice(first, stop)
+        return self._order[first:stop]
+
+    def snapshot(self):
+        """
+        Names, arrays, cell formatters and row order; arrays are replaced,
+        never modified, so this is safe to hand to a thread.
+        """
+        return list(self._names), list(self._arrays), list(self._formats), self.source_rows(0, self._rows)
+
+    # ================= QAbstractTableModel =================
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        column = index.column()
+        if role == Qt.DisplayRole:
+            row = index.row() if self._order is None else int(self._order[index.row()])
+            return self._formats[column](self._arrays[column][row])
+        if role == Qt.TextAlignmentRole and self._arrays[column].dtype.kind in "iuf":
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._names[section] if section < len(self._names) else None
+        return str(section + 1)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        if 0 <= column < len(self._arrays):
+            index = np.argsort(self._arrays[column], kind="stable")
+            self._order = index[::-1] if order == Qt.DescendingOrder else index
+        else:
+            self._order = None
+        self._sort = (column, order)
+        self.layoutChanged.emit()
+
+
+# ================= WIDGET =================
+
+class DataTable(QWidget):
+    """
+    Virtualized table with row count, Copy and Export CSV.
+    - Only visible rows are formatted, so millions of rows load instantly
+    - Click a header to sort; Copy (or Ctrl+C) puts the selection on the
+      clipboard as tab-separated text; Export writes the table as shown
+      (sorted, with the cell formats). Both format on a background thread
+    """
+
+    copy_ready = Signal(str)
+    status_message = Signal(str)  # from the copy and export threads
+
+    def __init__(self, title: str = ""):
+        super().__init__()
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        toolbar = QHBoxLayout()
+        self.title_label = QLabel(title)
+        self.title_label.setStyleSheet("font-weight: bold;")
+        self.status_label = QLabel("")
+        self.copy_btn = QPushButton("Copy")
+        self.copy_btn.clicked.connect(self.copy_selection)
+        self.export_btn = QPushButton("Export CSV")
+        self.export_btn.clicked.connect(lambda: self.export_csv())
+
+        toolbar.addWidget(self.title_label)
+        toolbar.addStretch(1)
+        toolbar.addWidget(self.status_label)
+        toolbar.addWidget(self.copy_btn)
+        toolbar.addWidget(self.export_btn)
+        layout.addLayout(toolbar)
+
+        self.model = ArrayTableModel(self)
+        self.view = QTableView()
+        self.view.setModel(self.model)
+        self.view.setSortingEnabled(True)
+        self.view.setAlternatingRowColors(True)
+        self.view.horizontalHeader().setStretchLastSection(True)
+        # fixed row heights: nothing is measured per row
+        self.view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.view.verticalHeader().setDefaultSectionSize(22)
+        self.view.verticalHeader().hide()
+        layout.addWidget(self.view)
+
+        QShortcut(QKeySequence.Copy, self.view, activated=self.copy_selection)
+        self.copy_ready.connect(self._set_clipboard)
+        self.status_message.connect(self.status_label.setText)
+
+    # ================= PUBLIC METHODS =================
+
+    def set_columns(self, columns: Dict[str, object], float_format: str = "{:.2f}", formats: Dict[str, str] = None):
+        self.model.set_columns(columns, float_format, formats)
+        self.view.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self._show_row_count()
+
+    def append_row(self, row: Dict[str, object]):
+        self.model.append_row(row)
+        self._show_row_count()
+
+    def copy_selection(self):
+        names, arrays, formats, _ = self.model.snapshot()
+        ranges = [
+            (self.model.source_rows(selected.top(), selected.bottom() + 1), range(selected.left(), selected.right() + 1))
+            for selected in self.view.selectionModel().selection()
+        ]
+        if not ranges:
+            return
+
+        self.status_label.setText("Copying...")
+        threading.Thread(
+            target=self._format_selection, args=(names, arrays, formats, ranges), name="clue-copy", daemon=True
+        ).start()
+
+    def export_csv(self, path: str = ""):
+        if not path:
+            path, _ = QFileDialog.getSaveFileName(self, "Export CSV", "", "CSV Files (*.csv)")
+            if not path:
+                return
+
+        names, arrays, formats, rows = self.model.snapshot()
+        self.status_label.setText("Exporting...")
+        threading.Thread(
+            target=self._write_csv, args=(names, arrays, formats, rows, path), name="clue-export", daemon=True
+        ).start()
+
+    # ================= HELPERS =================
+
+    def _format_selection(self, names, arrays, formats, ranges):
+        try:
+            text = "".join(
+                _frame(names, arrays, formats, rows, columns).to_csv(sep="\t", index=False, header=False)
+                for rows, columns in ranges
+            )
+        except Exception as exc:
+            self.status_message.emit(f"Copy failed: {exc}")
+            return
+        self.copy_ready.emit(text)
+
+    def _set_clipboard(self, text: str):
+        QGuiApplication.clipboard().setText(text)
+        self._show_row_count()
+
+    def _write_csv(self, names, arrays, formats, rows, path: str):
+        try:
+            _frame(names, arrays, formats, rows, range(len(names))).to_csv(path, index=False)
+            self.status_message.emit(f"Exported to {path}")
+        except Exception as exc:
+            self.status_message.emit(f"Export failed: {exc}")
+
+    def _show_row_count(self):
+        self.status_label.setText(f"{self.model.rowCount():,} rows")
@@ -1,12 +1,214 @@
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-
-
-class MatplotlibCanvas(FigureCanvas):
-    def __init__(self):
-        self.figure = Figure()
-        super().__init__(self.figure)
-
-    def draw_figure(self, fig):
-        self.figure = fig
-        self.draw_idle()
+import numpy as np
+from matplotlib import dates as mdates
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.patches import Patch
+
+from visualization.downsampling import downsample_for_axes
+from visualization.forecast_plot import fan_bands, forecast_index
+from visualization.lod import attach_lod
+
+
+class MatplotlibCanvas(FigureCanvas):
+    """
+    Qt canvas for CLUE figures.
+    - draw_figure(): show a ready-made figure
+    - update_forecast(): long-lived forecast axes whose artists are updated
+      in place with set_data and redrawn by blitting
+    Lines marked with an LOD pyramid (visualization.lod.attach_lod) are
+    re-sampled whenever their x-limits change; the mouse wheel zooms and
+    left-drag pans those axes.
+    """
+
+    ZOOM_STEP = 1.25
+
+    def __init__(self):
+        self.figure = Figure()
+        super().__init__(self.figure)
+        self._own_figure = self.figure
+
+        self._lod_lines = []
+        self._pan = None
+
+        self._artists = None
+        self._background = None
+        self.mpl_connect("draw_event", self._on_draw)
+
+    def draw_figure(self, fig):
+        self.figure = fig
+        fig.set_canvas(self)
+        self._hook_lod(fig)
+        self.draw_idle()
+
+    # ================= PERSISTENT FORECAST =================
+
+    def update_forecast(self, history, forecast, conf_int=None, fan=None):
+        """Updates the forecast view in place; blits unless the axis limits moved."""
+        if self.figure is not self._own_figure:
+            self.figure = self._own_figure
+            self._own_figure.set_canvas(self)
+        if self._artists is None:
+            self._build_forecast_axes()
+
+        ax = self._artists["ax"]
+        old_limits = (ax.get_xlim(), ax.get_ylim())
+
+        shown = downsample_for_axes(history, ax)
+        self._artists["history"].set_data(mdates.date2num(shown.index), shown.to_numpy(dtype=float))
+        attach_lod(self._artists["history"], history)
+
+        future = mdates.date2num(forecast_index(history.index, len(forecast)))
+        values = np.asarray(forecast, dtype=float)
+        self._artists["forecast"].set_data(future, values)
+
+        if fan is not None:
+            bands = [(fan[lo].to_numpy(), fan[hi].to_numpy(), alpha) for lo, hi, alpha, _ in fan_bands(fan)]
+        elif conf_int is not None:
+            bands = [(conf_int["Lower CI"].to_numpy(), conf_int["Upper CI"].to_numpy(), 0.3)]
+        else:
+            bands = []
+        self._set_bands(future, bands)
+
+        self._hook_lod(self.figure)
+
+        ax.relim()
+        self._include_collections(ax)
+        ax.autoscale_view()
+
+        if self._background is None or (ax.get_xlim(), ax.get_ylim()) != old_limits:
+            self.draw_idle()  # ticks changed: full redraw, background recaptured in _on_draw
+        else:
+            self._blit()
+
+    def _build_forecast_axes(self):
+        ax = self._own_figure.add_subplot(1, 1, 1)
+        ax.xaxis_date()
+
+        history_line, = ax.plot([], [], label="History", animated=True)
+        forecast_line, = ax.plot([], [], label="Forecast", animated=True)
+
+        ax.set_title("Forecast with Confidence Interval")
+        ax.set_xlabel("Date")
+        ax.set_ylabel("Price")
+        ax.grid(True)
+        ax.legend(handles=[history_line, forecast_line, Patch(color="tab:orange", alpha=0.3, label="Interval")])
+
+        self._artists = {"ax": ax, "history": history_line, "forecast": forecast_line, "bands": []}
+
+    def _set_bands(self, x, bands):
+        """Reuses a pool of fill artists; extra ones are hidden, not destroyed."""
+        ax = self._artists["ax"]
+        pool = self._artists["bands"]
+        while len(pool) < len(bands):
+            poly = PolyCollection([], color="tab:orange", linewidth=0, animated=True)
+            ax.add_collection(poly, autolim=False)
+            pool.append(poly)
+
+        for poly, (lower, upper, alpha) in zip(pool, bands):
+            poly.set_verts([np.column_stack([np.r_[x, x[::-1]], np.r_[lower, upper[::-1]]])])
+            poly.set_alpha(alpha)
+            poly.set_visible(True)
+        for poly in pool[len(bands):]:
+            poly.set_visible(False)
+
+    def _animated_artists(self):
+        a = self._artists
+        return [poly for poly in a["bands"] if poly.get_visible()] + [a["history"], a["forecast"]]
+
+    def _on_draw(self, event):
+        if self._artists is None or self.figure is not self._own_figure:
+            return
+        self._background = self.copy_from_bbox(self._own_figure.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        ax = self._artists["ax"]
+        for artist in self._animated_artists():
+            ax.draw_artist(artist)
+
+    def _blit(self):
+        ax = self._artists["ax"]
+        self.restore_region(self._background)
+        self._draw_animated()
+        self.blit(ax.bbox)
+
+    # ================= LEVEL OF DETAIL =================
+
+    def _hook_lod(self, fig):
+        self._lod_lines = [
+            line
+            for ax in fig.axes
+            for line in ax.get_lines()
+            if hasattr(line, "lod_pyramid")
+        ]
+        if not self._lod_lines:
+            return
+
+        for ax in {line.axes for line in self._lod_lines}:
+            if not getattr(ax, "_lod_hooked", False):
+                ax.callbacks.connect("xlim_changed", self._on_xlim_changed)
+                ax._lod_hooked = True
+
+        # callbacks live on the figure, so they are connected once per figure
+        if not getattr(fig, "_lod_hooked", False):
+            self.mpl_connect("scroll_event", self._on_scroll)
+            self.mpl_connect("button_press_event", self._on_press)
+            self.mpl_connect("motion_notify_event", self._on_motion)
+            self.mpl_connect("button_release_event", self._on_release)
+            fig._lod_hooked = True
+
+    def _lod_axes(self):
+        return {line.axes for line in self._lod_lines}
+
+    def _on_xlim_changed(self, ax):
+        x0, x1 = ax.get_xlim()
+        # autoscale re-emits unchanged limits; don't turn a blit into a full redraw
+        if getattr(ax, "_lod_xlim", None) == (x0, x1):
+            return
+        ax._lod_xlim = (x0, x1)
+        pixels = max(int(ax.bbox.width), 1)
+
+        for line in self._lod_lines:
+            if line.axes is ax:
+                line.set_data(*line.lod_pyramid.view(x0, x1, pixels))
+
+        ax.relim(visible_only=True)
+        self._include_collections(ax, x0, x1)
+        ax.autoscale_view(scalex=False)
+        self.draw_idle()
+
+    @staticmethod
+    def _include_collections(ax, x0=-np.inf, x1=np.inf):
+        """relim() skips fills; add the visible ones overlapping [x0, x1] to the data limits."""
+        for collection in ax.collections:
+            if not collection.get_visible():
+                continue
+            bounds = collection.get_datalim(ax.transData)
+            if np.all(np.isfinite(bounds.get_points())) and bounds.x1 >= x0 and bounds.x0 <= x1:
+                ax.update_datalim(bounds.get_points())
+
+    # ================= ZOOM / PAN =================
+
+    def _on_scroll(self, event):
+        ax = event.inaxes
+        if ax not in self._lod_axes() or event.xdata is None:
+            return
+
+        scale = 1 / self.ZOOM_STEP if event.button == "up" else self.ZOOM_STEP
+        x0, x1 = ax.get_xlim()
+        ax.set_xlim(event.xdata - (event.xdata - x0) * scale, event.xdata + (x1 - event.xdata) * scale)
+
+    def _on_press(self, event):
+        if event.button == 1 and event.inaxes in self._lod_axes():
+            self._pan = (event.inaxes, event.x, event.inaxes.get_xlim())
+
+    def _on_motion(self, event):
+        if self._pan is None:
+            return
+        ax, start_x, (x0, x1) = self._pan
+        shift = (event.x - start_x) * (x1 - x0) / ax.bbox.width
+        ax.set_xlim(x0 - shift, x1 - shift)
+
+    def _on_release(self, event):
+        self._pan = None
@@ -0,0 +1,140 @@
+"""
+Plot Downsampling for CLUE
+Reduces long series to about the pixel width of the target axes before plotting.
+- LTTB (Largest-Triangle-Three-Buckets): shape-preserving line decimation
+- Min/max envelope: keeps every bucket's extremes, so peaks always survive
+Both work on whole bucket matrices with numpy; no per-point Python loops.
+"""
+
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# -------------------- BUCKETING --------------------
+
+def _bucket_matrix(start: int, stop: int, n_buckets: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Padded (n_buckets x max_size) index matrix over [start, stop) and its validity mask."""
+    edges = np.linspace(start, stop, n_buckets + 1).astype(np.int64)
+    sizes = np.diff(edges)
+    offsets = np.arange(max(int(sizes.max()), 1))
+    indices = edges[:-1, None] + offsets[None, :]
+    valid = offsets[None, :] < sizes[:, None]
+    return np.where(valid, indices, edges[:-1, None]), valid
+
+
+def _as_float(x) -> np.ndarray:
+    if isinstance(x, (pd.DatetimeIndex, pd.Series)) and np.issubdtype(np.asarray(x).dtype, np.datetime64):
+        return np.asarray(x, dtype="datetime64[ns]").astype(np.int64).astype(float)
+    return np.asarray(x, dtype=float)
+
+
+# -------------------- ALGORITHMS --------------------
+
+def lttb_indices(x, y, n_out: int, max_passes: int = 8) -> np.ndarray:
+    """
+    Indices kept by LTTB (exactly the sequential result). Classic LTTB anchors
+    each bucket on the point picked in the previous bucket, which is sequential;
+    here all buckets are solved at once, first anchored on the previous bucket's
+    mean, then only the buckets whose anchor moved are re-solved. Smooth series
+    settle in a few passes; noisy ones can keep moving for up to n_buckets passes,
+    so after max_passes the unsettled tail is finished bucket by bucket.
+    """
+    x = _as_float(x)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    n_buckets = n_out - 2
+    indices, valid = _bucket_matrix(1, n - 1, n_buckets)
+    bx, by = x[indices], y[indices]
+
+    counts = valid.sum(axis=1)
+    mean_x = np.where(valid, bx, 0).sum(axis=1) / counts
+    mean_y = np.where(valid, by, 0).sum(axis=1) / counts
+
+    # next-bucket anchor: mean of the following bucket (the last point for the final bucket)
+    next_x = np.append(mean_x[1:], x[-1])
+    next_y = np.append(mean_y[1:], y[-1])
+
+    # previous-bucket anchor: first point, then bucket means for the first pass
+    prev_x = np.insert(mean_x[:-1], 0, x[0])
+    prev_y = np.insert(mean_y[:-1], 0, y[0])
+
+    picked = np.full(n_buckets, -1)
+    rows = np.arange(n_buckets)
+    for _ in range(max_passes):
+        px, py = prev_x[rows, None], prev_y[rows, None]
+        area = np.abs(
+            (px - next_x[rows, None]) * (by[rows] - py)
+            - (px - bx[rows]) * (next_y[rows, None] - py)
+        )
+        picked[rows] = indices[rows, np.argmax(np.where(valid[rows], area, -1.0), axis=1)]
+
+        # re-solve only buckets whose previous pick (their anchor) just changed
+        anchors = np.insert(picked[:-1], 0, 0)
+        moved = np.flatnonzero((x[anchors] != prev_x) | (y[anchors] != prev_y))
+        if moved.size == 0:
+            break
+        prev_x, prev_y = x[anchors], y[anchors]
+        rows = moved
+    else:
+        # buckets before the first moved one are final; sweep the rest in order
+        for row in range(moved[0], n_buckets):
+            anchor = picked[row - 1] if row else 0
+            cells = indices[row, valid[row]]
+            area = np.abs(
+                (x[anchor] - next_x[row]) * (y[cells] - y[anchor])
+                - (x[anchor] - x[cells]) * (next_y[row] - y[anchor])
+            )
+            picked[row] = cells[np.argmax(area)]
+
+    return np.concatenate([[0], picked, [n - 1]])
+
+
+def minmax_indices(y, n_out: int) -> np.ndarray:
+    """Indices of each bucket's min and max (n_out / 2 buckets), in time order."""
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_out >= n or n_out < 2:
+        return np.arange(n)
+
+    indices, valid = _bucket_matrix(0, n, n_out // 2)
+    values = y[indices]
+    rows = np.arange(len(indices))
+
+    lows = indices[rows, np.argmin(np.where(valid, values, np.inf), axis=1)]
+    highs = indices[rows, np.argmax(np.where(valid, values, -np.inf), axis=1)]
+
+    return np.unique(np.concatenate([lows, highs, [0, n - 1]]))
+
+
+def decimate_series(series: pd.Series, n_out: int, method: str = "lttb") -> pd.Series:
+    """Subset of `series` (NaNs dropped) with at most about n_out points."""
+    series = series.dropna()
+    if len(series) <= n_out:
+        return series
+
+    if method == "lttb":
+        kept = lttb_indices(series.index, series.to_numpy(dtype=float), n_out)
+    elif method == "minmax":
+        kept = minmax_indices(series.to_numpy(dtype=float), n_out)
+    else:
+        raise ValueError(f"Unsupported downsampling method: {method}")
+
+    return series.iloc[kept]
+
+
+# -------------------- GUI FRIENDLY FUNCTIONS --------------------
+
+def axes_pixel_width(ax) -> int:
+    """Width of the axes in device pixels at the figure's dpi."""
+    fig = ax.get_figure()
+    return max(int(ax.get_position().width * fig.get_figwidth() * fig.dpi), 1)
+
+
+def downsample_for_axes(series: pd.Series, ax, method: str = "lttb", points_per_pixel: float = 2.0) -> pd.Series:
+    """Decimates a series to roughly the pixel width of the axes it will be drawn on."""
+    return decimate_series(series, int(axes_pixel_width(ax) * points_per_pixel), method)
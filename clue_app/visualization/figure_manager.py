@@ -0,0 +1,119 @@
+"""
+Figure Lifecycle Manager for CLUE
+Creates figures off pyplot's global state and owns them explicitly.
+- One figure per owner (page or report slot), reused across runs
+- release() frees a figure deterministically; nothing is left in pyplot
+- Tracks live figures and an estimated memory high-water mark
+"""
+
+import threading
+from typing import Dict, Tuple
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from core.logger import get_logger
+
+
+logger = get_logger("figures")
+
+
+def estimate_figure_bytes(fig: Figure) -> int:
+    """RGBA render buffer plus the data arrays held by the figure's artists."""
+    width, height = fig.get_size_inches() * fig.dpi
+    total = int(width * height * 4)
+
+    for ax in fig.axes:
+        for line in ax.get_lines():
+            total += np.asarray(line.get_xdata(orig=False)).nbytes + np.asarray(line.get_ydata(orig=False)).nbytes
+        for collection in ax.collections:
+            total += sum(np.asarray(path.vertices).nbytes for path in collection.get_paths())
+    return total
+
+
+class FigureManager:
+    def __init__(self):
+        self._figures: Dict[str, Figure] = {}
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self.high_water_bytes = 0
+
+    # -------------------- PUBLIC METHODS --------------------
+
+    def figure(self, owner: str, figsize: Tuple[float, float], **kwargs) -> Figure:
+        """
+        The owner's figure, cleared for redrawing. A figure with the same
+        size and layout is reused; otherwise the old one is released first.
+        """
+        with self._lock:
+            fig = self._figures.get(owner)
+            layout = kwargs.get("layout")
+
+            if fig is not None and tuple(fig.get_size_inches()) == tuple(figsize) and getattr(fig, "_clue_layout", None) == layout:
+                fig.clear()
+                self.reused += 1
+            else:
+                if fig is not None:
+                    self._free(owner)
+                fig = Figure(figsize=figsize, **kwargs)
+                FigureCanvasAgg(fig)  # standalone canvas so savefig works without pyplot
+                fig._clue_layout = layout
+                self._figures[owner] = fig
+                self.created += 1
+
+        return fig
+
+    def subplots(self, owner: str, nrows: int = 1, ncols: int = 1, figsize: Tuple[float, float] = (10, 5), **kwargs):
+        """Drop-in for plt.subplots that returns the owner's managed figure."""
+        fig = self.figure(owner, figsize, **kwargs)
+        axes = fig.subplots(nrows, ncols)
+        return fig, axes
+
+    def release(self, owner: str):
+        with self._lock:
+            if owner in self._figures:
+                self._free(owner)
+
+    def release_all(self):
+        with self._lock:
+            for owner in list(self._figures):
+                self._free(owner)
+
+    def track(self):
+        """Updates the high-water mark from the figures currently alive; returns live bytes."""
+        with self._lock:
+            live = sum(estimate_figure_bytes(fig) for fig in self._figures.values())
+            if live > self.high_water_bytes:
+                self.high_water_bytes = live
+                logger.info("Figure memory high-water mark: %.1f MB across %d figures", live / 1e6, len(self._figures))
+        return live
+
+    def stats(self) -> Dict[str, int]:
+        live = self.track()
+        return {
+            "live_figures": len(self._figures),
+            "live_bytes": live,
+            "high_water_bytes": self.high_water_bytes,
+            "created": self.created,
+            "reused": self.reused,
+            "released": self.released,
+        }
+
+    # -------------------- HELPERS --------------------
+
+    def _free(self, owner: str):
+        fig = self._figures.pop(owner)
+        fig.clear()
+        self.released += 1
+
+
+# -------------------- GUI FRIENDLY FUNCTION --------------------
+
+figure_manager = FigureManager()
+
+
+def figure_memory_stats() -> Dict[str, int]:
+    return figure_manager.stats()
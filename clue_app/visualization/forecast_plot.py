@@ -1,42 +1,76 @@
-"""
-Forecast Visualization for CLUE
-Compatible with all pandas versions
-"""
-
-import matplotlib.pyplot as plt
-import pandas as pd
-
-
-def plot_forecast(df: pd.DataFrame, forecast: pd.Series, conf_int: pd.DataFrame):
-    fig, ax = plt.subplots(figsize=(10, 5))
-
-    # Plot historical prices
-    ax.plot(df.index, df["Close"], label="History")
-
-    # Create future index safely (no 'closed' argument)
-    future_index = pd.date_range(
-        start=df.index[-1] + pd.Timedelta(days=1),
-        periods=len(forecast),
-        freq="D"
-    )
-
-    # Plot forecast
-    ax.plot(future_index, forecast.values, label="Forecast")
-
-    # Confidence interval shading
-    if conf_int is not None:
-        ax.fill_between(
-            future_index,
-            conf_int["Lower CI"].values,
-            conf_int["Upper CI"].values,
-            alpha=0.3,
-            label="Confidence Interval"
-        )
-
-    ax.set_title("Forecast with Confidence Interval")
-    ax.set_xlabel("Date")
-    ax.set_ylabel("Price")
-    ax.legend()
-    ax.grid(True)
-
-    return fig
+"""
+Forecast Visualization for CLUE
+Compatible with all pandas versions
+"""
+
+import pandas as pd
+
+from visualization.downsampling import downsample_for_axes
+from visualization.lod import attach_lod
+from visualization.figure_manager import figure_manager
+
+
+def forecast_index(history_index: pd.DatetimeIndex, periods: int) -> pd.DatetimeIndex:
+    """Daily future dates after the last observation (no 'closed' argument)."""
+    return pd.date_range(
+        start=history_index[-1] + pd.Timedelta(days=1),
+        periods=periods,
+        freq="D"
+    )
+
+
+def fan_bands(fan: pd.DataFrame):
+    """(lower quantile, upper quantile, alpha, label) per nested band, outermost first."""
+    bands = []
+    quantiles = sorted(q for q in fan.columns if q < 0.5)
+    for i, q in enumerate(quantiles):
+        upper_q = min(fan.columns, key=lambda c: abs(c - (1 - q)))
+        bands.append((q, upper_q, 0.12 + 0.12 * i, f"{int(round((upper_q - q) * 100))}% Band"))
+    return bands
+
+
+def plot_forecast(df: pd.DataFrame, forecast: pd.Series, conf_int: pd.DataFrame, fan: pd.DataFrame = None, owner: str = "forecast"):
+    fig, ax = figure_manager.subplots(owner, figsize=(10, 5))
+
+    # Plot historical prices (decimated to the axes' pixel width)
+    # and backed by an LOD pyramid for interactive zoom on the canvas
+    history = downsample_for_axes(df["Close"], ax)
+    history_line, = ax.plot(history.index, history.values, label="History")
+    attach_lod(history_line, df["Close"])
+
+    future_index = forecast_index(df.index, len(forecast))
+
+    # Plot forecast
+    ax.plot(future_index, forecast.values, label="Forecast")
+
+    # Fan chart: nested quantile bands from simulated paths, outermost first
+    if fan is not None:
+        for lower_q, upper_q, alpha, label in fan_bands(fan):
+            ax.fill_between(
+                future_index,
+                fan[lower_q].values,
+                fan[upper_q].values,
+                color="tab:orange",
+                alpha=alpha,
+                linewidth=0,
+                label=label,
+            )
+
+    # Confidence interval shading
+    elif conf_int is not None:
+        ax.fill_between(
+            future_index,
+            conf_int["Lower CI"].values,
+            conf_int["Upper CI"].values,
+            alpha=0.3,
+            label="Confidence Interval"
+        )
+
+    ax.set_title("Forecast with Confidence Interval")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Price")
+    ax.legend()
+    ax.grid(True)
+
+    figure_manager.track()
+    return fig
@@ -0,0 +1,98 @@
+"""
+Level-of-Detail Pyramid for CLUE
+Multi-resolution min/max/mean aggregates for interactive zoom and pan.
+- Level k aggregates 2**k raw points; all levels are plain numpy arrays
+- view() picks the coarsest level that still fills the visible pixel width
+- Pyramids are cached per series fingerprint, so each loaded series builds one once
+"""
+
+import threading
+from collections import OrderedDict
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+from matplotlib import dates as mdates
+
+from core.utils import series_fingerprint
+
+
+_CACHE_SIZE = 8
+_pyramid_cache: "OrderedDict[str, LODPyramid]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+class LODPyramid:
+    def __init__(self, x: np.ndarray, y: np.ndarray):
+        """x must be increasing, in axis units (matplotlib date numbers for time series)."""
+        self.levels: List[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = [(x, y, y, y)]
+
+        # power-of-two aggregation: each level pairs up the buckets of the one below
+        while len(self.levels[-1][0]) > 2:
+            bx, lo, hi, mean = self.levels[-1]
+            even = len(bx) - len(bx) % 2
+
+            next_level = (
+                bx[:even:2],
+                np.fmin(lo[:even:2], lo[1:even:2]),
+                np.fmax(hi[:even:2], hi[1:even:2]),
+                (mean[:even:2] + mean[1:even:2]) / 2,
+            )
+            if even < len(bx):  # odd leftover becomes its own bucket
+                next_level = tuple(np.append(arr, src[-1]) for arr, src in zip(next_level, (bx, lo, hi, mean)))
+            self.levels.append(next_level)
+
+    @classmethod
+    def from_series(cls, series: pd.Series) -> "LODPyramid":
+        series = series.dropna()
+        if isinstance(series.index, pd.DatetimeIndex):
+            x = mdates.date2num(series.index.tz_localize(None).to_numpy() if series.index.tz else series.index.to_numpy())
+        else:
+            x = series.index.to_numpy(dtype=float)
+        return cls(np.asarray(x, dtype=float), series.to_numpy(dtype=float))
+
+    def level_for(self, x0: float, x1: float, pixels: int) -> int:
+        """Coarsest level whose visible buckets (drawn as min+max pairs) still cover the pixels."""
+        raw_x = self.levels[0][0]
+        visible = np.searchsorted(raw_x, x1, side="right") - np.searchsorted(raw_x, x0, side="left")
+        if visible <= 2 * pixels:
+            return 0
+        return int(min(np.floor(np.log2(visible / pixels)), len(self.levels) - 1))
+
+    def view(self, x0: float, x1: float, pixels: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Line data for the visible range: raw points at level 0, else a min/max envelope."""
+        level = self.level_for(x0, x1, pixels)
+        bx, lo, hi, _ = self.levels[level]
+
+        # one bucket of margin on each side so the line runs off the edges
+        start = max(np.searchsorted(bx, x0, side="left") - 1, 0)
+        stop = min(np.searchsorted(bx, x1, side="right") + 1, len(bx))
+        bx, lo, hi = bx[start:stop], lo[start:stop], hi[start:stop]
+
+        if level == 0:
+            return bx, lo
+        return np.repeat(bx, 2), np.column_stack([lo, hi]).ravel()
+
+
+# -------------------- GUI FRIENDLY FUNCTIONS --------------------
+
+def get_pyramid(series: pd.Series) -> LODPyramid:
+    key = series_fingerprint(series)
+    with _cache_lock:
+        if key in _pyramid_cache:
+            _pyramid_cache.move_to_end(key)
+            return _pyramid_cache[key]
+
+    pyramid = LODPyramid.from_series(series)
+
+    with _cache_lock:
+        _pyramid_cache[key] = pyramid
+        if len(_pyramid_cache) > _CACHE_SIZE:
+            _pyramid_cache.popitem(last=False)
+    return pyramid
+
+
+def attach_lod(line, series: pd.Series):
+    """Marks a plotted line so MatplotlibCanvas swaps pyramid levels on zoom/pan."""
+    line.lod_pyramid = get_pyramid(series)
+    return line
@@ -0,0 +1,171 @@
+"""
+Chart Rendering Service for CLUE
+Builds and rasterizes figures with the Agg backend away from the GUI thread.
+- submit(slot, builder, ...) renders on a background thread and hands back an RGBA bitmap
+- One live request per slot: a newer submit supersedes the older one (queued
+  requests never start, running ones are dropped at the next checkpoint)
+- Figures are double-buffered per slot, so the one on screen is never rebuilt
+"""
+
+import io
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+from matplotlib import image as mpimg
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from core.logger import get_logger
+
+
+logger = get_logger("render")
+
+
+class RenderCancelled(Exception):
+    """Raised inside a render job once a newer request for its slot exists."""
+
+
+class RenderService:
+    def __init__(self):
+        # matplotlib is not thread-safe and figures are shared through the
+        # figure manager, so all rendering is serialized on one thread
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="clue-render")
+        self._lock = threading.Lock()
+        self._generation: Dict[str, int] = {}
+        self._pending: Dict[str, Future] = {}
+        self._shown: Dict[str, int] = {}
+
+    # -------------------- PUBLIC METHODS --------------------
+
+    def submit(
+        self,
+        slot: str,
+        builder: Callable,
+        *args,
+        callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        **kwargs,
+    ) -> int:
+        """
+        Queues builder(*args, owner=..., **kwargs) for `slot` and returns the
+        request's generation. The builder must draw into the figure manager's
+        figure for the owner it is given. `callback` receives the result dict
+        on the render thread, and only if the request was not superseded.
+        """
+        with self._lock:
+            generation = self._generation.get(slot, 0) + 1
+            self._generation[slot] = generation
+
+            previous = self._pending.pop(slot, None)
+            future = self._pool.submit(self._render, slot, generation, builder, args, kwargs)
+            self._pending[slot] = future
+
+        # cancel() runs done-callbacks synchronously, so never under the lock
+        if previous is not None and previous.cancel():
+            logger.debug("Coalesced queued render for %s", slot)
+
+        future.add_done_callback(lambda done: self._finish(slot, generation, done, callback))
+        return generation
+
+    def cancel(self, slot: str):
+        """Supersedes whatever is queued or running for the slot without replacing it."""
+        with self._lock:
+            self._generation[slot] = self._generation.get(slot, 0) + 1
+            previous = self._pending.pop(slot, None)
+        if previous is not None:
+            previous.cancel()
+
+    def is_current(self, result: Dict[str, Any]) -> bool:
+        with self._lock:
+            return self._generation.get(result["slot"]) == result["generation"]
+
+    def accept(self, result: Dict[str, Any]) -> bool:
+        """
+        Called by the GUI when it displays a result. Returns False for results
+        that were superseded in the meantime; accepted figures are protected
+        from being rebuilt until the next result for the slot is accepted.
+        Error results carry no figure, so the one on screen stays protected.
+        """
+        with self._lock:
+            if self._generation.get(result["slot"]) != result["generation"]:
+                return False
+            if "error" not in result:
+                self._shown[result["slot"]] = result["buffer"]
+            return True
+
+    def shutdown(self):
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for future in pending:
+            future.cancel()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    # -------------------- RENDER JOB --------------------
+
+    def _render(self, slot: str, generation: int, builder: Callable, args, kwargs) -> Dict[str, Any]:
+        self._checkpoint(slot, generation)
+
+        with self._lock:
+            buffer = 1 - self._shown.get(slot, 1)  # draw into the figure that is not on screen
+
+        fig = builder(*args, owner=f"{slot}#{buffer}", **kwargs)
+        self._checkpoint(slot, generation)
+
+        # a figure shown interactively earlier may still point at a Qt canvas
+        canvas = FigureCanvasAgg(fig)
+        canvas.draw()
+        rgba = np.asarray(canvas.buffer_rgba()).copy()
+        self._checkpoint(slot, generation)
+
+        return {
+            "slot": slot,
+            "generation": generation,
+            "buffer": buffer,
+            "figure": fig,
+            "image": rgba,
+            "width": rgba.shape[1],
+            "height": rgba.shape[0],
+        }
+
+    def _checkpoint(self, slot: str, generation: int):
+        with self._lock:
+            if self._generation.get(slot) != generation:
+                raise RenderCancelled(slot)
+
+    def _finish(self, slot: str, generation: int, future: Future, callback):
+        with self._lock:
+            if self._pending.get(slot) is future:
+                del self._pending[slot]
+
+        if future.cancelled():
+            return
+
+        error = future.exception()
+        if isinstance(error, RenderCancelled):
+            logger.debug("Dropped superseded render for %s", slot)
+            return
+        if error is not None:
+            logger.error("Rendering %s failed: %s", slot, error)
+            result = {"slot": slot, "generation": generation, "error": error}
+        else:
+            result = future.result()
+
+        if callback is not None and self.is_current(result):
+            callback(result)
+
+
+def to_png(result: Dict[str, Any]) -> bytes:
+    """PNG encoding of a render result's bitmap (for export or caching)."""
+    buffer = io.BytesIO()
+    mpimg.imsave(buffer, result["image"], format="png")
+    return buffer.getvalue()
+
+
+# -------------------- GUI FRIENDLY FUNCTIONS --------------------
+
+render_service = RenderService()
+
+
+def render_chart(slot: str, builder: Callable, *args, callback=None, **kwargs) -> int:
+    return render_service.submit(slot, builder, *args, callback=callback, **kwargs)